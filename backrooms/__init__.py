@@ -29,13 +29,18 @@ Backrooms is designed to be:
 
 
 # backrooms
+from . import async_portal
 from . import backrooms
 from . import backrooms_builtins
 from . import backrooms_error
+from . import batch
+from . import blocks
 from . import conscious
+from . import image
 from . import portal
 from . import rooms
 from . import rules
+from . import sinks
 from . import stack
 from . import translator
 from . import whisper
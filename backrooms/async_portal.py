@@ -0,0 +1,160 @@
+"""
+Copyright 2021 Charles McMarrow
+
+This script drives a Portal from an asyncio event loop.
+"""
+
+# built-in
+import asyncio
+from typing import AsyncGenerator, Optional
+
+# backrooms
+from . import backrooms_error
+from .portal import Feeder, Portal
+from .sinks import CallbackSink
+
+# Rules ran each time the event loop gives a program a turn
+RULE_BUDGET = 1000
+
+# marks the end of the output queue
+_DONE = object()
+
+
+class AsyncPortalError(backrooms_error.BackroomsError):
+    @classmethod
+    def missing_feeder(cls):
+        """
+        info: Used to indicate a Portal can't be given input without blocking.
+        :return: AsyncPortalError
+        """
+        return cls("Portal needs a Feeder to be ran from an event loop!")
+
+    @classmethod
+    def bad_rule_budget(cls, rule_budget: int):
+        """
+        info: Used to indicate a rule budget is not positive.
+        :param rule_budget: int
+        :return: AsyncPortalError
+        """
+        return cls(f"Rule budget must be more then 0 not {rule_budget}!")
+
+    @classmethod
+    def program_done(cls):
+        """
+        info: Used to indicate input was sent to a program that is done running.
+        :return: AsyncPortalError
+        """
+        return cls("Program is done running and can't take input!")
+
+
+class AsyncPortal:
+    def __init__(self,
+                 portal: Portal,
+                 rule_budget: int = RULE_BUDGET):
+        """
+        info: Runs a Portal from an event loop.
+            Runs rule_budget Rules then gives the event loop back so many programs can share it.
+            portal should be made with feeder set.
+            Adds a Sink to portal that puts each output on the output queue.
+        :param portal: Portal
+        :param rule_budget: int
+        :exception AsyncPortalError
+            raises AsyncPortalError if portal has no Feeder.
+            raises AsyncPortalError if rule_budget is less then 1.
+        """
+        if portal.get_feeder() is None:
+            raise AsyncPortalError.missing_feeder()
+        if rule_budget < 1:
+            raise AsyncPortalError.bad_rule_budget(rule_budget)
+        self._portal: Portal = portal
+        self._feeder: Feeder = portal.get_feeder()
+        self._rule_budget: int = rule_budget
+        # made on first use so they belong to the running event loop
+        self._outputs: Optional[asyncio.Queue] = None
+        self._input_set: Optional[asyncio.Event] = None
+        self._input_wanted: Optional[asyncio.Event] = None
+        # set once run stops, even if the program stopped with an error
+        self._finished: bool = False
+        portal.add_sink(CallbackSink(self._write_output))
+
+    def _setup(self) -> None:
+        """
+        info: Makes the queue and events on the running event loop.
+        :return: None
+        """
+        if self._outputs is None:
+            self._outputs = asyncio.Queue()
+            self._input_set = asyncio.Event()
+            self._input_wanted = asyncio.Event()
+
+    def _write_output(self, output: object) -> None:
+        """
+        info: Puts what the program wrote out onto the output queue.
+            Only called while run is running so the queue is made.
+        :param output: object
+        :return: None
+        """
+        self._outputs.put_nowait(output)
+
+    async def run(self) -> None:
+        """
+        info: Runs the program till it is done.
+            Waits without running Rules while every conscious is waiting for input.
+        :exception PortalError
+            raises PortalError if the program gets lost.
+        :return: None
+        """
+        self._setup()
+        try:
+            while not self._portal.run_rules(self._rule_budget):
+                if self._feeder.wants_input():
+                    self._input_wanted.set()
+                if self._portal.is_awaiting_input():
+                    await self._input_set.wait()
+                    self._input_set.clear()
+                else:
+                    await asyncio.sleep(0)
+        finally:
+            self._finished = True
+            self._outputs.put_nowait(_DONE)
+            # let senders waiting on input see the program is done
+            self._input_wanted.set()
+
+    async def send_input(self, user_input: str) -> None:
+        """
+        info: Gives input to the program once it asks for input.
+        :param user_input: str
+        :exception AsyncPortalError
+            raises AsyncPortalError if the program is done running or run stopped with an error.
+        :return: None
+        """
+        self._setup()
+        while True:
+            if self._finished or self._portal.is_done():
+                raise AsyncPortalError.program_done()
+            if self._feeder.wants_input():
+                break
+            self._input_wanted.clear()
+            await self._input_wanted.wait()
+        self._feeder.set_input(user_input)
+        self._input_set.set()
+
+    async def outputs(self) -> AsyncGenerator[object, None]:
+        """
+        info: Gives everything the program writes out as it is written.
+            Ends once the program is done running.
+        :return: AsyncGenerator[object, None]
+        """
+        self._setup()
+        while True:
+            output = await self._outputs.get()
+            if output is _DONE:
+                return
+            yield output
+
+    def get_portal(self) -> Portal:
+        """
+        info: Gets the Portal being ran.
+        :return: Portal
+        """
+        return self._portal
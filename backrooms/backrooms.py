@@ -8,6 +8,7 @@ This script holds the API and console interface to backrooms.
 import argparse
 import cProfile
 import pstats
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from pstats import SortKey
 from typing import List, Optional, Tuple, Type, Union
@@ -15,9 +16,12 @@ from typing import List, Optional, Tuple, Type, Union
 # backrooms
 import backrooms as brs
 from . import backrooms_error
+from . import image
 from .backrooms_builtins import get_builtins
 from .portal import Feeder, Portal
+from .rooms import Floor, Rooms, SparseFloor
 from .rules import Rule
+from .sinks import FLUSH_LINE, FLUSH_POLICIES, Sink, StreamSink
 from .translator import FileHandler, Handler, Handlers, StringHandler, load_dir, translator
 from .whisper import enable_whisper, NOTSET
 
@@ -77,6 +81,23 @@ def backrooms() -> None:
                             default=False,
                             action="store_true",
                             help="get version of backrooms")
+        parser.add_argument("--compile-blocks",
+                            default=False,
+                            action="store_true",
+                            help="run straight rules as compiled blocks")
+        parser.add_argument("--image-cache",
+                            default=None,
+                            nargs="?",
+                            const=image.DEFAULT_IMAGE_CACHE,
+                            type=str,
+                            action="store",
+                            help="cache translated programs in a dir, defaults to ~/.backrooms_cache")
+        parser.add_argument("--flush",
+                            default=FLUSH_LINE,
+                            type=str,
+                            choices=FLUSH_POLICIES,
+                            action="store",
+                            help="set when writes to stdio are flushed")
         parser.add_argument("--lost-count",
                             default=0,
                             type=int,
@@ -87,6 +108,16 @@ def backrooms() -> None:
                             type=int,
                             action="store",
                             help="set lost rule count")
+        parser.add_argument("--prefetch-workers",
+                            default=0,
+                            type=int,
+                            action="store",
+                            help="set number of threads reading included files ahead of the translator")
+        parser.add_argument("--quantum",
+                            default=1,
+                            type=int,
+                            action="store",
+                            help="set number of rules a thread runs before the next thread gets a turn")
         parser.add_argument("--profile_range",
                             default=1,
                             type=int,
@@ -99,6 +130,10 @@ def backrooms() -> None:
                             help="set the log level [notset, debug, info, warning, error, critical]")
         args = parser.parse_args()
 
+        sinks = None
+        if args.system_out:
+            sinks = [StreamSink(flush_policy=args.flush)]
+
         if args.author:
             print(brs.AUTHOR)
 
@@ -110,14 +145,19 @@ def backrooms() -> None:
                 with cProfile.Profile(builtins=False) as profiler_translator:
                     for _ in range(args.profile_range):
                         br = backrooms_api(code=args.file,
-                                           sys_output=args.system_out,
+                                           sys_output=False,
                                            lost_count=args.lost_count,
                                            lost_rule_count=args.lost_rule_count,
                                            error_on_space=args.error_on_space,
                                            error_on_no_rule=args.error_on_no_rule,
                                            br_builtins=args.builtins,
                                            core_dump=args.core_dump,
-                                           whisper_level=args.whisper)
+                                           whisper_level=args.whisper,
+                                           compile_blocks=args.compile_blocks,
+                                           image_cache=args.image_cache,
+                                           prefetch_workers=args.prefetch_workers,
+                                           quantum=args.quantum,
+                                           sinks=sinks)
 
                 profiler_run_time = cProfile.Profile(builtins=False)
                 for _ in range(args.profile_range):
@@ -140,14 +180,19 @@ def backrooms() -> None:
                     stats.print_stats()
         else:
             br = backrooms_api(code=args.file,
-                               sys_output=args.system_out,
+                               sys_output=False,
                                lost_count=args.lost_count,
                                lost_rule_count=args.lost_rule_count,
                                error_on_space=args.error_on_space,
                                error_on_no_rule=args.error_on_no_rule,
                                br_builtins=args.builtins,
                                core_dump=args.core_dump,
-                               whisper_level=args.whisper)
+                               whisper_level=args.whisper,
+                               compile_blocks=args.compile_blocks,
+                               image_cache=args.image_cache,
+                               prefetch_workers=args.prefetch_workers,
+                               quantum=args.quantum,
+                               sinks=sinks)
             br()
     except backrooms_error.BackroomsError as e:
         print(f"\nERROR: {e}", flush=True)
@@ -168,7 +213,13 @@ def backrooms_api(code: Union[str, Handler, Handlers],
                   core_dump: bool = False,
                   yields: bool = False,
                   rules: Optional[Union[Tuple[Type[Rule], ...], List[Type[Rule]]]] = None,
-                  whisper_level: str = NOTSET) -> Portal:
+                  whisper_level: str = NOTSET,
+                  floor_type: Type[Floor] = SparseFloor,
+                  compile_blocks: bool = False,
+                  image_cache: Optional[str] = None,
+                  prefetch_workers: int = 0,
+                  quantum: int = 1,
+                  sinks: Optional[Union[Tuple[Sink, ...], List[Sink]]] = None) -> Portal:
     """
     info: An API to backrooms.
     :param code: Union[str, Handler, Handlers]
@@ -189,22 +240,23 @@ def backrooms_api(code: Union[str, Handler, Handlers],
     :param yields: bool
     :param rules: Optional[Union[Tuple[Type[Rule], ...], List[Type[Rule]]]]
     :param whisper_level: str
+    :param floor_type: Type[Floor]
+        Storage backend used for each floor of Rooms.
+    :param compile_blocks: bool
+        Runs runs of straight Rules as compiled Blocks when a conscious would run the whole Block in its turn.
+    :param image_cache: Optional[str]
+        Dir to keep images of translated code in so later runs skip translating.
+        None won't cache.
+    :param prefetch_workers: int
+        Threads reading included files ahead of the translator if code is str. 0 won't prefetch.
+    :param quantum: int
+        Rules a conscious runs before the next conscious gets a turn.
+    :param sinks: Optional[Union[Tuple[Sink, ...], List[Sink]]]
+        Sinks given each output after the ones made for sys_output and catch_output.
     :return: Portal
     """
     try:
-        if isinstance(code, str):
-            main_handler, handlers = load_dir(code)
-            handlers = [handlers]
-            if br_builtins:
-                handlers.append(get_builtins())
-            rooms = translator(Handlers(main_handler, tuple(handlers)))
-        elif isinstance(code, Handler):
-            handlers = []
-            if br_builtins:
-                handlers.append(get_builtins())
-            rooms = translator(Handlers(code, tuple(handlers)))
-        else:
-            rooms = translator(code)
+        rooms = _translate(code, br_builtins, floor_type, image_cache, prefetch_workers)
 
         enable_whisper(whisper_level)
 
@@ -219,6 +271,52 @@ def backrooms_api(code: Union[str, Handler, Handlers],
                       error_on_no_rule=error_on_no_rule,
                       core_dump=core_dump,
                       yields=yields,
-                      rules=rules)
+                      rules=rules,
+                      compile_blocks=compile_blocks,
+                      quantum=quantum,
+                      sinks=sinks)
     except backrooms_error.BackroomsError as e:
         raise BackRoomsError(e)
+
+
+def _translate(code: Union[str, Handler, Handlers],
+               br_builtins: bool,
+               floor_type: Type[Floor],
+               image_cache: Optional[str] = None,
+               prefetch_workers: int = 0) -> Rooms:
+    """
+    info: Translates code into Rooms.
+    :param code: Union[str, Handler, Handlers]
+        str: Will treat str as main file and load its dir.
+        Handler: Will load just the single Handler.
+        Handlers: Will load the Handlers.
+    :param br_builtins: bool
+        Only adds builtins if code is str or Handler.
+    :param floor_type: Type[Floor]
+    :param image_cache: Optional[str]
+        Dir to keep images in. None won't cache.
+    :param prefetch_workers: int
+        Threads reading included files ahead of the translator if code is str. 0 won't prefetch.
+    :return: Rooms
+    """
+    if isinstance(code, str):
+        main_handler, handlers = load_dir(code)
+        handlers = [handlers]
+        if br_builtins:
+            handlers.append(get_builtins())
+        if prefetch_workers:
+            # the pool has to outlive the translator
+            with ThreadPoolExecutor(prefetch_workers) as executor:
+                return _translate(Handlers(main_handler, tuple(handlers), executor),
+                                  br_builtins,
+                                  floor_type,
+                                  image_cache)
+        code = Handlers(main_handler, tuple(handlers))
+    elif isinstance(code, Handler):
+        handlers = []
+        if br_builtins:
+            handlers.append(get_builtins())
+        code = Handlers(code, tuple(handlers))
+    if image_cache is not None:
+        return image.cached_translator(code, image_cache, floor_type)
+    return translator(code, floor_type)
@@ -20,7 +20,7 @@ This module holds Backrooms built-in scripts.
 from typing import Tuple
 
 # backrooms
-from backrooms.translator import StringHandler
+from backrooms.translator import SnapshotHandler
 from . import brs_heap
 from . import brs_heap_load
 from . import brs_hard_vector
@@ -29,10 +29,10 @@ from . import brs_variables
 from . import brs_variables_load
 
 
-def get_builtins() -> Tuple[StringHandler, ...]:
+def get_builtins() -> Tuple[SnapshotHandler, ...]:
     """
     info: Gets Backrooms builtins scripts.
-    :return: Tuple[StringHandler, ...]
+    :return: Tuple[SnapshotHandler, ...]
     """
     return (brs_heap.get_handler(),
             brs_heap_load.get_handler(),
@@ -4,7 +4,7 @@ Copyright 2021 Charles McMarrow
 
 
 # backrooms
-from backrooms.translator import StringHandler
+from backrooms.translator import SnapshotHandler
 
 NAME = "heap_load"
 
@@ -14,9 +14,9 @@ SCRIPT = """
 """
 
 
-def get_handler() -> StringHandler:
+def get_handler() -> SnapshotHandler:
     """
     info: Gets script handler.
-    :return: StringHandler
+    :return: SnapshotHandler
     """
-    return StringHandler(NAME, SCRIPT)
+    return SnapshotHandler(NAME, SCRIPT)
@@ -0,0 +1,415 @@
+"""
+Copyright 2021 Charles McMarrow
+
+This script runs many independent backrooms programs across processes.
+"""
+
+# built-in
+import argparse
+import multiprocessing
+from multiprocessing.connection import Connection, wait
+import os
+import pickle
+import time
+from typing import Dict, Generator, List, Optional, Sequence, Tuple, Type, Union
+
+# backrooms
+from . import backrooms_error
+from .backrooms import _translate
+from .portal import Portal
+from .rooms import Floor, SparseFloor
+from .translator import Handler, Handlers
+
+# Rules ran between wall clock checks
+RULE_SLICE = 1000
+# seconds a program is given past its time limit before its process is killed
+KILL_GRACE = 1.0
+
+
+class BatchError(backrooms_error.BackroomsError):
+    @classmethod
+    def time_limit(cls, time_limit: float):
+        """
+        info: Used to indicate a program ran for to long.
+        :param time_limit: float
+        :return: BatchError
+        """
+        return cls(f"Time limit of {time_limit} seconds hit! Got lost in the backrooms!")
+
+    @classmethod
+    def worker_died(cls):
+        """
+        info: Used to indicate the process running a program died.
+        :return: BatchError
+        """
+        return cls("Worker process died!")
+
+
+class BatchResult:
+    def __init__(self,
+                 index: int,
+                 code: Union[str, Handler, Handlers],
+                 output_stream: List[object],
+                 error: Optional[str]):
+        """
+        info: Holds how a single program of a batch ended.
+        :param index: int
+            Where the program was in the batch.
+        :param code: Union[str, Handler, Handlers]
+        :param output_stream: List[object]
+            Everything the program wrote out before it ended.
+        :param error: Optional[str]
+            None if the program ran without error.
+        """
+        self._index: int = index
+        self._code: Union[str, Handler, Handlers] = code
+        self._output_stream: List[object] = output_stream
+        self._error: Optional[str] = error
+
+    def __repr__(self) -> str:
+        """
+        info: Shows program and error.
+        :return: str
+        """
+        return f"<{self.__class__.__name__}: {self._index} {self._code!r} error={self._error!r}>"
+
+    def get_index(self) -> int:
+        """
+        info: Gets where the program was in the batch.
+        :return: int
+        """
+        return self._index
+
+    def get_code(self) -> Union[str, Handler, Handlers]:
+        """
+        info: Gets the program.
+        :return: Union[str, Handler, Handlers]
+        """
+        return self._code
+
+    def get_output_stream(self) -> List[object]:
+        """
+        info: Gets the output stream.
+        :return: List[object]
+        """
+        return self._output_stream
+
+    def get_error(self) -> Optional[str]:
+        """
+        info: Gets the error the program ended with.
+        :return: Optional[str]
+        """
+        return self._error
+
+
+def _run_program(rooms_image: bytes,
+                 inputs: Tuple[str, ...],
+                 lost_count: int,
+                 lost_rule_count: int,
+                 error_on_space: bool,
+                 error_on_no_rule: bool,
+                 core_dump: bool,
+                 compile_blocks: bool,
+                 time_limit: Optional[float]) -> Tuple[List[object], Optional[str]]:
+    """
+    info: Runs a single program inside a worker process.
+        The time limit is checked every RULE_SLICE Rules.
+    :param rooms_image: bytes
+        Pickled Rooms of the translated program.
+    :param inputs: Tuple[str, ...]
+    :param lost_count: int
+    :param lost_rule_count: int
+    :param error_on_space: bool
+    :param error_on_no_rule: bool
+    :param core_dump: bool
+    :param compile_blocks: bool
+    :param time_limit: Optional[float]
+        Seconds the program is given to run.
+    :return: Tuple[List[object], Optional[str]]
+        Output stream and error if any.
+    """
+    portal = None
+    try:
+        if time_limit is not None:
+            deadline = time.monotonic() + time_limit
+        portal = Portal(pickle.loads(rooms_image),
+                        inputs=inputs,
+                        sys_output=False,
+                        catch_output=True,
+                        lost_count=lost_count,
+                        lost_rule_count=lost_rule_count,
+                        error_on_space=error_on_space,
+                        error_on_no_rule=error_on_no_rule,
+                        core_dump=core_dump,
+                        compile_blocks=compile_blocks)
+        while not portal.run_rules(RULE_SLICE):
+            if time_limit is not None and time.monotonic() >= deadline:
+                raise BatchError.time_limit(time_limit)
+        return portal.get_output_stream(), None
+    except backrooms_error.BackroomsError as e:
+        if portal is None:
+            return [], str(e)
+        return portal.get_output_stream(), str(e)
+
+
+class _Worker:
+    def __init__(self):
+        """
+        info: A process that runs one program at a time for batch_api.
+        """
+        connection, child_connection = multiprocessing.Pipe()
+        self.connection: Connection = connection
+        self._process: multiprocessing.Process = multiprocessing.Process(target=_work,
+                                                                         args=(child_connection,),
+                                                                         daemon=True)
+        self._process.start()
+        child_connection.close()
+        # index and code of the program being ran
+        self.program: Optional[Tuple[int, Union[str, Handler, Handlers]]] = None
+        self.kill_time: Optional[float] = None
+
+    def run(self,
+            index: int,
+            code: Union[str, Handler, Handlers],
+            arguments: tuple,
+            time_limit: Optional[float]) -> None:
+        """
+        info: Starts running a program.
+        :param index: int
+        :param code: Union[str, Handler, Handlers]
+        :param arguments: tuple
+            Arguments of _run_program.
+        :param time_limit: Optional[float]
+        :return: None
+        """
+        self.program = (index, code)
+        self.kill_time = None
+        if time_limit is not None:
+            self.kill_time = time.monotonic() + time_limit + KILL_GRACE
+        self.connection.send(arguments)
+
+    def stop(self) -> None:
+        """
+        info: Stops the process, killing it if it is running a program.
+        :return: None
+        """
+        if self.program is None:
+            try:
+                self.connection.send(None)
+            except OSError:
+                pass
+            self._process.join(KILL_GRACE)
+        if self._process.is_alive():
+            self._process.kill()
+            self._process.join()
+        self.connection.close()
+
+
+def _work(connection: Connection) -> None:
+    """
+    info: Runs programs sent over connection till None is sent.
+    :param connection: Connection
+    :return: None
+    """
+    while True:
+        arguments = connection.recv()
+        if arguments is None:
+            return
+        connection.send(_run_program(*arguments))
+
+
+def batch_api(programs: Sequence[Union[str, Handler, Handlers]],
+              inputs: Optional[Sequence[Optional[Sequence[str]]]] = None,
+              max_workers: Optional[int] = None,
+              lost_count: int = 0,
+              lost_rule_count: int = 0,
+              error_on_space: bool = False,
+              error_on_no_rule: bool = False,
+              br_builtins: bool = True,
+              core_dump: bool = False,
+              time_limit: Optional[float] = None,
+              floor_type: Type[Floor] = SparseFloor,
+              compile_blocks: bool = False) -> Generator[BatchResult, None, None]:
+    """
+    info: Runs many independent programs across a pool of processes.
+        Each distinct program is translated once and its Rooms is pickled once.
+        Results are given as programs finish, not in batch order.
+        A program still running KILL_GRACE seconds after its time limit has its process killed and replaced.
+    :param programs: Sequence[Union[str, Handler, Handlers]]
+        Same as code of backrooms_api.
+    :param inputs: Optional[Sequence[Optional[Sequence[str]]]]
+        Inputs for each program. A program with no inputs reads empty strings.
+    :param max_workers: Optional[int]
+        Processes to run programs on. None uses the number of CPUs.
+    :param lost_count: int
+        Applied to each program.
+    :param lost_rule_count: int
+        Applied to each program.
+    :param error_on_space: bool
+    :param error_on_no_rule: bool
+    :param br_builtins: bool
+    :param core_dump: bool
+    :param time_limit: Optional[float]
+        Wall clock seconds each program is given to run.
+    :param floor_type: Type[Floor]
+    :param compile_blocks: bool
+    :return: Generator[BatchResult, None, None]
+    """
+    if inputs is None:
+        inputs = [None] * len(programs)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    # pickled Rooms of each distinct program
+    rooms_images: Dict[object, bytes] = {}
+    pending = iter(enumerate(zip(programs, inputs)))
+    idle: List[_Worker] = []
+    busy: Dict[Connection, _Worker] = {}
+    try:
+        while True:
+            # give each free worker a program
+            while len(idle) + len(busy) < max_workers or idle:
+                next_program = next(pending, None)
+                if next_program is None:
+                    break
+                index, (code, program_inputs) = next_program
+                key = code if isinstance(code, str) else id(code)
+                rooms_image = rooms_images.get(key)
+                if rooms_image is None:
+                    try:
+                        rooms = _translate(code, br_builtins, floor_type)
+                    except backrooms_error.BackroomsError as e:
+                        yield BatchResult(index, code, [], str(e))
+                        continue
+                    rooms_image = rooms_images[key] = pickle.dumps(rooms, pickle.HIGHEST_PROTOCOL)
+                worker = idle.pop() if idle else _Worker()
+                worker.run(index,
+                           code,
+                           (rooms_image,
+                            tuple(program_inputs or ()),
+                            lost_count,
+                            lost_rule_count,
+                            error_on_space,
+                            error_on_no_rule,
+                            core_dump,
+                            compile_blocks,
+                            time_limit),
+                           time_limit)
+                busy[worker.connection] = worker
+            if not busy:
+                return
+
+            timeout = None
+            if time_limit is not None:
+                timeout = max(min(worker.kill_time for worker in busy.values()) - time.monotonic(), 0)
+            for connection in wait(list(busy), timeout):
+                worker = busy.pop(connection)
+                index, code = worker.program
+                try:
+                    output_stream, error = connection.recv()
+                except (EOFError, OSError):
+                    worker.stop()
+                    yield BatchResult(index, code, [], str(BatchError.worker_died()))
+                    continue
+                worker.program = None
+                idle.append(worker)
+                yield BatchResult(index, code, output_stream, error)
+
+            # kill workers stuck past the time limit
+            now = time.monotonic()
+            for connection, worker in list(busy.items()):
+                if worker.kill_time is not None and worker.kill_time <= now:
+                    del busy[connection]
+                    index, code = worker.program
+                    worker.stop()
+                    yield BatchResult(index, code, [], str(BatchError.time_limit(time_limit)))
+    finally:
+        for worker in idle + list(busy.values()):
+            worker.stop()
+
+
+def batch() -> None:
+    """
+    info: Console Interface to running a batch of backrooms programs.
+        Each result is written out as its program finishes.
+    :return: None
+    """
+    try:
+        parser = argparse.ArgumentParser(description="backrooms batch")
+        parser.add_argument("files",
+                            type=str,
+                            nargs="+",
+                            action="store",
+                            help="paths to main files")
+        parser.add_argument("-b",
+                            "--builtins",
+                            default=True,
+                            action="store_false",
+                            help="don't include built-in libraries")
+        parser.add_argument("-c",
+                            "--core_dump",
+                            default=False,
+                            action="store_true",
+                            help="enables CoreDump rule \"?\"")
+        parser.add_argument("-e",
+                            "--error-on-space",
+                            default=False,
+                            action="store_true",
+                            help="errors if portal lands on a space")
+        parser.add_argument("-i",
+                            "--input",
+                            default=[],
+                            type=str,
+                            action="append",
+                            help="input given to every program, can be used more then once")
+        parser.add_argument("-r",
+                            "--error_on_no_rule",
+                            default=False,
+                            action="store_true",
+                            help="errors if portal is given an invalid rule")
+        parser.add_argument("-w",
+                            "--workers",
+                            default=None,
+                            type=int,
+                            action="store",
+                            help="set number of worker processes")
+        parser.add_argument("--compile-blocks",
+                            default=False,
+                            action="store_true",
+                            help="run straight rules as compiled blocks")
+        parser.add_argument("--lost-count",
+                            default=0,
+                            type=int,
+                            action="store",
+                            help="set lost count of each program")
+        parser.add_argument("--lost-rule-count",
+                            default=0,
+                            type=int,
+                            action="store",
+                            help="set lost rule count of each program")
+        parser.add_argument("--time-limit",
+                            default=None,
+                            type=float,
+                            action="store",
+                            help="set wall clock seconds each program is given")
+        args = parser.parse_args()
+
+        for result in batch_api(args.files,
+                                inputs=[args.input] * len(args.files),
+                                max_workers=args.workers,
+                                lost_count=args.lost_count,
+                                lost_rule_count=args.lost_rule_count,
+                                error_on_space=args.error_on_space,
+                                error_on_no_rule=args.error_on_no_rule,
+                                br_builtins=args.builtins,
+                                core_dump=args.core_dump,
+                                time_limit=args.time_limit,
+                                compile_blocks=args.compile_blocks):
+            print(f"==> {result.get_code()} <==", flush=True)
+            for output in result.get_output_stream():
+                print(output, end="", flush=True)
+            print(flush=True)
+            if result.get_error() is not None:
+                print(f"ERROR: {result.get_error()}", flush=True)
+    except KeyboardInterrupt:
+        print("\nKeyboard Interrupt!", flush=True)
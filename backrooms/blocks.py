@@ -0,0 +1,235 @@
+"""
+Copyright 2021 Charles McMarrow
+
+This script holds a simple block compiler.
+A block is a run of straight Rules that can be executed as one unit.
+A block follows the path of a conscious through Rules that only turn while its branch is known to be clear.
+"""
+
+# built-in
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple
+
+# backrooms
+import backrooms    # import backrooms to avoid circular imports
+from .conscious import BRANCH_CLEAR, Conscious
+from .rooms import Rooms
+from .rules import Rule
+
+# most Rules a single block will hold
+MAX_BLOCK_LENGTH = 256
+
+# fewest Rules worth running as a block
+MIN_BLOCK_LENGTH = 2
+
+# times writes can throw out the Block at a start before the start is no longer compiled
+MAX_RECOMPILES = 2
+
+
+def _skip(offset_x: int,
+          offset_y: int,
+          portal: 'backrooms.portal.Portal',
+          rooms: Rooms,
+          conscious: Conscious,
+          start: Optional[Tuple[int, int, int]],
+          rule_step_visuals: List[Tuple[int, int, int]]) -> None:
+    """
+    info: Steps over a run of cells that do nothing but step in one go.
+    :param offset_x: int
+    :param offset_y: int
+    :param portal: Portal
+    :param rooms: Rooms
+    :param conscious: Conscious
+    :param start: Optional[Tuple[int, int, int]]
+    :param rule_step_visuals: List[Tuple[int, int, int]]
+    :return: None
+    """
+    conscious.pc_x += offset_x
+    conscious.pc_y += offset_y
+
+
+def _turn(vector_x: int,
+          vector_y: int,
+          portal: 'backrooms.portal.Portal',
+          rooms: Rooms,
+          conscious: Conscious,
+          start: Optional[Tuple[int, int, int]],
+          rule_step_visuals: List[Tuple[int, int, int]]) -> None:
+    """
+    info: Sets the vector along the floor and steps like a Rule that only turns.
+    :param vector_x: int
+    :param vector_y: int
+    :param portal: Portal
+    :param rooms: Rooms
+    :param conscious: Conscious
+    :param start: Optional[Tuple[int, int, int]]
+    :param rule_step_visuals: List[Tuple[int, int, int]]
+    :return: None
+    """
+    conscious.pc_v_x = vector_x
+    conscious.pc_v_y = vector_y
+    conscious.pc_x += vector_x
+    conscious.pc_y += vector_y
+
+
+def _compile(steps: Tuple[Tuple[Callable, Tuple[int, int, int]], ...]) -> Callable:
+    """
+    info: Compiles Rule steps into a single function.
+    :param steps: Tuple[Tuple[Callable, Tuple[int, int, int]], ...]
+    :return: Callable
+    """
+    def block(portal: 'backrooms.portal.Portal',
+              rooms: Rooms,
+              conscious: Conscious,
+              rule_step_visuals: List[Tuple[int, int, int]]) -> None:
+        for run, start in steps:
+            run(portal, rooms, conscious, start, rule_step_visuals)
+    return block
+
+
+class Block:
+    __slots__ = ("rule_count", "run")
+
+    def __init__(self,
+                 steps: Tuple[Tuple[Callable, Optional[Tuple[int, int, int]]], ...],
+                 rule_count: int):
+        """
+        info: Makes a Block of straight Rules.
+        :param steps: Tuple[Tuple[Callable, Optional[Tuple[int, int, int]]], ...]
+            Rule run method and start coordinates for each Rule in the Block.
+            Runs of cells that only step are a single step.
+        :param rule_count: int
+            Rules the Block stands for.
+        """
+        self.rule_count: int = rule_count
+        self.run: Optional[Callable] = None
+        if self.rule_count >= MIN_BLOCK_LENGTH:
+            self.run = _compile(steps)
+
+
+class BlockCompiler:
+    def __init__(self,
+                 rules: List[Optional[Rule]],
+                 error_on_space: bool,
+                 error_on_no_rule: bool,
+                 max_length: int = MAX_BLOCK_LENGTH):
+        """
+        info: Makes a BlockCompiler which finds and caches Blocks.
+        :param rules: List[Optional[Rule]]
+            Rules indexed by the ord of there start character.
+        :param error_on_space: bool
+            Spaces end a Block if true.
+        :param error_on_no_rule: bool
+            Cells with no Rule end a Block if true.
+        :param max_length: int
+            Most Rules a single Block will hold.
+        """
+        self._rules: List[Optional[Rule]] = rules
+        self._error_on_space: bool = error_on_space
+        self._error_on_no_rule: bool = error_on_no_rule
+        self._max_length: int = min(max_length, MAX_BLOCK_LENGTH)
+        self._blocks: Dict[Tuple[int, int, int, int, int, bool], Block] = {}
+        # times the Block at each start was thrown out by writes
+        self._recompiles: Dict[Tuple[int, int, int, int, int, bool], int] = {}
+
+    def get_block(self,
+                  rooms: Rooms,
+                  conscious: Conscious) -> Optional[Block]:
+        """
+        info: Gets the Block that starts where conscious is.
+        :param rooms: Rooms
+        :param conscious: Conscious
+        :return: Optional[Block]
+            None if no Block worth running starts there.
+        """
+        if conscious.pc_v_floor:
+            return None
+        key = (conscious.pc_x,
+               conscious.pc_y,
+               conscious.pc_floor,
+               conscious.pc_v_x,
+               conscious.pc_v_y,
+               conscious.branch is BRANCH_CLEAR)
+        block = self._blocks.get(key)
+        if block is None:
+            block = self._blocks[key] = self._compile_block(rooms, *key)
+        if block.run is None:
+            return None
+        return block
+
+    def _compile_block(self,
+                       rooms: Rooms,
+                       x: int,
+                       y: int,
+                       floor: int,
+                       vector_x: int,
+                       vector_y: int,
+                       clear: bool) -> Block:
+        """
+        info: Follows the straight Rules starting at (x, y, floor) and compiles them into a Block.
+        :param rooms: Rooms
+        :param x: int
+        :param y: int
+        :param floor: int
+        :param vector_x: int
+        :param vector_y: int
+        :param clear: bool
+            If the branch of the conscious is clear.
+        :return: Block
+        """
+        key = (x, y, floor, vector_x, vector_y, clear)
+        if self._recompiles.get(key, 0) > MAX_RECOMPILES:
+            # the program keeps writing over this start so stop compiling it
+            return Block((), 0)
+        min_x, min_y, max_x, max_y = x, y, x, y
+        steps = []
+        rule_count = 0
+        # cells stepped over since the last step
+        skipped = 0
+        while rule_count < self._max_length:
+            character = rooms.read(x, y, floor)
+            rule = self._rules[ord(character)]
+            turn = None
+            if rule is None:
+                if self._error_on_no_rule or (self._error_on_space and character == " "):
+                    break
+                skipped += 1
+                width = 1
+            elif rule.is_step_only():
+                skipped += 1
+                width = 1
+            else:
+                if clear:
+                    turn = rule.get_turn(rooms, x, y, floor, vector_x, vector_y)
+                width = 1 if turn is not None else rule.get_straight_width(rooms, x, y, floor, vector_x, vector_y)
+                if not width:
+                    break
+                if skipped:
+                    steps.append((partial(_skip, vector_x * skipped, vector_y * skipped), None))
+                    skipped = 0
+                if turn is not None:
+                    steps.append((partial(_turn, *turn), None))
+                    vector_x, vector_y = turn
+                else:
+                    steps.append((rule.run, (x, y, floor)))
+                    if rule.is_branch():
+                        clear = False
+            rule_count += 1
+            x += vector_x * width
+            y += vector_y * width
+            min_x, min_y, max_x, max_y = min(min_x, x), min(min_y, y), max(max_x, x), max(max_y, y)
+        if skipped:
+            steps.append((partial(_skip, vector_x * skipped, vector_y * skipped), None))
+        # watch every cell read including the cell that ended the Block
+        rooms.add_watcher(floor, min_x, min_y, max_x, max_y, partial(self._remove_block, key))
+        return Block(tuple(steps), rule_count)
+
+    def _remove_block(self,
+                      key: Tuple[int, int, int, int, int, bool]) -> None:
+        """
+        info: Removes a Block once one of its cells might have changed.
+        :param key: Tuple[int, int, int, int, int, bool]
+        :return: None
+        """
+        self._blocks.pop(key, None)
+        self._recompiles[key] = self._recompiles.get(key, 0) + 1
@@ -11,8 +11,10 @@ A conscious holds it own state.
 """
 
 # built-in
+from collections.abc import ItemsView, KeysView, ValuesView
+from copy import deepcopy
 from functools import lru_cache
-from typing import Dict, Tuple, Type, Union
+from typing import Callable, Iterator, List, Optional, Tuple, Type, Union
 
 # backrooms
 from . import stack
@@ -84,7 +86,7 @@ def _less_than_zero(conscious: 'Conscious') -> bool:
     :param conscious: Conscious
     :return: bool
     """
-    return _to_int(conscious[WORK_STACK].peak()) < 0
+    return _to_int(conscious.work_stack.peak()) < 0
 
 
 def _greater_than_zero(conscious: 'Conscious') -> bool:
@@ -93,7 +95,7 @@ def _greater_than_zero(conscious: 'Conscious') -> bool:
     :param conscious: Conscious
     :return: bool
     """
-    return _to_int(conscious[WORK_STACK].peak()) > 0
+    return _to_int(conscious.work_stack.peak()) > 0
 
 
 def _zero(conscious: 'Conscious') -> bool:
@@ -102,7 +104,7 @@ def _zero(conscious: 'Conscious') -> bool:
     :param conscious: Conscious
     :return: bool
     """
-    return _to_int(conscious[WORK_STACK].peak()) == 0
+    return _to_int(conscious.work_stack.peak()) == 0
 
 
 def _not_zero(conscious: 'Conscious') -> bool:
@@ -111,7 +113,7 @@ def _not_zero(conscious: 'Conscious') -> bool:
     :param conscious: Conscious
     :return: bool
     """
-    return _to_int(conscious[WORK_STACK].peak()) != 0
+    return _to_int(conscious.work_stack.peak()) != 0
 
 
 def _is_integer(conscious: 'Conscious') -> bool:
@@ -120,7 +122,7 @@ def _is_integer(conscious: 'Conscious') -> bool:
     :param conscious: Conscious
     :return: bool
     """
-    return isinstance(conscious[WORK_STACK].peak(), int)
+    return isinstance(conscious.work_stack.peak(), int)
 
 
 def _is_string(conscious: 'Conscious') -> bool:
@@ -129,7 +131,7 @@ def _is_string(conscious: 'Conscious') -> bool:
     :param conscious: Conscious
     :return: bool
     """
-    return isinstance(conscious[WORK_STACK].peak(), str)
+    return isinstance(conscious.work_stack.peak(), str)
 
 
 def _is_none(conscious: 'Conscious') -> bool:
@@ -138,7 +140,7 @@ def _is_none(conscious: 'Conscious') -> bool:
     :param conscious: Conscious
     :return: bool
     """
-    return conscious[WORK_STACK].peak() is None
+    return conscious.work_stack.peak() is None
 
 
 def _is_stack_frame(conscious: 'Conscious') -> bool:
@@ -147,7 +149,7 @@ def _is_stack_frame(conscious: 'Conscious') -> bool:
     :param conscious: Conscious
     :return: bool
     """
-    return conscious[WORK_STACK].peak() is stack.StackFrame
+    return conscious.work_stack.peak() is stack.StackFrame
 
 
 def _is_stack_bottom(conscious: 'Conscious') -> bool:
@@ -156,7 +158,7 @@ def _is_stack_bottom(conscious: 'Conscious') -> bool:
     :param conscious: Conscious
     :return: bool
     """
-    return conscious[WORK_STACK].peak() is stack.StackBottom
+    return conscious.work_stack.peak() is stack.StackBottom
 
 
 # Branch
@@ -173,57 +175,458 @@ BRANCH_IS_STACK_FRAME = _is_stack_frame
 BRANCH_IS_STACK_BOTTOM = _is_stack_bottom
 
 
-class Conscious(Dict):
+class CallFrame:
+    __slots__ = ("pc_x",
+                 "pc_y",
+                 "pc_floor",
+                 "pc_v_x",
+                 "pc_v_y",
+                 "pc_v_floor",
+                 "registers")
+
+    def __init__(self,
+                 pc_x: int,
+                 pc_y: int,
+                 pc_floor: int,
+                 pc_v_x: int,
+                 pc_v_y: int,
+                 pc_v_floor: int,
+                 registers: Tuple[object, ...]):
+        """
+        info: Makes a CallFrame which holds the PC, PC Vector and work registers of a Conscious as one unit.
+        :param pc_x: int
+        :param pc_y: int
+        :param pc_floor: int
+        :param pc_v_x: int
+        :param pc_v_y: int
+        :param pc_v_floor: int
+        :param registers: Tuple[object, ...]
+        """
+        self.pc_x: int = pc_x
+        self.pc_y: int = pc_y
+        self.pc_floor: int = pc_floor
+        self.pc_v_x: int = pc_v_x
+        self.pc_v_y: int = pc_v_y
+        self.pc_v_floor: int = pc_v_floor
+        self.registers: Tuple[object, ...] = registers
+
+    def __repr__(self) -> str:
+        """
+        info: Shows CallFrame.
+        :return: str
+        """
+        return f"<{self.__class__.__name__}: {self.get_items()}>"
+
+    def __reduce__(self):
+        """
+        info: Pickles CallFrame by its values.
+        :return: Tuple[Type[CallFrame], Tuple[object, ...]]
+        """
+        return CallFrame, (self.pc_x, self.pc_y, self.pc_floor, self.pc_v_x, self.pc_v_y, self.pc_v_floor,
+                           self.registers)
+
+    def get_items(self) -> Tuple[object, ...]:
+        """
+        info: Gets the items of CallFrame in the order they would be pushed one by one.
+            PC, PC Vector then R0 to R9.
+        :return: Tuple[object, ...]
+        """
+        return (self.pc_x, self.pc_y, self.pc_floor, self.pc_v_x, self.pc_v_y, self.pc_v_floor) + self.registers
+
+
+# registers key to index of Conscious.registers
+_REGISTERS = {R0: 0, R1: 1, R2: 2, R3: 3, R4: 4, R5: 5, R6: 6, R7: 7, R8: 8, R9: 9}
+
+# key to attribute of Conscious
+_ATTRIBUTES = {WORK_STACK: "work_stack",
+               FUNCTION_STACK: "function_stack",
+               PC_X: "pc_x",
+               PC_Y: "pc_y",
+               PC_FLOOR: "pc_floor",
+               PC_V_X: "pc_v_x",
+               PC_V_Y: "pc_v_y",
+               PC_V_FLOOR: "pc_v_floor",
+               ID: "id",
+               ALIVE: "alive",
+               HALT: "halt",
+               BRANCH: "branch"}
+
+_KEYS = (WORK_STACK, FUNCTION_STACK) + tuple(_REGISTERS) + (PC_X, PC_Y, PC_FLOOR, PC_V_X, PC_V_Y, PC_V_FLOOR,
+                                                            ID, ALIVE, HALT, BRANCH)
+
+# default of each key that is not a Stack
+_DEFAULTS = {R0: None, R1: None, R2: None, R3: None, R4: None, R5: None, R6: None, R7: None, R8: None, R9: None,
+             PC_X: 0, PC_Y: 0, PC_FLOOR: 0, PC_V_X: 1, PC_V_Y: 0, PC_V_FLOOR: 0,
+             ID: None, ALIVE: True, HALT: False, BRANCH: BRANCH_CLEAR}
+
+
+def _get_default(key: str) -> object:
+    """
+    info: Gets the value a Conscious key starts with.
+    :param key: str
+    :return: object
+    """
+    if key in (WORK_STACK, FUNCTION_STACK):
+        return stack.Stack()
+    return _DEFAULTS[key]
+
+
+class Conscious(dict):
+    __slots__ = ("work_stack",
+                 "function_stack",
+                 "registers",
+                 "pc_x",
+                 "pc_y",
+                 "pc_floor",
+                 "pc_v_x",
+                 "pc_v_y",
+                 "pc_v_floor",
+                 "id",
+                 "alive",
+                 "halt",
+                 "branch")
+
     def __init__(self, **kwargs):
         """
         info: Makes a Conscious "Thread".
+            State is held in slots. The mapping interface is kept as a view over the slots.
         :param kwargs: Dict[str, object]
-        :return: Dict[str, object]
-        """
-        new_conscious = {WORK_STACK: stack.Stack(),
-                         FUNCTION_STACK: stack.Stack(),
-                         R0: None,
-                         R1: None,
-                         R2: None,
-                         R3: None,
-                         R4: None,
-                         R5: None,
-                         R6: None,
-                         R7: None,
-                         R8: None,
-                         R9: None,
-                         PC_X: 0,
-                         PC_Y: 0,
-                         PC_FLOOR: 0,
-                         PC_V_X: 1,
-                         PC_V_Y: 0,
-                         PC_V_FLOOR: 0,
-                         ID: None,
-                         ALIVE: True,
-                         HALT: False,
-                         BRANCH: BRANCH_CLEAR}
-        new_conscious.update(kwargs)
-        super(Conscious, self).__init__(new_conscious)
+        :exception KeyError
+            raises KeyError if a kwarg is not a Conscious key.
+        """
+        super(Conscious, self).__init__()
+        self.work_stack: stack.Stack = stack.Stack()
+        self.function_stack: stack.Stack = stack.Stack()
+        self.registers: List[object] = [None] * 10
+        self.pc_x: int = 0
+        self.pc_y: int = 0
+        self.pc_floor: int = 0
+        self.pc_v_x: int = 1
+        self.pc_v_y: int = 0
+        self.pc_v_floor: int = 0
+        self.id: Optional[int] = None
+        self.alive: bool = True
+        self.halt: bool = False
+        self.branch: Callable[['Conscious'], bool] = BRANCH_CLEAR
+        for key, value in kwargs.items():
+            self[key] = value
+
+    def __getitem__(self, key: str) -> object:
+        """
+        info: Gets a value by its key.
+        :param key: str
+        :exception KeyError
+            raises KeyError if key is not a Conscious key.
+        :return: object
+        """
+        attribute = _ATTRIBUTES.get(key)
+        if attribute is not None:
+            return getattr(self, attribute)
+        if key in _REGISTERS:
+            return self.registers[_REGISTERS[key]]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: object) -> None:
+        """
+        info: Sets a value by its key.
+        :param key: str
+        :param value: object
+        :exception KeyError
+            raises KeyError if key is not a Conscious key.
+        :return: None
+        """
+        attribute = _ATTRIBUTES.get(key)
+        if attribute is not None:
+            setattr(self, attribute, value)
+        elif key in _REGISTERS:
+            self.registers[_REGISTERS[key]] = value
+        else:
+            raise KeyError(key)
+
+    def __delitem__(self, key: str) -> None:
+        """
+        info: Keys of a Conscious can't be removed so the key is set back to its default.
+        :param key: str
+        :exception KeyError
+            raises KeyError if key is not a Conscious key.
+        :return: None
+        """
+        if key not in self:
+            raise KeyError(key)
+        self[key] = _get_default(key)
+
+    def __contains__(self, key: object) -> bool:
+        """
+        info: Checks if key is a Conscious key.
+        :param key: object
+        :return: bool
+        """
+        return key in _ATTRIBUTES or key in _REGISTERS
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        info: Iterates over the Conscious keys.
+        :return: Iterator[str]
+        """
+        return iter(_KEYS)
+
+    def __reversed__(self) -> Iterator[str]:
+        """
+        info: Iterates over the Conscious keys backwards.
+        :return: Iterator[str]
+        """
+        return reversed(_KEYS)
+
+    def __len__(self) -> int:
+        """
+        info: Gets the number of Conscious keys.
+        :return: int
+        """
+        return len(_KEYS)
+
+    def __eq__(self, other: object) -> bool:
+        """
+        info: Compares Conscious with a mapping by key and value.
+        :param other: object
+        :return: bool
+        """
+        if isinstance(other, dict):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    def __ne__(self, other: object) -> bool:
+        """
+        info: Compares Conscious with a mapping by key and value.
+        :param other: object
+        :return: bool
+        """
+        if isinstance(other, dict):
+            return not self == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __or__(self, other: object) -> dict:
+        """
+        info: Merges Conscious with a mapping into a new dict like dict does.
+        :param other: object
+        :return: dict
+        """
+        if isinstance(other, dict):
+            new_dict = dict(self.items())
+            new_dict.update(other)
+            return new_dict
+        return NotImplemented
+
+    def __ror__(self, other: object) -> dict:
+        """
+        info: Merges a mapping with Conscious into a new dict like dict does.
+        :param other: object
+        :return: dict
+        """
+        if isinstance(other, dict):
+            new_dict = dict(other)
+            new_dict.update(self.items())
+            return new_dict
+        return NotImplemented
+
+    def __ior__(self, other: object) -> 'Conscious':
+        """
+        info: Sets values from a mapping.
+        :param other: object
+        :exception KeyError
+            raises KeyError if a key is not a Conscious key.
+        :return: Conscious
+        """
+        self.update(other)
+        return self
+
+    def __repr__(self) -> str:
+        """
+        info: Shows Conscious like a dict.
+        :return: str
+        """
+        return repr(dict(self.items()))
+
+    def __reduce__(self):
+        """
+        info: Pickles Conscious by its items.
+        :return: Tuple[Callable, Tuple[Tuple[Tuple[str, object], ...]]]
+        """
+        return _rebuild_conscious, (tuple(self.items()),)
+
+    def __copy__(self) -> 'Conscious':
+        """
+        info: Makes a shallow copy of Conscious.
+        :return: Conscious
+        """
+        return Conscious(**dict(self.items()))
+
+    def __deepcopy__(self, memo: dict) -> 'Conscious':
+        """
+        info: Makes a deep copy of Conscious.
+        :param memo: dict
+        :return: Conscious
+        """
+        new_conscious = Conscious()
+        memo[id(self)] = new_conscious
+        for key, value in self.items():
+            new_conscious[key] = deepcopy(value, memo)
+        return new_conscious
+
+    def keys(self) -> KeysView:
+        """
+        info: Gets a view of the Conscious keys.
+        :return: KeysView
+        """
+        return KeysView(self)
+
+    def values(self) -> ValuesView:
+        """
+        info: Gets a view of the Conscious values.
+        :return: ValuesView
+        """
+        return ValuesView(self)
+
+    def items(self) -> ItemsView:
+        """
+        info: Gets a view of the Conscious items.
+        :return: ItemsView
+        """
+        return ItemsView(self)
+
+    def get(self, key: str, default: object = None) -> object:
+        """
+        info: Gets a value by its key or default.
+        :param key: str
+        :param default: object
+        :return: object
+        """
+        if key in self:
+            return self[key]
+        return default
+
+    def update(self, *args, **kwargs) -> None:
+        """
+        info: Sets values from a mapping or kwargs.
+        :param args: Tuple[Dict[str, object]]
+        :param kwargs: Dict[str, object]
+        :return: None
+        """
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def setdefault(self, key: str, default: object = None) -> object:
+        """
+        info: Gets a value by its key.
+            Every Conscious key always has a value so default is never used.
+        :param key: str
+        :param default: object
+        :exception KeyError
+            raises KeyError if key is not a Conscious key.
+        :return: object
+        """
+        return self[key]
+
+    def pop(self, key: str, *default: object) -> object:
+        """
+        info: Gets a value by its key and sets the key back to its default.
+        :param key: str
+        :param default: Tuple[object]
+            Given back if key is not a Conscious key.
+        :exception KeyError
+            raises KeyError if key is not a Conscious key and no default is given.
+        :return: object
+        """
+        if key not in self:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        value = self[key]
+        del self[key]
+        return value
+
+    def popitem(self) -> Tuple[str, object]:
+        """
+        info: Gets the last item and sets its key back to its default.
+        :return: Tuple[str, object]
+        """
+        key = _KEYS[-1]
+        return key, self.pop(key)
+
+    def clear(self) -> None:
+        """
+        info: Sets every key back to its default.
+        :return: None
+        """
+        for key in _KEYS:
+            del self[key]
+
+    def copy(self) -> 'Conscious':
+        """
+        info: Makes a shallow copy of Conscious.
+        :return: Conscious
+        """
+        return self.__copy__()
+
+    def snapshot(self) -> CallFrame:
+        """
+        info: Saves the PC, PC Vector and work registers.
+            StackBottom in a register is saved as None.
+        :return: CallFrame
+        """
+        return CallFrame(self.pc_x,
+                         self.pc_y,
+                         self.pc_floor,
+                         self.pc_v_x,
+                         self.pc_v_y,
+                         self.pc_v_floor,
+                         tuple(None if register is stack.StackBottom else register for register in self.registers))
+
+    def restore(self, call_frame: CallFrame) -> None:
+        """
+        info: Restores the PC, PC Vector and work registers from a CallFrame.
+        :param call_frame: CallFrame
+        :return: None
+        """
+        self.pc_x = call_frame.pc_x
+        self.pc_y = call_frame.pc_y
+        self.pc_floor = call_frame.pc_floor
+        self.pc_v_x = call_frame.pc_v_x
+        self.pc_v_y = call_frame.pc_v_y
+        self.pc_v_floor = call_frame.pc_v_floor
+        self.registers[:] = call_frame.registers
 
     def step(self) -> None:
         """
         info: Shift the PC Registers based off the PC Vector Registers.
         :return: None
         """
-        self[PC_X] += self[PC_V_X]
-        self[PC_Y] += self[PC_V_Y]
-        self[PC_FLOOR] += self[PC_V_FLOOR]
+        self.pc_x += self.pc_v_x
+        self.pc_y += self.pc_v_y
+        self.pc_floor += self.pc_v_floor
 
     def next_step(self) -> Tuple[int, int, int]:
         """
         info: Get the next location for Conscious.
         :return: Tuple[int, int, int]
         """
-        return self[PC_X] + self[PC_V_X], self[PC_Y] + self[PC_V_Y], self[PC_FLOOR] + self[PC_V_FLOOR]
+        return self.pc_x + self.pc_v_x, self.pc_y + self.pc_v_y, self.pc_floor + self.pc_v_floor
 
     def at(self) -> Tuple[int, int, int]:
         """
         info: Get the current location of Conscious.
         :return: Tuple[int, int, int]
         """
-        return self[PC_X], self[PC_Y], self[PC_FLOOR]
+        return self.pc_x, self.pc_y, self.pc_floor
+
+
+def _rebuild_conscious(items: Tuple[Tuple[str, object], ...]) -> Conscious:
+    """
+    info: Rebuilds a pickled Conscious.
+    :param items: Tuple[Tuple[str, object], ...]
+    :return: Conscious
+    """
+    new_conscious = Conscious()
+    new_conscious.update(items)
+    return new_conscious
@@ -0,0 +1,365 @@
+"""
+Copyright 2021 Charles McMarrow
+
+This script holds a compact binary image format for translated Rooms.
+An image stores the floors, floor names and hallways of a Rooms so a program can start without being translated.
+
+Image layout, all numbers little endian:
+    magic "BRIM", version u16,
+    source count u32, for each Handler the image includes: name, sha256 of its name and data 32 bytes,
+    then a zlib compressed body of
+    floor count u32, for each floor: level i64, run count u32, for each run: x i64, y i64, length u32, characters
+    floor name count u32, for each floor name: level i64, name
+    hallway floor count u32, for each floor: level i64, hallway count u32, for each hallway: location i64, name
+A name is a length u16 then ascii characters, a length of 0 means no name.
+Names of sources are utf-8 instead.
+"""
+
+# built-in
+import hashlib
+import os
+import struct
+import zlib
+from typing import Iterator, List, Optional, Sequence, Tuple, Type
+
+# backrooms
+import backrooms    # import backrooms to avoid circular imports
+from .backrooms_error import BackroomsError
+from .rooms import Floor, Rooms, RoomsError, SparseFloor
+from .translator import Handler, Handlers, translator
+
+IMAGE_MAGIC = b"BRIM"
+IMAGE_VERSION = 2
+IMAGE_FILE_EXTENSION = ".brim"
+DEFAULT_IMAGE_CACHE = os.path.join(os.path.expanduser("~"), ".backrooms_cache")
+
+_HEADER = struct.Struct("<4sH")
+_COUNT = struct.Struct("<I")
+_LEVEL = struct.Struct("<q")
+_RUN = struct.Struct("<qqI")
+_NAME = struct.Struct("<H")
+_SOURCE_HASH_SIZE = 32
+
+
+class ImageError(BackroomsError):
+    @classmethod
+    def bad_image(cls, reason: str):
+        """
+        info: Used to indicate bytes are not a valid image.
+        :param reason: str
+        :return: ImageError
+        """
+        return cls(f"Bad image: {reason}!")
+
+
+def _get_runs(floor: Floor) -> Iterator[Tuple[int, int, str]]:
+    """
+    info: Groups the cells of a Floor into runs of cells next to each other on a row.
+    :param floor: Floor
+    :return: Iterator[Tuple[int, int, str]]
+        x, y and characters of each run.
+    """
+    cells = sorted(floor.get_cells(), key=lambda cell: (cell[1], cell[0]))
+    run_x, run_y, characters = None, None, []
+    for x, y, character in cells:
+        if y != run_y or x != run_x + len(characters):
+            if characters:
+                yield run_x, run_y, "".join(characters)
+            run_x, run_y, characters = x, y, []
+        characters.append(character)
+    if characters:
+        yield run_x, run_y, "".join(characters)
+
+
+def _pack_name(name: Optional[str],
+               encoding: str = "ascii") -> bytes:
+    """
+    info: Packs a floor, hallway or source name.
+    :param name: Optional[str]
+    :param encoding: str
+    :return: bytes
+    """
+    if name is None:
+        return _NAME.pack(0)
+    name = name.encode(encoding)
+    return _NAME.pack(len(name)) + name
+
+
+def dump_image(rooms: Rooms,
+               sources: Sequence[Tuple[str, bytes]] = ()) -> bytes:
+    """
+    info: Makes an image of Rooms.
+    :param rooms: Rooms
+    :param sources: Sequence[Tuple[str, bytes]]
+        Name and source hash of each Handler included into rooms.
+    :return: bytes
+    """
+    head: List[bytes] = [_HEADER.pack(IMAGE_MAGIC, IMAGE_VERSION), _COUNT.pack(len(sources))]
+    for name, source_hash in sources:
+        head.append(_pack_name(name, "utf-8"))
+        head.append(source_hash)
+
+    body: List[bytes] = []
+
+    floor_levels = rooms.get_floor_levels()
+    body.append(_COUNT.pack(len(floor_levels)))
+    for floor_level in floor_levels:
+        runs = list(_get_runs(rooms.get_floor(floor_level)))
+        body.append(_LEVEL.pack(floor_level))
+        body.append(_COUNT.pack(len(runs)))
+        for x, y, characters in runs:
+            body.append(_RUN.pack(x, y, len(characters)))
+            body.append(characters.encode("latin-1"))
+
+    floor_names = rooms.get_floor_names()
+    body.append(_COUNT.pack(len(floor_names)))
+    for floor_level, floor_name in floor_names.items():
+        body.append(_LEVEL.pack(floor_level))
+        body.append(_pack_name(floor_name))
+
+    hallways = rooms.get_hallways()
+    body.append(_COUNT.pack(len(hallways)))
+    for floor_level, floor_hallways in hallways.items():
+        body.append(_LEVEL.pack(floor_level))
+        body.append(_COUNT.pack(len(floor_hallways)))
+        for location, hallway_name in floor_hallways:
+            body.append(_LEVEL.pack(location))
+            body.append(_pack_name(hallway_name))
+
+    return b"".join(head) + zlib.compress(b"".join(body))
+
+
+class _Reader:
+    def __init__(self,
+                 data: bytes):
+        """
+        info: Reads the body of an image.
+        :param data: bytes
+        """
+        self._data: bytes = data
+        self._at: int = 0
+
+    def unpack(self, packer: struct.Struct) -> tuple:
+        """
+        info: Unpacks the next item.
+        :param packer: struct.Struct
+        :return: tuple
+        """
+        item = packer.unpack_from(self._data, self._at)
+        self._at += packer.size
+        return item
+
+    def read(self, size: int) -> bytes:
+        """
+        info: Reads the next bytes.
+        :param size: int
+        :exception ImageError
+            raises ImageError if the body ends early.
+        :return: bytes
+        """
+        if self._at + size > len(self._data):
+            raise ImageError.bad_image("body ends early")
+        data = self._data[self._at: self._at + size]
+        self._at += size
+        return data
+
+    def read_name(self,
+                  encoding: str = "ascii") -> Optional[str]:
+        """
+        info: Reads a floor, hallway or source name.
+        :param encoding: str
+        :return: Optional[str]
+        """
+        size, = self.unpack(_NAME)
+        if not size:
+            return None
+        return self.read(size).decode(encoding)
+
+    def read_rest(self) -> bytes:
+        """
+        info: Reads what is left.
+        :return: bytes
+        """
+        data = self._data[self._at:]
+        self._at = len(self._data)
+        return data
+
+    def is_done(self) -> bool:
+        """
+        info: Checks if the whole body was read.
+        :return: bool
+        """
+        return self._at == len(self._data)
+
+
+def _read_sources(reader: _Reader) -> Tuple[Tuple[str, bytes], ...]:
+    """
+    info: Reads the header and sources of an image.
+    :param reader: _Reader
+    :exception ImageError
+        raises ImageError if the header is not valid.
+    :return: Tuple[Tuple[str, bytes], ...]
+    """
+    magic, version = reader.unpack(_HEADER)
+    if magic != IMAGE_MAGIC:
+        raise ImageError.bad_image("missing magic")
+    if version != IMAGE_VERSION:
+        raise ImageError.bad_image(f"unknown version {version}")
+    source_count, = reader.unpack(_COUNT)
+    return tuple((reader.read_name("utf-8"), reader.read(_SOURCE_HASH_SIZE)) for _ in range(source_count))
+
+
+def get_image_sources(image: bytes) -> Tuple[Tuple[str, bytes], ...]:
+    """
+    info: Gets the name and source hash of each Handler included into an image without loading it.
+    :param image: bytes
+    :exception ImageError
+        raises ImageError if the header is not valid.
+    :return: Tuple[Tuple[str, bytes], ...]
+    """
+    try:
+        return _read_sources(_Reader(image))
+    except (struct.error, UnicodeDecodeError) as e:
+        raise ImageError.bad_image(str(e))
+
+
+def load_image(image: bytes,
+               floor_type: Type[Floor] = SparseFloor) -> Rooms:
+    """
+    info: Makes Rooms from an image.
+    :param image: bytes
+    :param floor_type: Type[Floor]
+    :exception ImageError
+        raises ImageError if image is not a valid image.
+    :return: Rooms
+    """
+    try:
+        head = _Reader(image)
+        _read_sources(head)
+        reader = _Reader(zlib.decompress(head.read_rest()))
+        rooms = Rooms(floor_type)
+
+        floor_count, = reader.unpack(_COUNT)
+        for _ in range(floor_count):
+            floor_level, = reader.unpack(_LEVEL)
+            run_count, = reader.unpack(_COUNT)
+            for _ in range(run_count):
+                x, y, size = reader.unpack(_RUN)
+                rooms.write_line(x, y, floor_level, reader.read(size).decode("latin-1"), 1)
+
+        floor_name_count, = reader.unpack(_COUNT)
+        for _ in range(floor_name_count):
+            floor_level, = reader.unpack(_LEVEL)
+            rooms.set_floor_name(floor_level, reader.read_name())
+
+        hallway_floor_count, = reader.unpack(_COUNT)
+        for _ in range(hallway_floor_count):
+            floor_level, = reader.unpack(_LEVEL)
+            hallway_count, = reader.unpack(_COUNT)
+            for _ in range(hallway_count):
+                location, = reader.unpack(_LEVEL)
+                rooms.set_hallway_name(location, floor_level, reader.read_name())
+
+        if not reader.is_done():
+            raise ImageError.bad_image("trailing data")
+        return rooms
+    except (struct.error, zlib.error, UnicodeDecodeError, RoomsError) as e:
+        raise ImageError.bad_image(str(e))
+
+
+def get_source_hash(handler: Handler) -> Optional[bytes]:
+    """
+    info: Hashes the name and data of a Handler.
+    :param handler: Handler
+    :return: Optional[bytes]
+        None if the Handler can't give its data before it is read.
+    """
+    source = handler.get_source()
+    if source is None:
+        return None
+    source_hash = hashlib.sha256()
+    for part in (handler.get_name(), source):
+        part = part.encode("utf-8", "surrogateescape")
+        source_hash.update(len(part).to_bytes(8, "little"))
+        source_hash.update(part)
+    return source_hash.digest()
+
+
+def get_image_key(handlers: Handlers) -> Optional[str]:
+    """
+    info: Gets the key an image of handlers is cached under.
+        Changes with the data of the main Handler, the image version and the backrooms version.
+        Included Handlers are checked against the sources kept in the image instead.
+    :param handlers: Handlers
+    :return: Optional[str]
+        None if the main Handler can't be hashed before it is read.
+    """
+    source_hash = get_source_hash(handlers.get_main())
+    if source_hash is None:
+        return None
+    version = f"{backrooms.MAJOR}.{backrooms.MINOR}.{backrooms.MAINTENANCE}:{IMAGE_VERSION}:{source_hash.hex()}"
+    return hashlib.sha256(version.encode()).hexdigest()
+
+
+def _is_current(handlers: Handlers,
+                sources: Sequence[Tuple[str, bytes]]) -> bool:
+    """
+    info: Checks that handlers would include the same sources again.
+    :param handlers: Handlers
+    :param sources: Sequence[Tuple[str, bytes]]
+    :return: bool
+    """
+    for name, source_hash in sources:
+        handler = handlers.find_include(name)
+        if handler is None or get_source_hash(handler) != source_hash:
+            return False
+    return True
+
+
+def cached_translator(handlers: Handlers,
+                      image_cache: str,
+                      floor_type: Type[Floor] = SparseFloor) -> Rooms:
+    """
+    info: Same as translator but keeps an image of the Rooms in image_cache.
+        Later calls with the same main Handler load the image if every Handler it included is unchanged.
+        Only the main Handler and the included Handlers are read to check an image.
+        A cache that can't be read or written is treated like a miss.
+    :param handlers: Handlers
+    :param image_cache: str
+        Dir images are kept in.
+    :param floor_type: Type[Floor]
+    :exception TranslatorError
+            raises TranslatorError if handlers give an invalid line.
+    :return: Rooms
+    """
+    image_key = get_image_key(handlers)
+    if image_key is None:
+        return translator(handlers, floor_type)
+    image_path = os.path.join(image_cache, image_key + IMAGE_FILE_EXTENSION)
+
+    try:
+        with open(image_path, "rb") as image_file:
+            image = image_file.read()
+        if _is_current(handlers, get_image_sources(image)):
+            return load_image(image, floor_type)
+    except (OSError, ImageError):
+        pass
+
+    rooms = translator(handlers, floor_type)
+    sources = []
+    for handler in handlers.get_included():
+        source_hash = get_source_hash(handler)
+        if source_hash is None:
+            # the image could never be checked
+            return rooms
+        sources.append((handler.get_name(), source_hash))
+    try:
+        os.makedirs(image_cache, exist_ok=True)
+        # write to a temp file first so a reader never sees half an image
+        temp_path = f"{image_path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as image_file:
+            image_file.write(dump_image(rooms, sources))
+        os.replace(temp_path, image_path)
+    except OSError:
+        pass
+    return rooms
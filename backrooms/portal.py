@@ -9,14 +9,16 @@ This script holds a simple portal "CPU".
 from collections import deque
 from pprint import pformat
 from string import ascii_letters, digits
-from typing import Dict, Generator, List, Optional, Tuple, Type, Union
+from typing import Callable, Generator, List, Optional, Tuple, Type, Union
 
 # backrooms
 from . import backrooms_error
 from . import whisper
-from .conscious import ALIVE, Conscious, HALT, ID
+from .blocks import BlockCompiler, MAX_BLOCK_LENGTH, MIN_BLOCK_LENGTH
+from .conscious import Conscious
 from .rooms import Rooms
 from .rules import CoreDump, RULES, Rule, WorkSpace
+from .sinks import ListSink, Sink, StreamSink
 
 VALID_INPUT_CHARACTERS = set(ascii_letters + digits + ",<.>/?;:'\"[{]}\\|`!@#$%^&*()-_=+ ")
 
@@ -81,12 +83,16 @@ class PortalError(backrooms_error.BackroomsError):
 
 
 class Feeder:
-    def __init__(self):
+    def __init__(self,
+                 on_input: Optional[Callable[[], None]] = None):
         """
         Makes a Feeder which gets an input from program.
+        :param on_input: Optional[Callable[[], None]]
+            Called each time an input is set.
         """
         self._need_input: bool = False
         self._input: Optional[str] = None
+        self._on_input: Optional[Callable[[], None]] = on_input
 
     def need_input(self) -> None:
         """
@@ -119,6 +125,8 @@ class Feeder:
         """
         self._input = user_input
         self._need_input = False
+        if self._on_input is not None:
+            self._on_input()
 
 
 class Portal:
@@ -135,7 +143,10 @@ class Portal:
                  error_on_no_rule: bool = False,
                  core_dump: bool = False,
                  yields: bool = False,
-                 rules: Optional[Union[Tuple[Type[Rule], ...], List[Type[Rule]]]] = None):
+                 rules: Optional[Union[Tuple[Type[Rule], ...], List[Type[Rule]]]] = None,
+                 compile_blocks: bool = False,
+                 quantum: int = 1,
+                 sinks: Optional[Union[Tuple[Sink, ...], List[Sink]]] = None):
         """
         info: Makes a Portal which executes Rules in Rooms.
         :param rooms: Rooms
@@ -151,6 +162,12 @@ class Portal:
         :param core_dump: bool
         :param yields: bool
         :param rules: Optional[Union[Tuple[Type[Rule], ...], List[Type[Rule]]]]
+        :param compile_blocks: bool
+            Runs runs of straight Rules as compiled Blocks when a conscious would run the whole Block in its turn.
+        :param quantum: int
+            Rules a conscious runs before the next conscious gets a turn.
+        :param sinks: Optional[Union[Tuple[Sink, ...], List[Sink]]]
+            Sinks given each output after the ones made for sys_output and catch_output.
         :exception PortalError
             raises PortalError if no gate could be found.
             raises PortalError if two or more Rules had a start charter conflict.
@@ -166,23 +183,42 @@ class Portal:
             consciouses = (Conscious(PC_Y=y, PC_FLOOR=floor, ID=0),)
 
         self._consciouses: deque = deque(consciouses)
+        self._quantum: int = max(quantum, 1)
+        # Rules the conscious at the front of the thread queue has left in its turn
+        self._quantum_left: int = self._quantum
+        # consciouses waiting on the ThreadLock and the turn they parked on, kept off the thread queue
+        self._parked: deque = deque()
+        # conscious that parked during the Rule being ran
+        self._parking: Optional[Conscious] = None
+        # turns ended while consciouses are parked
+        self._parked_turns: int = 0
+        self._park_count: int = 0
+        self._spins_avoided: int = 0
+        # consciouses waiting on the Feeder for input, kept off the thread queue
+        self._input_parked: deque = deque()
         self._lost_count: int = lost_count
         self._lost_rule_count: int = lost_rule_count
-        self._sys_output: bool = sys_output
         if inputs is not None:
             inputs = list(inputs[::-1])
         self._inputs: Optional[List[str]] = inputs
         if feeder:
-            feeder = Feeder()
+            feeder = Feeder(self._wake_on_input)
         else:
             feeder = None
         self._feeder: Optional[Feeder] = feeder
         if inputs is not None and feeder is not None:
             raise PortalError.multiple_inputs_methods()
-        self._catch_output: bool = catch_output
         self._catch_output_steam: List[object] = []
+        self._sinks: List[Sink] = []
+        if sys_output:
+            self._sinks.append(StreamSink())
+        if catch_output:
+            self._sinks.append(ListSink(self._catch_output_steam))
+        if sinks is not None:
+            self._sinks.extend(sinks)
         self._error_on_space: bool = error_on_space
         self._error_on_no_rule: bool = error_on_no_rule
+        self._yields: bool = yields
 
         work_space = WorkSpace()
 
@@ -192,14 +228,15 @@ class Portal:
         if core_dump:
             rules = list(rules) + [CoreDump]
         rules_obj = [rule(work_space=work_space, yields=yields) for rule in rules]
-        self._rules: Dict[str: Rule] = {}
+        # Rules indexed by the ord of there start character
+        self._rules: List[Optional[Rule]] = [None] * 256
 
         for rule in rules_obj:
-            if rule.get_start_character() in self._rules:
+            if self._rules[ord(rule.get_start_character())] is not None:
                 raise PortalError.start_character_collection(rule.get_start_character())
-            self._rules[rule.get_start_character()] = rule
+            self._rules[ord(rule.get_start_character())] = rule
 
-        used_ids = set(conscious[ID] for conscious in self._consciouses)
+        used_ids = set(conscious.id for conscious in self._consciouses)
         self._next_free_id = max(used_ids) + 1
         self._free_ids: set = set()
 
@@ -209,15 +246,66 @@ class Portal:
 
         self._rule_step_visuals: List[Tuple[int, int, int]] = []
 
+        self._block_compiler: Optional[BlockCompiler] = None
+        if compile_blocks:
+            # a Block has to fit in a turn to run while other consciouses are waiting
+            max_length = MAX_BLOCK_LENGTH if self._quantum < MIN_BLOCK_LENGTH else self._quantum
+            self._block_compiler = BlockCompiler(self._rules, error_on_space, error_on_no_rule, max_length)
+
     def __call__(self) -> None:
         """
         info: Will execute the program.
+            Rules are run directly unless steps are needed for yields, lost rule count or whisper.
+            Returns early if every conscious is waiting on the Feeder for input.
         :return: None
         """
-        for operation_generator in self:
-            for step in operation_generator:
-                if whisper.WHISPER_RUNNING:
-                    whisper.debug(f"Step: {step}")
+        try:
+            if self._needs_steps():
+                for operation_generator in self:
+                    for step in operation_generator:
+                        if whisper.WHISPER_RUNNING:
+                            whisper.debug(f"Step: {step}")
+            else:
+                while not self._done and (self._consciouses or not self._input_parked):
+                    self._rule_step_visuals.clear()
+                    if self._block_compiler is None or not self._run_block():
+                        self._run_rule_directly()
+        finally:
+            self.flush_output()
+
+    def run_rules(self, rule_count: int) -> bool:
+        """
+        info: Will execute at most rule_count Rules of the program.
+            A Block of straight Rules counts as a single Rule.
+            Lets a caller run a program in slices and check things like time between them.
+            Stops early if every conscious is waiting on the Feeder for input.
+        :param rule_count: int
+        :return: bool
+            True if the program is done running.
+        """
+        try:
+            if self._needs_steps():
+                while rule_count > 0 and not self._done and (self._consciouses or not self._input_parked):
+                    for step in next(self):
+                        if whisper.WHISPER_RUNNING:
+                            whisper.debug(f"Step: {step}")
+                    rule_count += -1
+            else:
+                while rule_count > 0 and not self._done and (self._consciouses or not self._input_parked):
+                    self._rule_step_visuals.clear()
+                    if self._block_compiler is None or not self._run_block():
+                        self._run_rule_directly()
+                    rule_count += -1
+        finally:
+            self.flush_output()
+        return self._done
+
+    def _needs_steps(self) -> bool:
+        """
+        info: Checks if Rules have to be stepped through instead of ran directly.
+        :return: bool
+        """
+        return self._yields or self._lost_rule_count > 0 or whisper.WHISPER_RUNNING
 
     def __iter__(self) -> 'Portal':
         """
@@ -229,9 +317,11 @@ class Portal:
     def __next__(self) -> Generator[int, None, None]:
         """
         info: Gives the Rule to be executed.
+            Stops while every conscious is waiting on the Feeder for input.
         :return: Generator[int, None, None]
         """
-        if self._done:
+        if self._done or self.is_awaiting_input():
+            self.flush_output()
             raise StopIteration()
         self._rule_step_visuals.clear()
         return self._run_rule()
@@ -245,20 +335,10 @@ class Portal:
             PortalError if space was read as a Rule.
         :return: Generator[int, None, None]
         """
-        # check if any consciouses remain
-        if not len(self._consciouses):
-            self._done = True
-            if whisper.WHISPER_RUNNING:
-                whisper.debug("HALT")
-        else:
-            # get next conscious
-            conscious = self._consciouses.popleft()
-            if whisper.WHISPER_RUNNING:
-                # whisper conscious location
-                whisper.info(f"{conscious[ID]} {conscious.at()}: {repr(self._rooms.read(*conscious.at()))}")
-                whisper.debug("Conscious:\n" + pformat(conscious))
+        conscious = self._start_rule()
+        if conscious is not None:
             # get rule
-            rule = self._rules.get(self._rooms.read(*conscious.at()))
+            rule = self._rules[ord(self._rooms.read(*conscious.at()))]
             self._rule_step_visuals.append(conscious.at())
             if rule is not None:
                 if whisper.WHISPER_RUNNING:
@@ -274,49 +354,160 @@ class Portal:
                         raise PortalError.lost_rule_count()
                     yield step
             else:
-                # whisper that no rule was found for charter
-                if whisper.WHISPER_RUNNING:
-                    whisper.debug("No rule found!")
-                if self._error_on_space and self._rooms.read(*conscious.at()) == " ":
-                    raise PortalError.error_on_space(*conscious.at())
-
-                if self._error_on_no_rule:
-                    raise PortalError.error_on_no_rule(*conscious.at())
-                conscious.step()
-            # check if conscious is still alive
-            if conscious[ALIVE]:
-                # add conscious back to thread queue
-                self._consciouses.append(conscious)
+                self._no_rule(conscious)
+            self._end_rule(conscious)
+
+    def _run_rule_directly(self) -> None:
+        """
+        info: Will execute a Rule without stepping through it.
+        :exception PortalError
+            PortalError if to many Rules where ran.
+            PortalError if space was read as a Rule.
+        :return: None
+        """
+        conscious = self._start_rule()
+        if conscious is not None:
+            at = conscious.at()
+            rule = self._rules[ord(self._rooms.read(*at))]
+            self._rule_step_visuals.append(at)
+            if rule is not None:
+                rule.run(self, self._rooms, conscious, at, self._rule_step_visuals)
             else:
-                if whisper.WHISPER_RUNNING:
-                    whisper.debug("not ALIVE")
-                # free conscious id
-                self._free_ids.add(conscious[ID])
-                while self._next_free_id - 1 in self._free_ids:
-                    self._free_ids.remove(self._next_free_id - 1)
-                    self._next_free_id += -1
-                # check if any consciouses remain
-                if not len(self._consciouses):
-                    # program is done running
-                    self._done = True
-                    if whisper.WHISPER_RUNNING:
-                        whisper.debug("HALT")
+                self._no_rule(conscious)
+            self._end_rule(conscious)
 
+    def _run_block(self) -> bool:
+        """
+        info: Will execute a Block of straight Rules for the next conscious.
+            Other consciouses must not get a turn in the middle of the Block.
+        :return: bool
+            False if no Block was ran.
+        """
+        if not self._consciouses:
+            return False
+        if self._quantum_left < MIN_BLOCK_LENGTH and len(self._consciouses) != 1:
+            # no Block fits in what is left of the turn
+            return False
+        conscious = self._consciouses[0]
+        block = self._block_compiler.get_block(self._rooms, conscious)
+        if block is None:
+            return False
+        rule_count = block.rule_count
+        if rule_count > self._quantum_left and len(self._consciouses) != 1:
+            return False
+        if self._lost_count > 0:
+            # leave the Rule that hits lost count to _run_rule_directly
+            if self._lost_count <= rule_count:
+                return False
+            self._lost_count += -rule_count
+        block.run(self, self._rooms, conscious, self._rule_step_visuals)
+        # use up the turn like running the Rules one by one would
+        if rule_count < self._quantum_left:
+            self._quantum_left += -rule_count
+        else:
+            rule_count += -self._quantum_left
+            self._quantum_left = self._quantum - rule_count % self._quantum
+            self._consciouses.rotate(-1)
+            if self._parked:
+                self._parked_turns += 1 + rule_count // self._quantum
+        return True
+
+    def _start_rule(self) -> Optional[Conscious]:
+        """
+        info: Gets the next conscious to run a Rule.
+        :return: Optional[Conscious]
+            None if no consciouses remain or they are all waiting for input.
+        """
+        # check if any consciouses remain
+        if not len(self._consciouses):
+            if self._input_parked:
+                return None
+            self._done = True
             if whisper.WHISPER_RUNNING:
-                whisper.debug(f"Step visuals: {self._rule_step_visuals}")
+                whisper.debug("HALT")
+            return None
+        # get next conscious
+        conscious = self._consciouses.popleft()
+        if whisper.WHISPER_RUNNING:
+            # whisper conscious location
+            whisper.info(f"{conscious.id} {conscious.at()}: {repr(self._rooms.read(*conscious.at()))}")
+            whisper.debug("Conscious:\n" + pformat(dict(conscious.items())))
+        return conscious
+
+    def _no_rule(self, conscious: Conscious) -> None:
+        """
+        info: Handles a conscious that landed on a character with no Rule.
+        :param conscious: Conscious
+        :exception PortalError
+            PortalError if space was read as a Rule.
+            PortalError if no Rule was found and error on no rule is set.
+        :return: None
+        """
+        # whisper that no rule was found for charter
+        if whisper.WHISPER_RUNNING:
+            whisper.debug("No rule found!")
+        if self._error_on_space and self._rooms.read(*conscious.at()) == " ":
+            raise PortalError.error_on_space(*conscious.at())
+
+        if self._error_on_no_rule:
+            raise PortalError.error_on_no_rule(*conscious.at())
+        conscious.step()
 
-            # check if conscious raised HALT
-            if conscious[HALT] and not self._done:
+    def _end_rule(self, conscious: Conscious) -> None:
+        """
+        info: Puts conscious back in the thread queue and checks if the program is done.
+        :param conscious: Conscious
+        :exception PortalError
+            PortalError if to many Rules where ran.
+        :return: None
+        """
+        # check if conscious parked
+        if self._parking is conscious:
+            self._parking = None
+            self._quantum_left = self._quantum
+        # check if conscious is still alive
+        elif conscious.alive:
+            if self._quantum_left > 1:
+                # let conscious keep running till its turn is used up
+                self._quantum_left += -1
+                self._consciouses.appendleft(conscious)
+            else:
+                # add conscious back to thread queue
+                self._quantum_left = self._quantum
+                self._consciouses.append(conscious)
+                if self._parked:
+                    self._parked_turns += 1
+        else:
+            self._quantum_left = self._quantum
+            if whisper.WHISPER_RUNNING:
+                whisper.debug("not ALIVE")
+            # free conscious id
+            self._free_ids.add(conscious.id)
+            while self._next_free_id - 1 in self._free_ids:
+                self._free_ids.remove(self._next_free_id - 1)
+                self._next_free_id += -1
+            # check if any consciouses remain
+            if not len(self._consciouses) and not self._input_parked:
                 # program is done running
                 self._done = True
                 if whisper.WHISPER_RUNNING:
                     whisper.debug("HALT")
 
-            # check if lost count has been hit
-            if self._lost_count > 0:
-                self._lost_count += -1
-                if not self._lost_count:
-                    raise PortalError.lost_count()
+        if whisper.WHISPER_RUNNING:
+            whisper.debug(f"Step visuals: {self._rule_step_visuals}")
+
+        # check if conscious raised HALT
+        if conscious.halt and not self._done:
+            # program is done running
+            self._done = True
+            if whisper.WHISPER_RUNNING:
+                whisper.debug("HALT")
+
+        # check if lost count has been hit
+        if self._lost_count > 0:
+            self._lost_count += -1
+            if not self._lost_count:
+                raise PortalError.lost_count()
 
     def is_done(self) -> bool:
         """
@@ -325,6 +516,13 @@ class Portal:
         """
         return self._done
 
+    def is_awaiting_input(self) -> bool:
+        """
+        info: Checks if program is idle till the Feeder is given input.
+        :return: bool
+        """
+        return not self._done and not self._consciouses and bool(self._input_parked)
+
     def get_rooms(self) -> Rooms:
         """
         info: Gets Rooms used by program.
@@ -335,9 +533,77 @@ class Portal:
     def get_consciouses(self) -> Tuple[Conscious, ...]:
         """
         info: Gets all running consciouses.
+            Consciouses parked on the ThreadLock and then ones waiting for input come last.
         :return: Tuple[Conscious, ...]
         """
-        return tuple(self._consciouses)
+        return tuple(self._consciouses) + tuple(conscious for conscious, _ in self._parked) + tuple(self._input_parked)
+
+    def park_conscious(self, conscious: Conscious) -> None:
+        """
+        info: Takes the conscious running a Rule off the thread queue till wake_conscious is called.
+            Used by ThreadLock so a conscious waiting on the lock does not spin.
+        :param conscious: Conscious
+        :return: None
+        """
+        if whisper.WHISPER_RUNNING:
+            whisper.debug(f"PARK {conscious.id}")
+        self._parking = conscious
+        self._parked.append((conscious, self._parked_turns))
+        self._park_count += 1
+
+    def wake_conscious(self) -> None:
+        """
+        info: Puts the conscious that has been parked the longest back on the thread queue.
+            Used when the ThreadLock is released.
+        :return: None
+        """
+        if self._parked:
+            conscious, parked_turn = self._parked.popleft()
+            if whisper.WHISPER_RUNNING:
+                whisper.debug(f"WAKE {conscious.id}")
+            # a spinning conscious would have used a whole turn each trip around all the consciouses
+            consciouses = len(self._consciouses) + len(self._parked) + 1
+            trips = -(-(self._parked_turns - parked_turn) // consciouses)
+            self._spins_avoided += trips * self._quantum
+            self._consciouses.append(conscious)
+
+    def park_on_input(self, conscious: Conscious) -> None:
+        """
+        info: Takes the conscious running a Rule off the thread queue till the Feeder is given input.
+            Used by Cite so a conscious waiting on the Feeder does not spin.
+        :param conscious: Conscious
+        :return: None
+        """
+        if whisper.WHISPER_RUNNING:
+            whisper.debug(f"PARK ON INPUT {conscious.id}")
+        self._parking = conscious
+        self._input_parked.append(conscious)
+
+    def _wake_on_input(self) -> None:
+        """
+        info: Puts the conscious that has waited the longest for input back on the thread queue.
+        :return: None
+        """
+        if self._input_parked:
+            conscious = self._input_parked.popleft()
+            if whisper.WHISPER_RUNNING:
+                whisper.debug(f"WAKE ON INPUT {conscious.id}")
+            self._consciouses.append(conscious)
+
+    def get_park_count(self) -> int:
+        """
+        info: Gets how many times a conscious was parked on the ThreadLock.
+        :return: int
+        """
+        return self._park_count
+
+    def get_spins_avoided(self) -> int:
+        """
+        info: Gets about how many Rules parked consciouses would have spent retrying the ThreadLock if they had spun.
+            Counts a turn for each trip around all the consciouses a conscious was parked for.
+        :return: int
+        """
+        return self._spins_avoided
 
     def new_conscious(self) -> Conscious:
         """
@@ -348,9 +614,9 @@ class Portal:
         if self._free_ids:
             free_id = min(self._free_ids)
             self._free_ids.remove(free_id)
-            new_conscious[ID] = free_id
+            new_conscious.id = free_id
         else:
-            new_conscious[ID] = self._next_free_id
+            new_conscious.id = self._next_free_id
             self._next_free_id += 1
         self._consciouses.append(new_conscious)
         return new_conscious
@@ -358,10 +624,13 @@ class Portal:
     def read_input(self) -> Optional[str]:
         """
         info: Gets input from Portal.
-        :return: str
+        :return: Optional[str]
+            None if the Feeder has no input yet.
         """
         data = ""
         if self._inputs is None and self._feeder is None:
+            # show what was written before waiting on the user
+            self.flush_output()
             data = input()
         elif self._inputs is not None:
             if self._inputs:
@@ -369,8 +638,12 @@ class Portal:
         else:
             data = self._feeder.get_input()
             if data is None:
+                self.flush_output()
                 self._feeder.need_input()
                 return data
+            if self._input_parked:
+                # more consciouses are still waiting for input
+                self._feeder.need_input()
 
         valid_data = ""
         for character in data:
@@ -384,11 +657,24 @@ class Portal:
         :param output: object
         :return: None
         """
-        if self._sys_output:
-            print(output, end="", flush=True)
+        for sink in self._sinks:
+            sink.write(output)
 
-        if self._catch_output:
-            self._catch_output_steam.append(output)
+    def add_sink(self, sink: Sink) -> None:
+        """
+        info: Adds a Sink that is given each output from now on.
+        :param sink: Sink
+        :return: None
+        """
+        self._sinks.append(sink)
+
+    def flush_output(self) -> None:
+        """
+        info: Flushes the Sinks.
+        :return: None
+        """
+        for sink in self._sinks:
+            sink.flush()
 
     def get_output_stream(self) -> List[object]:
         """
@@ -6,9 +6,11 @@ It holds the backrooms memory structure and everything need it for it to operate
 """
 
 # built-in
+from bisect import bisect_left, insort
 from functools import lru_cache
+from itertools import repeat
 from string import ascii_letters, digits
-from typing import Optional, Dict, Tuple, List, Set, Union
+from typing import Callable, Optional, Dict, Iterator, Tuple, List, Set, Type, Union
 
 # backrooms
 from .backrooms_error import BackroomsError
@@ -16,8 +18,14 @@ from . import whisper
 
 
 CHARACTER_SET = set([chr(character) for character in range(256)])
+CHARACTERS = tuple(chr(character) for character in range(256))
 NAME_SET = set(ascii_letters + digits + "_")
 
+# largest bounding box a DenseFloor will hold before it falls back to sparse cells
+DENSE_FLOOR_MAX_AREA = 1 << 22
+# smallest amount of cells a DenseFloor will grow by on a side
+DENSE_FLOOR_MIN_GROWTH = 8
+
 
 class RoomsError(BackroomsError):
     @classmethod
@@ -72,19 +80,403 @@ def _find_a_hallway_key(key: int) -> Union[int, float]:
     return key
 
 
-class Rooms:
+class Floor:
+    def __init__(self):
+        """
+        info: Storage backend for the cells of a single floor.
+            A cell that was never written holds " ".
+        """
+        # bumped by Rooms every time a cell is written
+        self.generation: int = 0
+
+    def read(self,
+             x: int,
+             y: int) -> str:
+        """
+        info: Reads a cell.
+        :param x: int
+        :param y: int
+        :return: str
+        """
+        raise NotImplementedError()
+
+    def write(self,
+              x: int,
+              y: int,
+              character: str) -> None:
+        """
+        info: Writes a character to a cell.
+            Character is expected to all ready be validated by Rooms.
+        :param x: int
+        :param y: int
+        :param character: str
+        :return: None
+        """
+        raise NotImplementedError()
+
+    def write_row(self,
+                  x: int,
+                  y: int,
+                  characters: str) -> None:
+        """
+        info: Writes characters to a row of cells from left to right.
+            Characters are expected to all ready be validated by Rooms.
+        :param x: int
+        :param y: int
+        :param characters: str
+        :return: None
+        """
+        for x, character in enumerate(characters, x):
+            self.write(x, y, character)
+
+    def copy(self) -> 'Floor':
+        """
+        info: Makes a copy of the Floor.
+        :return: Floor
+        """
+        raise NotImplementedError()
+
+    def get_cell_count(self) -> int:
+        """
+        info: Gets how many cells are being stored.
+        :return: int
+        """
+        raise NotImplementedError()
+
+    def get_cells(self) -> Iterator[Tuple[int, int, str]]:
+        """
+        info: Gets every cell that is not " " in no particular order.
+        :return: Iterator[Tuple[int, int, str]]
+        """
+        raise NotImplementedError()
+
+
+class SparseFloor(Floor):
     def __init__(self):
         """
+        info: Stores each cell in a dict keyed by its coordinates.
+        """
+        super(SparseFloor, self).__init__()
+        self._cells: Dict[Tuple[int, int], str] = {}
+
+    def read(self,
+             x: int,
+             y: int) -> str:
+        """
+        info: Reads a cell.
+        :param x: int
+        :param y: int
+        :return: str
+        """
+        return self._cells.get((x, y), " ")
+
+    def write(self,
+              x: int,
+              y: int,
+              character: str) -> None:
+        """
+        info: Writes a character to a cell.
+        :param x: int
+        :param y: int
+        :param character: str
+        :return: None
+        """
+        if character == " ":
+            # " " is the default character save space by removing the cell all together
+            if (x, y) in self._cells:
+                del self._cells[(x, y)]
+        else:
+            self._cells[(x, y)] = character
+
+    def write_row(self,
+                  x: int,
+                  y: int,
+                  characters: str) -> None:
+        """
+        info: Writes characters to a row of cells from left to right.
+        :param x: int
+        :param y: int
+        :param characters: str
+        :return: None
+        """
+        cells = self._cells
+        if " " in characters:
+            # " " is the default character so only cells that all ready exist need removing
+            if cells:
+                for space_x in [space_x for space_x, character in enumerate(characters, x) if character == " "]:
+                    cells.pop((space_x, y), None)
+            cells.update(((cell_x, y), character) for cell_x, character in enumerate(characters, x) if character != " ")
+        else:
+            cells.update(zip(zip(range(x, x + len(characters)), repeat(y)), characters))
+
+    def copy(self) -> 'SparseFloor':
+        """
+        info: Makes a copy of the Floor.
+        :return: SparseFloor
+        """
+        floor = SparseFloor()
+        floor._cells = self._cells.copy()
+        return floor
+
+    def get_cell_count(self) -> int:
+        """
+        info: Gets how many cells are being stored.
+        :return: int
+        """
+        return len(self._cells)
+
+    def get_cells(self) -> Iterator[Tuple[int, int, str]]:
+        """
+        info: Gets every cell that is not " " in no particular order.
+        :return: Iterator[Tuple[int, int, str]]
+        """
+        for (x, y), character in self._cells.items():
+            yield x, y, character
+
+
+class DenseFloor(Floor):
+    def __init__(self,
+                 max_area: int = DENSE_FLOOR_MAX_AREA):
+        """
+        info: Stores the bounding box of the written cells in a bytearray.
+            Cells that would grow the box past max_area are stored sparsely.
+        :param max_area: int
+        """
+        super(DenseFloor, self).__init__()
+        self._max_area: int = max_area
+        self._min_x: int = 0
+        self._min_y: int = 0
+        self._width: int = 0
+        self._height: int = 0
+        self._cells: bytearray = bytearray()
+        self._overflow: Dict[Tuple[int, int], str] = {}
+
+    def read(self,
+             x: int,
+             y: int) -> str:
+        """
+        info: Reads a cell.
+        :param x: int
+        :param y: int
+        :return: str
+        """
+        box_x = x - self._min_x
+        box_y = y - self._min_y
+        if 0 <= box_x < self._width and 0 <= box_y < self._height:
+            return CHARACTERS[self._cells[box_y * self._width + box_x]]
+        return self._overflow.get((x, y), " ")
+
+    def write(self,
+              x: int,
+              y: int,
+              character: str) -> None:
+        """
+        info: Writes a character to a cell.
+        :param x: int
+        :param y: int
+        :param character: str
+        :return: None
+        """
+        box_x = x - self._min_x
+        box_y = y - self._min_y
+        if 0 <= box_x < self._width and 0 <= box_y < self._height:
+            self._cells[box_y * self._width + box_x] = ord(character)
+        elif character == " ":
+            # " " is the default character save space by removing the cell all together
+            if (x, y) in self._overflow:
+                del self._overflow[(x, y)]
+        elif self._grow(x, y):
+            self._cells[(y - self._min_y) * self._width + x - self._min_x] = ord(character)
+        else:
+            self._overflow[(x, y)] = character
+
+    def write_row(self,
+                  x: int,
+                  y: int,
+                  characters: str) -> None:
+        """
+        info: Writes characters to a row of cells from left to right.
+            The box is grown once to hold the row then the row is copied in with a single slice.
+        :param x: int
+        :param y: int
+        :param characters: str
+        :return: None
+        """
+        row = characters.strip(" ")
+        if not row:
+            super(DenseFloor, self).write_row(x, y, characters)
+            return
+        lead = len(characters) - len(characters.lstrip(" "))
+        row_x = x + lead
+        end_x = row_x + len(row) - 1
+        for cell_x in (row_x, end_x):
+            box_x = cell_x - self._min_x
+            box_y = y - self._min_y
+            if not (0 <= box_x < self._width and 0 <= box_y < self._height) and not self._grow(cell_x, y):
+                # row does not fit in the box
+                super(DenseFloor, self).write_row(x, y, characters)
+                return
+        start = (y - self._min_y) * self._width + row_x - self._min_x
+        self._cells[start: start + len(row)] = row.encode("latin-1")
+        # spaces on the ends might be outside the box
+        for space_x in range(x, row_x):
+            self.write(space_x, y, " ")
+        for space_x in range(end_x + 1, x + len(characters)):
+            self.write(space_x, y, " ")
+
+    def copy(self) -> 'DenseFloor':
+        """
+        info: Makes a copy of the Floor.
+        :return: DenseFloor
+        """
+        floor = DenseFloor(self._max_area)
+        floor._min_x = self._min_x
+        floor._min_y = self._min_y
+        floor._width = self._width
+        floor._height = self._height
+        floor._cells = self._cells[:]
+        floor._overflow = self._overflow.copy()
+        return floor
+
+    def get_cell_count(self) -> int:
+        """
+        info: Gets how many cells are being stored.
+            Cells in the bounding box only count if they are not " ".
+        :return: int
+        """
+        return len(self._cells) - self._cells.count(b" ") + len(self._overflow)
+
+    def get_cells(self) -> Iterator[Tuple[int, int, str]]:
+        """
+        info: Gets every cell that is not " " in no particular order.
+        :return: Iterator[Tuple[int, int, str]]
+        """
+        for at, character in enumerate(self._cells):
+            if character != 32:
+                yield self._min_x + at % self._width, self._min_y + at // self._width, CHARACTERS[character]
+        for (x, y), character in self._overflow.items():
+            yield x, y, character
+
+    def _grow(self,
+              x: int,
+              y: int) -> bool:
+        """
+        info: Grows the bounding box so it holds the cell.
+            The box grows with some slack so a run of writes does not rebuild it every time.
+        :param x: int
+        :param y: int
+        :return: bool
+            False if the box would be larger than max_area.
+        """
+        # smallest box that holds the old box and the cell
+        if self._width:
+            min_x = min(x, self._min_x)
+            max_x = max(x, self._min_x + self._width - 1)
+            min_y = min(y, self._min_y)
+            max_y = max(y, self._min_y + self._height - 1)
+        else:
+            min_x, max_x, min_y, max_y = x, x, y, y
+
+        # add slack on the sides that grew
+        slack_x = max(DENSE_FLOOR_MIN_GROWTH, self._width // 2)
+        slack_y = max(DENSE_FLOOR_MIN_GROWTH, self._height // 2)
+        padded_min_x = min_x - slack_x if not self._width or x < self._min_x else min_x
+        padded_max_x = max_x + slack_x if not self._width or x >= self._min_x + self._width else max_x
+        padded_min_y = min_y - slack_y if not self._height or y < self._min_y else min_y
+        padded_max_y = max_y + slack_y if not self._height or y >= self._min_y + self._height else max_y
+
+        if (padded_max_x - padded_min_x + 1) * (padded_max_y - padded_min_y + 1) <= self._max_area:
+            min_x, max_x, min_y, max_y = padded_min_x, padded_max_x, padded_min_y, padded_max_y
+        elif (max_x - min_x + 1) * (max_y - min_y + 1) > self._max_area:
+            return False
+        width = max_x - min_x + 1
+        height = max_y - min_y + 1
+
+        # move old box into the new box row by row
+        cells = bytearray(b" ") * (width * height)
+        shift_x = self._min_x - min_x
+        for row in range(self._height):
+            start = (row + self._min_y - min_y) * width + shift_x
+            cells[start: start + self._width] = self._cells[row * self._width: (row + 1) * self._width]
+        self._cells = cells
+        self._min_x, self._min_y, self._width, self._height = min_x, min_y, width, height
+
+        # pull sparse cells that now fit into the box
+        for cell_x, cell_y in list(self._overflow):
+            box_x = cell_x - min_x
+            box_y = cell_y - min_y
+            if 0 <= box_x < width and 0 <= box_y < height:
+                character = self._overflow.pop((cell_x, cell_y))
+                if character != " ":
+                    cells[box_y * width + box_x] = ord(character)
+        return True
+
+
+class Watcher:
+    __slots__ = ("min_x", "min_y", "max_x", "max_y", "callback", "alive")
+
+    def __init__(self,
+                 min_x: int,
+                 min_y: int,
+                 max_x: int,
+                 max_y: int,
+                 callback: Callable[[], None]):
+        """
+        info: Makes a one shot Watcher over a box of cells on a floor.
+        :param min_x: int
+        :param min_y: int
+        :param max_x: int
+        :param max_y: int
+        :param callback: Callable[[], None]
+            Called once the first time a cell in the box might have changed.
+        """
+        self.min_x: int = min_x
+        self.min_y: int = min_y
+        self.max_x: int = max_x
+        self.max_y: int = max_y
+        self.callback: Callable[[], None] = callback
+        self.alive: bool = True
+
+    def fire(self) -> None:
+        """
+        info: Calls callback if Watcher has not fired yet.
+        :return: None
+        """
+        if self.alive:
+            self.alive = False
+            self.callback()
+
+
+class Rooms:
+    def __init__(self,
+                 floor_type: Type[Floor] = SparseFloor):
+        """
         info: 3D memory structure that stores a single ASCII letter in a cell.
+        :param floor_type: Type[Floor]
+            Storage backend used for each floor.
         """
-        self._floors: Dict[int: Dict[Tuple[int, int]], str] = {}
+        self._floor_type: Type[Floor] = floor_type
+        self._floors: Dict[int, Floor] = {}
         self._floor_levels_to_names: Dict[int, str] = {}
         self._floors_names_to_levels: Dict[str, int] = {}
+        # generation of each floor not counting writes to its current Floor
+        self._generations: Dict[int, int] = {}
+        # Watchers bucketed by floor level then row
+        self._watchers: Dict[int, Dict[int, List[Watcher]]] = {}
+        # writes are only tracked once something asks for a generation or adds a Watcher
+        self._tracking: bool = False
 
+        # hallway locations of each floor sorted from smallest to largest
         self._hallways: Dict[int, List[int]] = {}
-        self._hallways_set: Dict[int: Set[int]] = {}
+        self._hallways_set: Dict[int, Set[int]] = {}
         self._hallway_locations_to_names: Dict[int, Dict[int, str]] = {}
         self._hallway_names_to_locations: Dict[int, Dict[str, int]] = {}
+        # floors with hallway names sorted out from 0, None until find_a_hallway needs it
+        self._hallway_floor_order: Optional[List[int]] = None
+        # results of find_a_hallway until a hallway is added or removed
+        self._found_hallways: Dict[str, Optional[Tuple[int, int]]] = {}
+        # bumped every time a hallway, hallway name or floor name changes
+        self._hallway_generation: int = 0
 
     def read(self,
              x: int,
@@ -97,7 +489,10 @@ class Rooms:
         :param floor_level: int
         :return: str
         """
-        return self._floors.get(floor_level, {}).setdefault((x, y), " ")
+        floor = self._floors.get(floor_level)
+        if floor is None:
+            return " "
+        return floor.read(x, y)
 
     def write(self,
               x: int,
@@ -120,12 +515,49 @@ class Rooms:
                 whisper.critical(f"{repr(character)} was attempted to be written at {(x, y, floor_level)}!")
             raise RoomsError.bad_character(character)
 
-        if character == " ":
-            # " " is the default character save space by removing the cell all together
-            if (x, y) in self._floors.setdefault(floor_level, {}):
-                del self._floors[floor_level][(x, y)]
-        else:
-            self._floors.setdefault(floor_level, {})[(x, y)] = character
+        floor = self._floors.get(floor_level)
+        if floor is None:
+            floor = self._floors[floor_level] = self._floor_type()
+        floor.write(x, y, character)
+        if self._tracking:
+            floor.generation += 1
+            rows = self._watchers.get(floor_level)
+            if rows is not None and y in rows:
+                self._fire_watchers(x, x, y, rows, floor_level)
+
+    def write_row(self,
+                  x: int,
+                  y: int,
+                  floor_level: int,
+                  characters: str) -> None:
+        """
+        info: Writes characters to a row of memory cells from left to right in one operation.
+        :param x: int
+        :param y: int
+        :param floor_level: int
+        :param characters: str
+        :exception RoomsError
+            raises RoomsError if a bad character is given.
+        :return: None
+        """
+        try:
+            characters.encode("latin-1")
+        except UnicodeEncodeError:
+            # write cell by cell so everything before the bad character is written before RoomsError is raised
+            for x, character in enumerate(characters, x):
+                self.write(x, y, floor_level, character)
+
+        if not characters:
+            return
+        floor = self._floors.get(floor_level)
+        if floor is None:
+            floor = self._floors[floor_level] = self._floor_type()
+        floor.write_row(x, y, characters)
+        if self._tracking:
+            floor.generation += 1
+            rows = self._watchers.get(floor_level)
+            if rows is not None and y in rows:
+                self._fire_watchers(x, x + len(characters) - 1, y, rows, floor_level)
 
     def write_line(self,
                    x: int,
@@ -149,12 +581,162 @@ class Rooms:
             raises RoomsError if a bad character is given.
         :return: None
         """
+        if vector_x == 1 and not vector_y and not vector_floor_level:
+            self.write_row(x, y, floor_level, characters)
+            return
         for character in characters:
             self.write(x, y, floor_level, character)
             x += vector_x
             y += vector_y
             floor_level += vector_floor_level
 
+    def get_cell_count(self,
+                       floor_level: int) -> int:
+        """
+        info: Gets how many cells are being stored for a floor.
+        :param floor_level: int
+        :return: int
+        """
+        floor = self._floors.get(floor_level)
+        if floor is None:
+            return 0
+        return floor.get_cell_count()
+
+    def get_generation(self,
+                       floor_level: int) -> int:
+        """
+        info: Gets the generation of a floor.
+            The generation changes every time a cell on the floor is written or the floor is removed.
+        :param floor_level: int
+        :return: int
+        """
+        self._tracking = True
+        generation = self._generations.get(floor_level, 0)
+        floor = self._floors.get(floor_level)
+        if floor is None:
+            return generation
+        return generation + floor.generation
+
+    def is_tracking(self) -> bool:
+        """
+        info: Checks if writes are being tracked for generations and watchers.
+            Tracking starts the first time a generation is read or a watcher is added.
+        :return: bool
+        """
+        return self._tracking
+
+    def add_watcher(self,
+                    floor_level: int,
+                    min_x: int,
+                    min_y: int,
+                    max_x: int,
+                    max_y: int,
+                    callback: Callable[[], None]) -> Watcher:
+        """
+        info: Calls callback once the first time a cell in the box is written or its floor is removed or replaced.
+        :param floor_level: int
+        :param min_x: int
+        :param min_y: int
+        :param max_x: int
+        :param max_y: int
+        :param callback: Callable[[], None]
+        :return: Watcher
+        """
+        self._tracking = True
+        watcher = Watcher(min_x, min_y, max_x, max_y, callback)
+        rows = self._watchers.setdefault(floor_level, {})
+        for y in range(min_y, max_y + 1):
+            rows.setdefault(y, []).append(watcher)
+        return watcher
+
+    def _fire_watchers(self,
+                       min_x: int,
+                       max_x: int,
+                       y: int,
+                       rows: Dict[int, List[Watcher]],
+                       floor_level: int) -> None:
+        """
+        info: Fires the Watchers that hold a cell between min_x and max_x on a row.
+        :param min_x: int
+        :param max_x: int
+        :param y: int
+        :param rows: Dict[int, List[Watcher]]
+            Watchers of the floor bucketed by row.
+        :param floor_level: int
+        :return: None
+        """
+        watchers = rows[y]
+        fired = [watcher for watcher in watchers
+                 if not watcher.alive or (watcher.min_x <= max_x and min_x <= watcher.max_x)]
+        if not fired:
+            return
+        if len(fired) == len(watchers):
+            del rows[y]
+            if not rows:
+                del self._watchers[floor_level]
+        else:
+            rows[y] = [watcher for watcher in watchers
+                       if watcher.alive and not (watcher.min_x <= max_x and min_x <= watcher.max_x)]
+        for watcher in fired:
+            watcher.fire()
+
+    def _fire_floor_watchers(self,
+                             floor_level: int) -> None:
+        """
+        info: Fires every Watcher on a floor.
+        :param floor_level: int
+        :return: None
+        """
+        rows = self._watchers.pop(floor_level, None)
+        if rows is not None:
+            for watchers in rows.values():
+                for watcher in watchers:
+                    watcher.fire()
+
+    def get_floor(self,
+                  floor_level: int) -> Optional[Floor]:
+        """
+        info: Gets the Floor storing the cells of a floor.
+            The Floor should only be read, writes must go through Rooms.
+        :param floor_level: int
+        :return: Optional[Floor]
+            None if no cell of the floor was ever written.
+        """
+        return self._floors.get(floor_level)
+
+    def get_floor_levels(self) -> Tuple[int, ...]:
+        """
+        info: Gets every floor level that has a Floor.
+        :return: Tuple[int, ...]
+        """
+        return tuple(self._floors)
+
+    def get_floor_names(self) -> Dict[int, str]:
+        """
+        info: Gets the name of every named floor.
+        :return: Dict[int, str]
+        """
+        return self._floor_levels_to_names.copy()
+
+    def get_hallways(self) -> Dict[int, Tuple[Tuple[int, Optional[str]], ...]]:
+        """
+        info: Gets the location and name of every hallway on every floor.
+        :return: Dict[int, Tuple[Tuple[int, Optional[str]], ...]]
+            Hallways of each floor sorted from smallest to largest location.
+        """
+        hallways = {}
+        for floor_level, locations in self._hallways.items():
+            names = self._hallway_locations_to_names.get(floor_level, {})
+            hallways[floor_level] = tuple((location, names.get(location)) for location in locations)
+        return hallways
+
+    def get_floor_type(self) -> Type[Floor]:
+        """
+        info: Gets the storage backend used for each floor.
+        :return: Type[Floor]
+        """
+        return self._floor_type
+
     def set_floor_name(self,
                        floor_level: int,
                        floor_name: Optional[str] = None) -> None:
@@ -173,6 +755,7 @@ class Rooms:
                 # remove floor name
                 del self._floors_names_to_levels[self._floor_levels_to_names[floor_level]]
                 del self._floor_levels_to_names[floor_level]
+                self._hallways_changed()
         elif is_name(floor_name):
             # check if name is in use
             if floor_name in self._floors_names_to_levels:
@@ -181,6 +764,7 @@ class Rooms:
             # add floor name
             self._floor_levels_to_names[floor_level] = floor_name
             self._floors_names_to_levels[floor_name] = floor_level
+            self._hallways_changed()
         else:
             # bad name
             if whisper.WHISPER_RUNNING:
@@ -225,21 +809,20 @@ class Rooms:
                 # remove hallway that shares same name
                 if old_hallway_y is not None:
                     self.remove_hallway(old_hallway_y, floor_level)
-            # find location in hallway list to add new hallway
-            hallway_block_in_at = self._find_hallway_at(y, floor_level)
-            if hallway_block_in_at is None:
-                hallway_block_in_at = -1
             # update hallway structures
-            self._hallways.setdefault(floor_level, []).insert(hallway_block_in_at + 1, y)
-            self._hallways_set.setdefault(floor_level, set()).add(y)
+            hallways_set = self._hallways_set.setdefault(floor_level, set())
+            if y not in hallways_set:
+                insort(self._hallways.setdefault(floor_level, []), y)
+                hallways_set.add(y)
+            old_hallway_name = self._hallway_locations_to_names.get(floor_level, {}).get(y)
+            # remove old hallway name if replaced
+            if old_hallway_name is not None:
+                del self._hallway_locations_to_names[floor_level][y]
+                del self._hallway_names_to_locations[floor_level][old_hallway_name]
             if hallway_name is not None:
                 self._hallway_locations_to_names.setdefault(floor_level, {})[y] = hallway_name
                 self._hallway_names_to_locations.setdefault(floor_level, {})[hallway_name] = y
-            # remove old hallway name if replaced by a None hallway
-            elif y in self._hallway_locations_to_names.setdefault(floor_level, {}):
-                old_hallway_name = self._hallway_locations_to_names[floor_level][y]
-                del self._hallway_locations_to_names[floor_level][y]
-                del self._hallway_names_to_locations[floor_level][old_hallway_name]
+            self._hallways_changed()
         else:
             # bad name
             if whisper.WHISPER_RUNNING:
@@ -256,16 +839,16 @@ class Rooms:
         :return: None
         """
         # remove hallway
-        if y in self._hallways_set.setdefault(floor_level, set()):
-            # find hallway location
-            hallway_block_at = self._find_hallway_at(y, floor_level)
+        if y in self._hallways_set.get(floor_level, ()):
             # update hallway structures
-            del self._hallways[floor_level][hallway_block_at]
+            hallways = self._hallways[floor_level]
+            del hallways[bisect_left(hallways, y)]
             self._hallways_set[floor_level].remove(y)
-            hallway_name = self._hallway_locations_to_names[floor_level].get(y)
+            hallway_name = self._hallway_locations_to_names.get(floor_level, {}).get(y)
             if hallway_name is not None:
                 del self._hallway_locations_to_names[floor_level][y]
                 del self._hallway_names_to_locations[floor_level][hallway_name]
+            self._hallways_changed()
 
     def get_hallway_name(self,
                          y: int,
@@ -276,7 +859,7 @@ class Rooms:
         :param floor_level: int
         :return: Optional[str]
         """
-        return self._hallway_locations_to_names.setdefault(floor_level, {}).get(y)
+        return self._hallway_locations_to_names.get(floor_level, {}).get(y)
 
     def get_hallway_location(self,
                              floor_level: int,
@@ -287,7 +870,7 @@ class Rooms:
         :param hallway_name: str
         :return: Optional[int]
         """
-        return self._hallway_names_to_locations.setdefault(floor_level, {}).get(hallway_name)
+        return self._hallway_names_to_locations.get(floor_level, {}).get(hallway_name)
 
     def get_next_hallway_location(self,
                                   hallway_location: int,
@@ -301,9 +884,9 @@ class Rooms:
         hallway_at = self._find_hallway_at(hallway_location, floor_level)
         # check that hallway exists
         if hallway_at is not None:
-            hallway_at -= 1
+            hallway_at += 1
             # check that next hallway exists
-            if hallway_at != -1:
+            if hallway_at != len(self._hallways[floor_level]):
                 return self._hallways[floor_level][hallway_at]
 
     def get_past_hallway_location(self,
@@ -318,9 +901,9 @@ class Rooms:
         hallway_at = self._find_hallway_at(hallway_location, floor_level)
         # check that hallway exists
         if hallway_at is not None:
-            hallway_at += 1
+            hallway_at -= 1
             # check that past hallway exists
-            if hallway_at != len(self._hallways[floor_level]):
+            if hallway_at != -1:
                 return self._hallways[floor_level][hallway_at]
 
     def find_hallway_location(self,
@@ -345,43 +928,18 @@ class Rooms:
         :param floor_level: int
         :return: Optional[int]
         """
-        hallways = self._hallways.setdefault(floor_level, [])
+        hallways = self._hallways.get(floor_level)
 
         # check that hallways is not empty
         if not hallways:
             return
 
-        # check that coordinates is not in front of all hallways
-        if y > hallways[0]:
-            return
-
-        # check that coordinates is not in the last hallway
-        if hallways[-1] >= y:
-            return len(hallways) - 1
-
-        block_start = 0
-        block_end = len(hallways) - 1
-
         # Big-O(log n)
-        # find last hallway that greater than equal to y
-        while True:
-            # find the middle of block
-            at = block_start + (block_end - block_start)//2
-            hallway_location = hallways[at]
-            # hallway is behind coordinates
-            if hallway_location < y:
-                # remove back half of block
-                block_end = at
-            # hallway is in font of coordinates
-            elif hallway_location > y:
-                # last hallway is not in front of coordinates
-                if y > hallways[at + 1]:
-                    return at
-                # remove first half of block
-                block_start = at
-            # coordinates is a hallway coordinates
-            else:
-                return at
+        # find first hallway that greater than equal to y
+        at = bisect_left(hallways, y)
+        # check that coordinates is not in front of all hallways
+        if at != len(hallways):
+            return at
 
     def remove_floor(self,
                      floor_level: int) -> None:
@@ -394,16 +952,25 @@ class Rooms:
         # remove floor data
         if floor_name is not None:
             del self._floors_names_to_levels[floor_name]
+            self._hallways_changed()
 
         if floor_level in self._floor_levels_to_names:
             del self._floor_levels_to_names[floor_level]
 
         if floor_level in self._floors:
+            # read the generation directly so removing a floor does not turn on tracking
+            self._generations[floor_level] = (self._generations.get(floor_level, 0)
+                                              + self._floors[floor_level].generation + 1)
             del self._floors[floor_level]
+        self._fire_floor_watchers(floor_level)
 
         # remove hallway data
         if floor_level in self._hallways:
             del self._hallways[floor_level]
+            self._hallways_changed()
+
+        if floor_level in self._hallways_set:
+            del self._hallways_set[floor_level]
 
         if floor_level in self._hallway_names_to_locations:
             del self._hallway_names_to_locations[floor_level]
@@ -420,22 +987,54 @@ class Rooms:
         :param floor_level_to: int
         :return: None
         """
+        self.copy_floor(self, floor_level_from, floor_level_to)
+
+    def copy_floor(self,
+                   rooms_from: 'Rooms',
+                   floor_level_from: int,
+                   floor_level_to: int) -> None:
+        """
+        info: Copies a floor of rooms_from onto a floor and everything associated with it except the floor name.
+        :param rooms_from: Rooms
+            Can be this Rooms. Its floors must be the same type as the floors of this Rooms.
+        :param floor_level_from: int
+        :param floor_level_to: int
+        :return: None
+        """
         # make sure "to" floor is fully removed
         self.remove_floor(floor_level_to)
 
-        # duplicate floor data
-        if floor_level_from in self._floors:
-            self._floors[floor_level_to] = self._floors[floor_level_from].copy()
+        # copy floor data
+        if floor_level_from in rooms_from._floors:
+            self._floors[floor_level_to] = rooms_from._floors[floor_level_from].copy()
+            self._generations[floor_level_to] = self._generations.get(floor_level_to, 0) + 1
+
+        # copy hallway data
+        if floor_level_from in rooms_from._hallways:
+            self._hallways[floor_level_to] = rooms_from._hallways[floor_level_from].copy()
+            self._hallways_changed()
 
-        # duplicate hallway data
-        if floor_level_from in self._hallways:
-            self._hallways[floor_level_to] = self._hallways[floor_level_from].copy()
+        if floor_level_from in rooms_from._hallways_set:
+            self._hallways_set[floor_level_to] = rooms_from._hallways_set[floor_level_from].copy()
 
-        if floor_level_from in self._hallway_names_to_locations:
-            self._hallway_names_to_locations[floor_level_to] = self._hallway_names_to_locations[floor_level_from].copy()
+        if floor_level_from in rooms_from._hallway_names_to_locations:
+            self._hallway_names_to_locations[floor_level_to] = \
+                rooms_from._hallway_names_to_locations[floor_level_from].copy()
 
-        if floor_level_from in self._hallway_locations_to_names:
-            self._hallway_locations_to_names[floor_level_to] = self._hallway_locations_to_names[floor_level_from].copy()
+        if floor_level_from in rooms_from._hallway_locations_to_names:
+            self._hallway_locations_to_names[floor_level_to] = \
+                rooms_from._hallway_locations_to_names[floor_level_from].copy()
+
+    def is_floor_used(self,
+                      floor_level: int) -> bool:
+        """
+        info: Checks if a floor has cells, hallways or a name.
+        :param floor_level: int
+        :return: bool
+        """
+        return (floor_level in self._floors
+                or bool(self._hallways.get(floor_level))
+                or floor_level in self._floor_levels_to_names)
 
     def find_a_hallway(self,
                        hallway_name: str) -> Optional[Tuple[int, int]]:
@@ -445,6 +1044,31 @@ class Rooms:
         :param hallway_name: str
         :return: Optional[Tuple[int, int]]
         """
-        for floor in sorted(self._hallway_names_to_locations, key=_find_a_hallway_key):
-            if hallway_name in self._hallway_names_to_locations[floor]:
-                return self._hallway_names_to_locations[floor][hallway_name], floor
+        if hallway_name in self._found_hallways:
+            return self._found_hallways[hallway_name]
+        if self._hallway_floor_order is None:
+            self._hallway_floor_order = sorted(self._hallway_names_to_locations, key=_find_a_hallway_key)
+        found_hallway = None
+        for floor in self._hallway_floor_order:
+            hallway_y = self._hallway_names_to_locations[floor].get(hallway_name)
+            if hallway_y is not None:
+                found_hallway = hallway_y, floor
+                break
+        self._found_hallways[hallway_name] = found_hallway
+        return found_hallway
+
+    def get_hallway_generation(self) -> int:
+        """
+        info: Gets a number that changes every time a hallway, hallway name or floor name changes.
+        :return: int
+        """
+        return self._hallway_generation
+
+    def _hallways_changed(self) -> None:
+        """
+        info: Bumps the hallway generation and drops the floor order and found hallways used by find_a_hallway.
+        :return: None
+        """
+        self._hallway_generation += 1
+        self._hallway_floor_order = None
+        self._found_hallways.clear()
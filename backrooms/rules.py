@@ -3,19 +3,19 @@ Copyright 2021 Charles McMarrow
 """
 
 # built-in
-from typing import Generator, Tuple, List, Dict, Union, Optional, Callable, Type
+from typing import Any, Dict, Generator, Tuple, List, Set, Union, Optional, Callable, Type
 from copy import deepcopy
 import string
 from pprint import pformat
-from functools import lru_cache
+from functools import lru_cache, partial
 
 # backrooms
 import backrooms    # import backrooms to avoid circular imports
 from .backrooms_error import BackroomsError
 from . import conscious as c
 from .conscious import _to_int
-from .rooms import Rooms, RoomsError
-from .stack import StackFrame, StackBottom
+from .rooms import Rooms, RoomsError, is_character
+from .stack import Stack, StackFrame, StackBottom
 from . import whisper
 
 
@@ -64,6 +64,12 @@ def _cast_string(obj: Union[int, str, StackFrame, StackBottom, None]) -> str:
     return obj
 
 
+# longest string literal the block compiler will look through
+MAX_STRAIGHT_WIDTH = 1024
+# call sites a CallSiteCache holds before it starts over
+MAX_CALL_SITES = 4096
+
+
 def _read(rooms: Rooms,
           conscious: c.Conscious,
           yields: bool,
@@ -87,7 +93,7 @@ def _read(rooms: Rooms,
                 if yields:
                     yield
             try:
-                conscious[c.WORK_STACK].push(int(new_integer))
+                conscious.work_stack.push(int(new_integer))
             except ValueError:
                 pass
     elif type_item == "s":
@@ -106,23 +112,267 @@ def _read(rooms: Rooms,
             rule_step_visuals.append(conscious.at())
             conscious.step()
             yield
-        conscious[c.WORK_STACK].push(new_string)
+        conscious.work_stack.push(new_string)
         rule_step_visuals.append(conscious.at())
         conscious.step()
     elif type_item == "n":
         rule_step_visuals.append(conscious.at())
         conscious.step()
-        conscious[c.WORK_STACK].push(None)
+        conscious.work_stack.push(None)
     elif type_item == "f":
         rule_step_visuals.append(conscious.at())
         conscious.step()
-        conscious[c.WORK_STACK].push(StackFrame)
+        conscious.work_stack.push(StackFrame)
+
+
+def _get_read_width(rooms: Rooms,
+                    x: int,
+                    y: int,
+                    floor: int,
+                    vector_x: int,
+                    vector_y: int) -> int:
+    """
+    info: Gets how many cells _read would step over starting at (x, y, floor).
+        Gives up on strings longer then MAX_STRAIGHT_WIDTH.
+    :param rooms: Rooms
+    :param x: int
+    :param y: int
+    :param floor: int
+    :param vector_x: int
+    :param vector_y: int
+    :return: int
+    """
+    type_item = rooms.read(x, y, floor)
+    if type_item == "i":
+        width = 1
+        if rooms.read(x + vector_x * width, y + vector_y * width, floor) in string.digits + "+-":
+            width += 1
+            while rooms.read(x + vector_x * width, y + vector_y * width, floor).isdigit():
+                width += 1
+        return width
+    elif type_item == "s":
+        start_character = rooms.read(x + vector_x, y + vector_y, floor)
+        width = 2
+        while rooms.read(x + vector_x * width, y + vector_y * width, floor) != start_character:
+            width += 1
+            if width > MAX_STRAIGHT_WIDTH:
+                return -1
+        return width + 1
+    elif type_item in ("n", "f"):
+        return 1
+    return 0
+
+
+def _decode_literal(rooms: Rooms,
+                    x: int,
+                    y: int,
+                    floor: int,
+                    vector_x: int,
+                    vector_y: int) -> Tuple[bool, Any, int]:
+    """
+    info: Decodes the literal _read would read starting at (x, y, floor) without stepping a Conscious.
+    :param rooms: Rooms
+    :param x: int
+    :param y: int
+    :param floor: int
+    :param vector_x: int
+    :param vector_y: int
+    :return: Tuple[bool, Any, int]
+        If a value is pushed, the value and how many cells _read steps over.
+    """
+    type_item = rooms.read(x, y, floor)
+    if type_item == "i":
+        width = 1
+        digits = []
+        character = rooms.read(x + vector_x, y + vector_y, floor)
+        if character in string.digits + "+-":
+            while True:
+                digits.append(character)
+                width += 1
+                character = rooms.read(x + vector_x * width, y + vector_y * width, floor)
+                if not character.isdigit():
+                    break
+            try:
+                return True, int("".join(digits)), width
+            except ValueError:
+                pass
+        return False, None, width
+    elif type_item == "s":
+        start_character = rooms.read(x + vector_x, y + vector_y, floor)
+        width = 2
+        characters = []
+        character = rooms.read(x + vector_x * width, y + vector_y * width, floor)
+        while character != start_character:
+            characters.append(character)
+            width += 1
+            character = rooms.read(x + vector_x * width, y + vector_y * width, floor)
+        return True, "".join(characters), width + 1
+    elif type_item == "n":
+        return True, None, 1
+    elif type_item == "f":
+        return True, StackFrame, 1
+    return False, None, 0
+
+
+class LiteralCache:
+    def __init__(self):
+        """
+        info: Caches literals read by _read keyed by start cell and vector.
+            A literal is dropped once a cell it covers is written.
+        """
+        self._rooms: Optional[Rooms] = None
+        self._literals: Dict[Tuple[int, int, int, int, int],
+                             Tuple[bool, Any, int, Tuple[Tuple[int, int, int], ...]]] = {}
+
+    def read(self,
+             rooms: Rooms,
+             conscious: c.Conscious,
+             rule_step_visuals: List[Tuple[int, int, int]]) -> None:
+        """
+        info: Same as draining _read but decodes each literal only once.
+        :param rooms: Rooms
+        :param conscious: Conscious
+        :param rule_step_visuals: List[Tuple[int, int, int]]
+        :return: None
+        """
+        if conscious.pc_v_floor:
+            for _ in _read(rooms, conscious, False, rule_step_visuals):
+                pass
+            return
+        if rooms is not self._rooms:
+            self._rooms = rooms
+            self._literals = {}
+        key = (conscious.pc_x, conscious.pc_y, conscious.pc_floor, conscious.pc_v_x, conscious.pc_v_y)
+        literal = self._literals.get(key)
+        if literal is None:
+            literal = self._add_literal(rooms, *key)
+        pushes, value, width, visuals = literal
+        if pushes:
+            conscious.work_stack.push(value)
+        rule_step_visuals.extend(visuals)
+        conscious.pc_x += conscious.pc_v_x * width
+        conscious.pc_y += conscious.pc_v_y * width
+
+    def _add_literal(self,
+                     rooms: Rooms,
+                     x: int,
+                     y: int,
+                     floor: int,
+                     vector_x: int,
+                     vector_y: int) -> Tuple[bool, Any, int, Tuple[Tuple[int, int, int], ...]]:
+        """
+        info: Decodes a literal and caches it until one of its cells is written.
+        :param rooms: Rooms
+        :param x: int
+        :param y: int
+        :param floor: int
+        :param vector_x: int
+        :param vector_y: int
+        :return: Tuple[bool, Any, int, Tuple[Tuple[int, int, int], ...]]
+        """
+        key = (x, y, floor, vector_x, vector_y)
+        pushes, value, width = _decode_literal(rooms, x, y, floor, vector_x, vector_y)
+        visuals = tuple((x + vector_x * step, y + vector_y * step, floor) for step in range(width))
+        literal = self._literals[key] = (pushes, value, width, visuals)
+        # watch every cell read including the cell that ended the literal
+        end_x = x + vector_x * width
+        end_y = y + vector_y * width
+        rooms.add_watcher(floor,
+                          min(x, end_x),
+                          min(y, end_y),
+                          max(x, end_x),
+                          max(y, end_y),
+                          partial(self._literals.pop, key, None))
+        return literal
+
+
+class JumpCache:
+    def __init__(self):
+        """
+        info: Caches where a doubled Shifter skips to keyed by the doubled cell and vector.
+            A jump is dropped once a cell it covers is written.
+        """
+        self._rooms: Optional[Rooms] = None
+        self._jumps: Dict[Tuple[int, int, int, int, int],
+                          Tuple[int, Tuple[Tuple[int, int, int], ...]]] = {}
+
+    def jump(self,
+             rooms: Rooms,
+             conscious: c.Conscious,
+             shifters: Set[str],
+             rule_step_visuals: List[Tuple[int, int, int]]) -> None:
+        """
+        info: Moves conscious from a doubled Shifter to the Shifter it skips to.
+            Same as stepping through the skip lane but scans each lane only once.
+        :param rooms: Rooms
+        :param conscious: Conscious
+        :param shifters: Set[str]
+            Start characters of the Shifters in the work space.
+        :param rule_step_visuals: List[Tuple[int, int, int]]
+        :return: None
+        """
+        if rooms is not self._rooms:
+            self._rooms = rooms
+            self._jumps = {}
+        key = (conscious.pc_x, conscious.pc_y, conscious.pc_floor, conscious.pc_v_x, conscious.pc_v_y)
+        jump = self._jumps.get(key)
+        if jump is None:
+            jump = self._add_jump(rooms, shifters, *key)
+        width, visuals = jump
+        rule_step_visuals.extend(visuals)
+        conscious.pc_x += conscious.pc_v_x * width
+        conscious.pc_y += conscious.pc_v_y * width
+
+    def _add_jump(self,
+                  rooms: Rooms,
+                  shifters: Set[str],
+                  x: int,
+                  y: int,
+                  floor: int,
+                  vector_x: int,
+                  vector_y: int) -> Tuple[int, Tuple[Tuple[int, int, int], ...]]:
+        """
+        info: Scans a skip lane and caches the jump until one of its cells is written.
+        :param rooms: Rooms
+        :param shifters: Set[str]
+        :param x: int
+        :param y: int
+        :param floor: int
+        :param vector_x: int
+        :param vector_y: int
+        :return: Tuple[int, Tuple[Tuple[int, int, int], ...]]
+            How many cells the PC moves and the cells stepped over.
+        """
+        key = (x, y, floor, vector_x, vector_y)
+        width = 1
+        skip_count = 0
+        while True:
+            character = rooms.read(x + vector_x * width, y + vector_y * width, floor)
+            if character == "!":
+                skip_count += 1
+            elif character in shifters:
+                if not skip_count:
+                    break
+                skip_count += -1
+            width += 1
+        visuals = tuple((x + vector_x * step, y + vector_y * step, floor) for step in range(width + 1))
+        jump = self._jumps[key] = (width, visuals)
+        # watch the doubled Shifter and the whole lane
+        end_x = x + vector_x * width
+        end_y = y + vector_y * width
+        rooms.add_watcher(floor,
+                          min(x, end_x),
+                          min(y, end_y),
+                          max(x, end_x),
+                          max(y, end_y),
+                          partial(self._jumps.pop, key, None))
+        return jump
 
 
 def _write(rooms: Rooms,
            conscious: c.Conscious,
            rule_step_visuals: List[Tuple[int, int, int]]) -> str:
-    item = conscious[c.WORK_STACK].pop()
+    item = conscious.work_stack.pop()
     if item is None:
         return "n"
     elif item is StackBottom:
@@ -137,37 +387,58 @@ def _write(rooms: Rooms,
     return f"s{start_character}{item}{start_character}"
 
 
-def _bottom_to_none(item: Union[str,
-                                int,
-                                None,
-                                Type[StackFrame],
-                                Type[StackBottom]]) -> Union[str, int, None, Type[StackFrame]]:
-    if item is StackBottom:
-        return
-    return item
+def _expand_call_frames(function_stack: Stack) -> Stack:
+    """
+    info: Makes a Stack with each CallFrame replaced by its items.
+        Used to show the function stack as if each item was pushed one by one.
+    :param function_stack: Stack
+    :return: Stack
+    """
+    items = []
+    while not function_stack.is_empty():
+        items.append(function_stack.pop())
+    expanded_stack = Stack()
+    for item in reversed(items):
+        if isinstance(item, c.CallFrame):
+            for call_frame_item in item.get_items():
+                expanded_stack.push(call_frame_item)
+        else:
+            expanded_stack.push(item)
+    return expanded_stack
 
 
 SHIFTER = "SHIFTER"
 KEY_HOLDER = "KEY_HOLDER"
 LOCK_COUNT = "LOCK_COUNT"
+LITERALS = "LITERALS"
+JUMPS = "JUMPS"
 
 
 class WorkSpace(dict):
     def __init__(self, **kwargs):
         work_space = {SHIFTER: set(),
                       KEY_HOLDER: None,
-                      LOCK_COUNT: 0}
+                      LOCK_COUNT: 0,
+                      LITERALS: LiteralCache(),
+                      JUMPS: JumpCache()}
         work_space.update(kwargs)
         super(WorkSpace, self).__init__(work_space)
 
 
 class Rule:
+    # rule always takes a single step without turning, writing to Rooms or touching other consciouses
+    _straight: bool = False
+    # rule does nothing but take a single step
+    _step_only: bool = False
+
     def __init__(self,
                  start_character: str,
                  work_space: WorkSpace,
                  yields: bool):
         if len(start_character) != 1:
             raise RuleError.bad_hope_start_character(start_character)
+        if not is_character(start_character):
+            raise RuleError.bad_start_character(start_character)
         self._start_character: str = start_character
         self._work_space: WorkSpace = work_space
         self._yields: bool = yields
@@ -187,7 +458,83 @@ class Rule:
         :param rule_step_visuals: List[Tuple[int, int, int]]
         :return: Generator[None, None, None]
         """
-        raise NotImplementedError()
+        self.run(portal, rooms, conscious, start, rule_step_visuals)
+        if self._yields:
+            yield
+
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
+        """
+        info: Runs a rule to completion without making a generator.
+            Rules override run if they finish in one step or __call__ if they step more then once.
+        :param portal: Portal
+        :param rooms: Rooms
+        :param conscious: Conscious
+        :param start: Tuple[int, int, int],
+        :param rule_step_visuals: List[Tuple[int, int, int]]
+        :return: None
+        """
+        for _ in self(portal, rooms, conscious, start, rule_step_visuals):
+            pass
+
+    def get_straight_width(self,
+                           rooms: Rooms,
+                           x: int,
+                           y: int,
+                           floor: int,
+                           vector_x: int,
+                           vector_y: int) -> int:
+        """
+        info: Gets how many cells the rule covers if it runs straight along its row.
+            0 means the rule may turn, jump, write to Rooms or touch other consciouses.
+        :param rooms: Rooms
+        :param x: int
+        :param y: int
+        :param floor: int
+        :param vector_x: int
+        :param vector_y: int
+        :return: int
+        """
+        return int(self._straight)
+
+    def is_step_only(self) -> bool:
+        """
+        info: Checks if the rule does nothing but take a single step.
+        :return: bool
+        """
+        return self._step_only
+
+    def is_branch(self) -> bool:
+        """
+        info: Checks if the rule sets the branch of a conscious.
+        :return: bool
+        """
+        return False
+
+    def get_turn(self,
+                 rooms: Rooms,
+                 x: int,
+                 y: int,
+                 floor: int,
+                 vector_x: int,
+                 vector_y: int) -> Optional[Tuple[int, int]]:
+        """
+        info: Gets the vector the rule leaves with if it does nothing but set the vector along its floor and step.
+            Assumes the branch of the conscious is clear.
+        :param rooms: Rooms
+        :param x: int
+        :param y: int
+        :param floor: int
+        :param vector_x: int
+        :param vector_y: int
+        :return: Optional[Tuple[int, int]]
+            None if the rule does more then turn.
+        """
+        return None
 
     def get_start_character(self) -> str:
         return self._start_character
@@ -202,11 +549,12 @@ class RuleModule(Rule):
         super(RuleModule, self).__init__(start_character, work_space, yields)
         rules_obj = [rule(work_space, yields) for rule in rules]
         self._yields = yields
-        self._rules: Dict[str, Rule] = {}
+        # Rules indexed by the ord of there start character
+        self._rules: List[Optional[Rule]] = [None] * 256
         for rule in rules_obj:
-            if rule.get_start_character() in self._rules:
+            if self._rules[ord(rule.get_start_character())] is not None:
                 raise RuleError.start_character_collection(rule.get_start_character())
-            self._rules[rule.get_start_character()] = rule
+            self._rules[ord(rule.get_start_character())] = rule
 
     def __call__(self,
                  portal: 'backrooms.portal.Portal',
@@ -227,25 +575,74 @@ class RuleModule(Rule):
         rule_step_visuals.append(conscious.at())
         if self._yields:
             yield
-        rule = rooms.read(*conscious.at())
-        if rule in self._rules:
-            for _ in self._rules[rule](portal, rooms, conscious, start, rule_step_visuals):
+        rule = self._rules[ord(rooms.read(*conscious.at()))]
+        if rule is not None:
+            for _ in rule(portal, rooms, conscious, start, rule_step_visuals):
                 if self._yields:
                     yield
 
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
+        """
+        info: Runs a rule to completion.
+        :param portal: Portal
+        :param rooms: Rooms
+        :param conscious: Conscious
+        :param start: Tuple[int, int, int],
+        :param rule_step_visuals: List[Tuple[int, int, int]]
+        :return: None
+        """
+        conscious.step()
+        rule_step_visuals.append(conscious.at())
+        rule = self._rules[ord(rooms.read(*conscious.at()))]
+        if rule is not None:
+            rule.run(portal, rooms, conscious, start, rule_step_visuals)
+
+    def get_straight_width(self,
+                           rooms: Rooms,
+                           x: int,
+                           y: int,
+                           floor: int,
+                           vector_x: int,
+                           vector_y: int) -> int:
+        """
+        info: Gets how many cells the rule covers if it runs straight along its row.
+        :param rooms: Rooms
+        :param x: int
+        :param y: int
+        :param floor: int
+        :param vector_x: int
+        :param vector_y: int
+        :return: int
+        """
+        rule = self._rules[ord(rooms.read(x + vector_x, y + vector_y, floor))]
+        if rule is None:
+            return 1
+        width = rule.get_straight_width(rooms, x + vector_x, y + vector_y, floor, vector_x, vector_y)
+        if width:
+            return width + 1
+        return 0
+
 
 class BackMirror(Rule):
+    # vector along a floor to the vector it is turned to
+    _turns: Dict[Tuple[int, int], Tuple[int, int]] = {(1, 0): (0, -1), (-1, 0): (0, 1), (0, 1): (-1, 0), (0, -1): (1, 0)}
+
     def __init__(self,
                  work_space: WorkSpace,
                  yields: bool):
         super(BackMirror, self).__init__("\\", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -253,29 +650,37 @@ class BackMirror(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
-        if conscious[c.PC_V_FLOOR] == 0:
-            if conscious[c.PC_V_Y] == 0:
-                if conscious[c.PC_V_X] == 1:
-                    conscious[c.PC_V_X] = 0
-                    conscious[c.PC_V_Y] = -1
-                elif conscious[c.PC_V_X] == -1:
-                    conscious[c.PC_V_X] = 0
-                    conscious[c.PC_V_Y] = 1
-            elif conscious[c.PC_V_X] == 0:
-                if conscious[c.PC_V_Y] == 1:
-                    conscious[c.PC_V_X] = -1
-                    conscious[c.PC_V_Y] = 0
-                elif conscious[c.PC_V_Y] == -1:
-                    conscious[c.PC_V_X] = 1
-                    conscious[c.PC_V_Y] = 0
+        if conscious.pc_v_floor == 0:
+            turn = self._turns.get((conscious.pc_v_x, conscious.pc_v_y))
+            if turn is not None:
+                conscious.pc_v_x, conscious.pc_v_y = turn
         conscious.step()
-        if self._yields:
-            yield
+
+    def get_turn(self,
+                 rooms: Rooms,
+                 x: int,
+                 y: int,
+                 floor: int,
+                 vector_x: int,
+                 vector_y: int) -> Optional[Tuple[int, int]]:
+        """
+        info: Gets the vector the rule leaves with.
+        :param rooms: Rooms
+        :param x: int
+        :param y: int
+        :param floor: int
+        :param vector_x: int
+        :param vector_y: int
+        :return: Optional[Tuple[int, int]]
+        """
+        return self._turns.get((vector_x, vector_y), (vector_x, vector_y))
 
 
 class Branch(Rule):
+    _straight: bool = True
+
     def __init__(self,
                  branch_function: Callable,
                  start_character: str,
@@ -284,12 +689,19 @@ class Branch(Rule):
         super(Branch, self).__init__(start_character, work_space, yields)
         self._branch_function = branch_function
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def is_branch(self) -> bool:
+        """
+        info: Checks if the rule sets the branch of a conscious.
+        :return: bool
+        """
+        return True
+
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -297,12 +709,10 @@ class Branch(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
-        conscious[c.BRANCH] = self._branch_function
+        conscious.branch = self._branch_function
         conscious.step()
-        if self._yields:
-            yield
 
 
 class BranchLessThanZero(Branch):
@@ -374,12 +784,12 @@ class Cite(Rule):
                  yields: bool):
         super(Cite, self).__init__("c", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -387,31 +797,31 @@ class Cite(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
-        while True:
-            data = portal.read_input()
-            if data is not None:
-                break
-            yield
+        data = portal.read_input()
+        if data is None:
+            # cite again once the Feeder is given input
+            portal.park_on_input(conscious)
+            return
         conscious.step()
-        conscious[c.WORK_STACK].push(data)
-        if self._yields:
-            yield
+        conscious.work_stack.push(data)
 
 
 class ClearStack(Rule):
+    _straight: bool = True
+
     def __init__(self,
                  work_space: WorkSpace,
                  yields: bool):
         super(ClearStack, self).__init__("n", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -419,26 +829,26 @@ class ClearStack(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
         conscious.step()
-        conscious[c.WORK_STACK].clear()
-        if self._yields:
-            yield
+        conscious.work_stack.clear()
 
 
 class CoordinateX(Rule):
+    _straight: bool = True
+
     def __init__(self,
                  work_space: WorkSpace,
                  yields: bool):
         super(CoordinateX, self).__init__("x", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -446,26 +856,26 @@ class CoordinateX(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
-        conscious[c.WORK_STACK].push(conscious[c.PC_X])
+        conscious.work_stack.push(conscious.pc_x)
         conscious.step()
-        if self._yields:
-            yield
 
 
 class CoordinateY(Rule):
+    _straight: bool = True
+
     def __init__(self,
                  work_space: WorkSpace,
                  yields: bool):
         super(CoordinateY, self).__init__("y", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -473,26 +883,26 @@ class CoordinateY(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
-        conscious[c.WORK_STACK].push(conscious[c.PC_Y])
+        conscious.work_stack.push(conscious.pc_y)
         conscious.step()
-        if self._yields:
-            yield
 
 
 class CoordinateFloor(Rule):
+    _straight: bool = True
+
     def __init__(self,
                  work_space: WorkSpace,
                  yields: bool):
         super(CoordinateFloor, self).__init__("f", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -500,12 +910,10 @@ class CoordinateFloor(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
-        conscious[c.WORK_STACK].push(conscious[c.PC_FLOOR])
+        conscious.work_stack.push(conscious.pc_floor)
         conscious.step()
-        if self._yields:
-            yield
 
 
 class CoreDump(Rule):
@@ -514,12 +922,12 @@ class CoreDump(Rule):
                  yields: bool):
         super(CoreDump, self).__init__("?", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -527,38 +935,40 @@ class CoreDump(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
         portal.write_output("#" * 5 + "\n")
         portal.write_output("Stacks\nWorking\tFunction\n")
-        conscious_copy = deepcopy(conscious)
-        while conscious_copy[c.WORK_STACK].peak() is not StackBottom\
-                or conscious_copy[c.FUNCTION_STACK].peak() is not StackBottom:
-            portal.write_output(pformat(conscious_copy[c.WORK_STACK].pop()))
-            portal.write_output(f"\t{pformat(conscious_copy[c.FUNCTION_STACK].pop())}\n")
-        portal.write_output(f"{conscious_copy[c.WORK_STACK].pop()}\t{conscious_copy[c.FUNCTION_STACK].pop()}\n")
+        conscious_view = deepcopy(conscious)
+        conscious_view.function_stack = _expand_call_frames(conscious_view.function_stack)
+        conscious_copy = deepcopy(conscious_view)
+        while conscious_copy.work_stack.peak() is not StackBottom\
+                or conscious_copy.function_stack.peak() is not StackBottom:
+            portal.write_output(pformat(conscious_copy.work_stack.pop()))
+            portal.write_output(f"\t{pformat(conscious_copy.function_stack.pop())}\n")
+        portal.write_output(f"{conscious_copy.work_stack.pop()}\t{conscious_copy.function_stack.pop()}\n")
         portal.write_output("#" * 5 + "\n")
-        portal.write_output(pformat(conscious))
+        portal.write_output(pformat(dict(conscious_view.items())))
         portal.write_output("\n>> ")
         portal.read_input()
         portal.write_output("#" * 5 + "\n")
         conscious.step()
-        if self._yields:
-            yield
 
 
 class Decrement(Rule):
+    _straight: bool = True
+
     def __init__(self,
                  work_space: WorkSpace,
                  yields: bool):
         super(Decrement, self).__init__("-", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -566,27 +976,27 @@ class Decrement(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
-        item = _to_int(conscious[c.WORK_STACK].pop()) - 1
-        conscious[c.WORK_STACK].push(item)
+        item = _to_int(conscious.work_stack.pop()) - 1
+        conscious.work_stack.push(item)
         conscious.step()
-        if self._yields:
-            yield
 
 
 class Duplicate(Rule):
+    _straight: bool = True
+
     def __init__(self,
                  work_space: WorkSpace,
                  yields: bool):
         super(Duplicate, self).__init__("d", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -594,27 +1004,27 @@ class Duplicate(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
-        work_space = conscious[c.WORK_STACK]
+        work_space = conscious.work_stack
         work_space.push(work_space.peak())
         conscious.step()
-        if self._yields:
-            yield
 
 
 class Echo(Rule):
+    _straight: bool = True
+
     def __init__(self,
                  work_space: WorkSpace,
                  yields: bool):
         super(Echo, self).__init__("e", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -622,31 +1032,32 @@ class Echo(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
         conscious.step()
-        output = conscious[c.WORK_STACK].peak()
+        output = conscious.work_stack.peak()
         if output is StackFrame:
             output = "StackFrame"
         elif output is StackBottom:
             output = "StackBottom"
         portal.write_output(output)
-        if self._yields:
-            yield
 
 
 class ForwardMirror(Rule):
+    # vector along a floor to the vector it is turned to
+    _turns: Dict[Tuple[int, int], Tuple[int, int]] = {(1, 0): (0, 1), (-1, 0): (0, -1), (0, 1): (1, 0), (0, -1): (-1, 0)}
+
     def __init__(self,
                  work_space: WorkSpace,
                  yields: bool):
         super(ForwardMirror, self).__init__("/", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -654,26 +1065,32 @@ class ForwardMirror(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
-        if conscious[c.PC_V_FLOOR] == 0:
-            if conscious[c.PC_V_Y] == 0:
-                if conscious[c.PC_V_X] == 1:
-                    conscious[c.PC_V_X] = 0
-                    conscious[c.PC_V_Y] = 1
-                elif conscious[c.PC_V_X] == -1:
-                    conscious[c.PC_V_X] = 0
-                    conscious[c.PC_V_Y] = -1
-            elif conscious[c.PC_V_X] == 0:
-                if conscious[c.PC_V_Y] == 1:
-                    conscious[c.PC_V_X] = 1
-                    conscious[c.PC_V_Y] = 0
-                elif conscious[c.PC_V_Y] == -1:
-                    conscious[c.PC_V_X] = -1
-                    conscious[c.PC_V_Y] = 0
+        if conscious.pc_v_floor == 0:
+            turn = self._turns.get((conscious.pc_v_x, conscious.pc_v_y))
+            if turn is not None:
+                conscious.pc_v_x, conscious.pc_v_y = turn
         conscious.step()
-        if self._yields:
-            yield
+
+    def get_turn(self,
+                 rooms: Rooms,
+                 x: int,
+                 y: int,
+                 floor: int,
+                 vector_x: int,
+                 vector_y: int) -> Optional[Tuple[int, int]]:
+        """
+        info: Gets the vector the rule leaves with.
+        :param rooms: Rooms
+        :param x: int
+        :param y: int
+        :param floor: int
+        :param vector_x: int
+        :param vector_y: int
+        :return: Optional[Tuple[int, int]]
+        """
+        return self._turns.get((vector_x, vector_y), (vector_x, vector_y))
 
 
 def _process_hallway_arg(hallway: Union[int, str, StackFrame, StackBottom, None],
@@ -705,18 +1122,93 @@ def _process_floor_arg(floor: Union[int, str, StackFrame, StackBottom, None],
     return _to_int(floor)
 
 
+class CallSiteCache:
+    def __init__(self):
+        """
+        info: Caches what the arguments of a hallway call resolved to at each call site.
+            Keys are made of the call cell and the arguments.
+            Every call site is dropped once the hallway generation of Rooms changes
+            or MAX_CALL_SITES call sites are held.
+        """
+        self._rooms: Optional[Rooms] = None
+        self._hallway_generation: Optional[int] = None
+        self._call_sites: Dict[Tuple[object, ...], Tuple[Optional[int], Optional[int]]] = {}
+        self._hits: int = 0
+        self._misses: int = 0
+
+    def get(self,
+            rooms: Rooms,
+            key: Tuple[object, ...]) -> Optional[Tuple[Optional[int], Optional[int]]]:
+        """
+        info: Gets the hallway and floor a call site resolved to.
+        :param rooms: Rooms
+        :param key: Tuple[object, ...]
+        :return: Optional[Tuple[Optional[int], Optional[int]]]
+            None if the call site needs to be resolved.
+        """
+        hallway_generation = rooms.get_hallway_generation()
+        if rooms is not self._rooms or hallway_generation != self._hallway_generation:
+            self._rooms = rooms
+            self._hallway_generation = hallway_generation
+            self._call_sites = {}
+        call_site = self._call_sites.get(key)
+        if call_site is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return call_site
+
+    def add(self,
+            key: Tuple[object, ...],
+            hallway: Optional[int],
+            floor: Optional[int]) -> None:
+        """
+        info: Adds what a call site resolved to.
+        :param key: Tuple[object, ...]
+        :param hallway: Optional[int]
+        :param floor: Optional[int]
+        :return: None
+        """
+        if len(self._call_sites) >= MAX_CALL_SITES:
+            # computed arguments can make a new key every call
+            self._call_sites = {}
+        self._call_sites[key] = (hallway, floor)
+
+    def get_hits(self) -> int:
+        """
+        info: Gets how many calls skipped resolving there arguments.
+        :return: int
+        """
+        return self._hits
+
+    def get_misses(self) -> int:
+        """
+        info: Gets how many calls had to resolve there arguments.
+        :return: int
+        """
+        return self._misses
+
+
 class HallwayCall(Rule):
     def __init__(self,
                  work_space: WorkSpace,
                  yields: bool):
         super(HallwayCall, self).__init__("c", work_space, yields)
+        self._call_site_cache: CallSiteCache = CallSiteCache()
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def get_call_site_cache(self) -> CallSiteCache:
+        """
+        info: Gets the CallSiteCache of the rule.
+        :return: CallSiteCache
+        """
+        return self._call_site_cache
+
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -724,33 +1216,24 @@ class HallwayCall(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
-        hallway = _process_hallway_arg(conscious[c.WORK_STACK].pop(), conscious[c.PC_FLOOR], rooms)
+        hallway = conscious.work_stack.pop()
+        # HallwayModule has stepped onto the call cell
+        key = (conscious.at(), hallway)
+        call_site = self._call_site_cache.get(rooms, key)
+        if call_site is None:
+            hallway = _process_hallway_arg(hallway, conscious.pc_floor, rooms)
+            self._call_site_cache.add(key, hallway, None)
+        else:
+            hallway = call_site[0]
 
         if isinstance(hallway, int):
-            conscious[c.FUNCTION_STACK].push(conscious[c.PC_X])
-            conscious[c.FUNCTION_STACK].push(conscious[c.PC_Y])
-            conscious[c.FUNCTION_STACK].push(conscious[c.PC_FLOOR])
-            conscious[c.FUNCTION_STACK].push(conscious[c.PC_V_X])
-            conscious[c.FUNCTION_STACK].push(conscious[c.PC_V_Y])
-            conscious[c.FUNCTION_STACK].push(conscious[c.PC_V_FLOOR])
-            conscious[c.FUNCTION_STACK].push(_bottom_to_none(conscious[c.R0]))
-            conscious[c.FUNCTION_STACK].push(_bottom_to_none(conscious[c.R1]))
-            conscious[c.FUNCTION_STACK].push(_bottom_to_none(conscious[c.R2]))
-            conscious[c.FUNCTION_STACK].push(_bottom_to_none(conscious[c.R3]))
-            conscious[c.FUNCTION_STACK].push(_bottom_to_none(conscious[c.R4]))
-            conscious[c.FUNCTION_STACK].push(_bottom_to_none(conscious[c.R5]))
-            conscious[c.FUNCTION_STACK].push(_bottom_to_none(conscious[c.R6]))
-            conscious[c.FUNCTION_STACK].push(_bottom_to_none(conscious[c.R7]))
-            conscious[c.FUNCTION_STACK].push(_bottom_to_none(conscious[c.R8]))
-            conscious[c.FUNCTION_STACK].push(_bottom_to_none(conscious[c.R9]))
-            conscious[c.PC_X] = 0
-            conscious[c.PC_Y] = hallway
+            conscious.function_stack.push(conscious.snapshot())
+            conscious.pc_x = 0
+            conscious.pc_y = hallway
         else:
             conscious.step()
-        if self._yields:
-            yield
 
 
 class HallwayLevelCall(Rule):
@@ -758,13 +1241,21 @@ class HallwayLevelCall(Rule):
                  work_space: WorkSpace,
                  yields: bool):
         super(HallwayLevelCall, self).__init__("l", work_space, yields)
+        self._call_site_cache: CallSiteCache = CallSiteCache()
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def get_call_site_cache(self) -> CallSiteCache:
+        """
+        info: Gets the CallSiteCache of the rule.
+        :return: CallSiteCache
+        """
+        return self._call_site_cache
+
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -772,45 +1263,36 @@ class HallwayLevelCall(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
-        hallway = conscious[c.WORK_STACK].pop()
-        floor = _process_floor_arg(conscious[c.WORK_STACK].pop(), rooms)
-        hallway = _process_hallway_arg(hallway, floor, rooms)
+        hallway = conscious.work_stack.pop()
+        floor = conscious.work_stack.pop()
+        # HallwayModule has stepped onto the call cell
+        key = (conscious.at(), hallway, floor)
+        call_site = self._call_site_cache.get(rooms, key)
+        if call_site is None:
+            floor = _process_floor_arg(floor, rooms)
+            hallway = _process_hallway_arg(hallway, floor, rooms)
+            if isinstance(floor, int):
+                # get hallway coord
+                if isinstance(hallway, str):
+                    hallway = rooms.get_hallway_location(floor, hallway)
+                else:
+                    hallway = _to_int(hallway)
+                    if rooms.find_hallway_location(hallway, floor) != hallway:
+                        hallway = None
+            self._call_site_cache.add(key, hallway, floor)
+        else:
+            hallway, floor = call_site
 
         if isinstance(floor, int):
-            # get hallway coord
-            if isinstance(hallway, str):
-                hallway = rooms.get_hallway_location(floor, hallway)
-            else:
-                hallway = _to_int(hallway)
-                if rooms.find_hallway_location(hallway, floor) != hallway:
-                    hallway = None
-
             if isinstance(hallway, int):
-                conscious[c.FUNCTION_STACK].push(conscious[c.PC_X])
-                conscious[c.FUNCTION_STACK].push(conscious[c.PC_Y])
-                conscious[c.FUNCTION_STACK].push(conscious[c.PC_FLOOR])
-                conscious[c.FUNCTION_STACK].push(conscious[c.PC_V_X])
-                conscious[c.FUNCTION_STACK].push(conscious[c.PC_V_Y])
-                conscious[c.FUNCTION_STACK].push(conscious[c.PC_V_FLOOR])
-                conscious[c.FUNCTION_STACK].push(_bottom_to_none(conscious[c.R0]))
-                conscious[c.FUNCTION_STACK].push(_bottom_to_none(conscious[c.R1]))
-                conscious[c.FUNCTION_STACK].push(_bottom_to_none(conscious[c.R2]))
-                conscious[c.FUNCTION_STACK].push(_bottom_to_none(conscious[c.R3]))
-                conscious[c.FUNCTION_STACK].push(_bottom_to_none(conscious[c.R4]))
-                conscious[c.FUNCTION_STACK].push(_bottom_to_none(conscious[c.R5]))
-                conscious[c.FUNCTION_STACK].push(_bottom_to_none(conscious[c.R6]))
-                conscious[c.FUNCTION_STACK].push(_bottom_to_none(conscious[c.R7]))
-                conscious[c.FUNCTION_STACK].push(_bottom_to_none(conscious[c.R8]))
-                conscious[c.FUNCTION_STACK].push(_bottom_to_none(conscious[c.R9]))
-                conscious[c.PC_X] = 0
-                conscious[c.PC_Y] = hallway
-                conscious[c.PC_FLOOR] = floor
+                conscious.function_stack.push(conscious.snapshot())
+                conscious.pc_x = 0
+                conscious.pc_y = hallway
+                conscious.pc_floor = floor
             else:
                 conscious.step()
-        if self._yields:
-            yield
 
 
 class HallwayReturn(Rule):
@@ -819,12 +1301,12 @@ class HallwayReturn(Rule):
                  yields: bool):
         super(HallwayReturn, self).__init__("r", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -832,61 +1314,30 @@ class HallwayReturn(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
-        r9 = conscious[c.FUNCTION_STACK].pop()
-        r8 = conscious[c.FUNCTION_STACK].pop()
-        r7 = conscious[c.FUNCTION_STACK].pop()
-        r6 = conscious[c.FUNCTION_STACK].pop()
-        r5 = conscious[c.FUNCTION_STACK].pop()
-        r4 = conscious[c.FUNCTION_STACK].pop()
-        r3 = conscious[c.FUNCTION_STACK].pop()
-        r2 = conscious[c.FUNCTION_STACK].pop()
-        r1 = conscious[c.FUNCTION_STACK].pop()
-        r0 = conscious[c.FUNCTION_STACK].pop()
-        v_floor = conscious[c.FUNCTION_STACK].pop()
-        v_y = conscious[c.FUNCTION_STACK].pop()
-        v_x = conscious[c.FUNCTION_STACK].pop()
-        floor = conscious[c.FUNCTION_STACK].pop()
-        y = conscious[c.FUNCTION_STACK].pop()
-        x = conscious[c.FUNCTION_STACK].pop()
-        if isinstance(v_x, int) and isinstance(v_y, int) and isinstance(v_floor, int):
-            if isinstance(x, int) and isinstance(y, int) and isinstance(floor, int):
-                conscious[c.R0] = r0
-                conscious[c.R1] = r1
-                conscious[c.R2] = r2
-                conscious[c.R3] = r3
-                conscious[c.R4] = r4
-                conscious[c.R5] = r5
-                conscious[c.R6] = r6
-                conscious[c.R7] = r7
-                conscious[c.R8] = r8
-                conscious[c.R9] = r9
-                conscious[c.PC_X] = x
-                conscious[c.PC_Y] = y
-                conscious[c.PC_FLOOR] = floor
-                conscious[c.PC_V_X] = v_x
-                conscious[c.PC_V_Y] = v_y
-                conscious[c.PC_V_FLOOR] = v_floor
-            elif whisper.WHISPER_RUNNING:
-                whisper.error("Hallway Return Failed!")
+        call_frame = conscious.function_stack.pop()
+        if isinstance(call_frame, c.CallFrame):
+            conscious.restore(call_frame)
+        elif call_frame is not StackBottom and whisper.WHISPER_RUNNING:
+            whisper.error("Hallway Return Failed!")
         conscious.step()
-        if self._yields:
-            yield
 
 
 class HallwayGetName(Rule):
-    def __init__(self,
-                 work_space: WorkSpace,
-                 yields: bool):
-        super(HallwayGetName, self).__init__("n", work_space, yields)
+    _straight: bool = True
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def __init__(self,
+                 work_space: WorkSpace,
+                 yields: bool):
+        super(HallwayGetName, self).__init__("n", work_space, yields)
+
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -894,28 +1345,28 @@ class HallwayGetName(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
-        hallway = _to_int(conscious[c.WORK_STACK].pop())
-        floor = _process_floor_arg(conscious[c.WORK_STACK].pop(), rooms)
-        conscious[c.WORK_STACK].push(rooms.get_hallway_name(hallway, floor))
+        hallway = _to_int(conscious.work_stack.pop())
+        floor = _process_floor_arg(conscious.work_stack.pop(), rooms)
+        conscious.work_stack.push(rooms.get_hallway_name(hallway, floor))
         conscious.step()
-        if self._yields:
-            yield
 
 
 class HallwayGetLocation(Rule):
+    _straight: bool = True
+
     def __init__(self,
                  work_space: WorkSpace,
                  yields: bool):
         super(HallwayGetLocation, self).__init__("g", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -923,32 +1374,32 @@ class HallwayGetLocation(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
-        hallway = conscious[c.WORK_STACK].pop()
-        floor = _process_floor_arg(conscious[c.WORK_STACK].pop(), rooms)
+        hallway = conscious.work_stack.pop()
+        floor = _process_floor_arg(conscious.work_stack.pop(), rooms)
         if isinstance(hallway, str):
-            conscious[c.WORK_STACK].push(rooms.get_hallway_location(floor, hallway))
+            conscious.work_stack.push(rooms.get_hallway_location(floor, hallway))
         else:
             hallway = _to_int(hallway)
-            conscious[c.WORK_STACK].push(rooms.find_hallway_location(hallway, floor))
+            conscious.work_stack.push(rooms.find_hallway_location(hallway, floor))
         conscious.step()
-        if self._yields:
-            yield
 
 
 class HallwaySet(Rule):
+    _straight: bool = True
+
     def __init__(self,
                  work_space: WorkSpace,
                  yields: bool):
         super(HallwaySet, self).__init__("s", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -956,11 +1407,11 @@ class HallwaySet(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
-        hallway = _to_int(conscious[c.WORK_STACK].pop())
-        floor = _process_floor_arg(conscious[c.WORK_STACK].pop(), rooms)
-        hallway_name = conscious[c.WORK_STACK].pop()
+        hallway = _to_int(conscious.work_stack.pop())
+        floor = _process_floor_arg(conscious.work_stack.pop(), rooms)
+        hallway_name = conscious.work_stack.pop()
         if hallway_name is not None:
             hallway_name = _cast_string(hallway_name)
         try:
@@ -969,22 +1420,22 @@ class HallwaySet(Rule):
             # hallway name is in valid make it None
             rooms.set_hallway_name(hallway, floor, None)
         conscious.step()
-        if self._yields:
-            yield
 
 
 class HallwayRemove(Rule):
+    _straight: bool = True
+
     def __init__(self,
                  work_space: WorkSpace,
                  yields: bool):
         super(HallwayRemove, self).__init__("d", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -992,30 +1443,30 @@ class HallwayRemove(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
-        hallway = conscious[c.WORK_STACK].pop()
-        floor = _process_floor_arg(conscious[c.WORK_STACK].pop(), rooms)
+        hallway = conscious.work_stack.pop()
+        floor = _process_floor_arg(conscious.work_stack.pop(), rooms)
         hallway = _process_hallway_arg(hallway, floor, rooms)
         if isinstance(hallway, int):
             rooms.remove_hallway(hallway, floor)
         conscious.step()
-        if self._yields:
-            yield
 
 
 class HallwayPast(Rule):
+    _straight: bool = True
+
     def __init__(self,
                  work_space: WorkSpace,
                  yields: bool):
         super(HallwayPast, self).__init__("p", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -1023,32 +1474,32 @@ class HallwayPast(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
-        hallway = conscious[c.WORK_STACK].pop()
-        floor = _process_floor_arg(conscious[c.WORK_STACK].pop(), rooms)
+        hallway = conscious.work_stack.pop()
+        floor = _process_floor_arg(conscious.work_stack.pop(), rooms)
         hallway = _process_hallway_arg(hallway, floor, rooms)
         if isinstance(hallway, int):
-            conscious[c.WORK_STACK].push(rooms.get_past_hallway_location(hallway, floor))
+            conscious.work_stack.push(rooms.get_past_hallway_location(hallway, floor))
         else:
-            conscious[c.WORK_STACK].push(None)
+            conscious.work_stack.push(None)
         conscious.step()
-        if self._yields:
-            yield
 
 
 class HallwayNext(Rule):
+    _straight: bool = True
+
     def __init__(self,
                  work_space: WorkSpace,
                  yields: bool):
         super(HallwayNext, self).__init__("e", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -1056,18 +1507,16 @@ class HallwayNext(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
-        hallway = conscious[c.WORK_STACK].pop()
-        floor = _process_floor_arg(conscious[c.WORK_STACK].pop(), rooms)
+        hallway = conscious.work_stack.pop()
+        floor = _process_floor_arg(conscious.work_stack.pop(), rooms)
         hallway = _process_hallway_arg(hallway, floor, rooms)
         if isinstance(hallway, int):
-            conscious[c.WORK_STACK].push(rooms.get_next_hallway_location(hallway, floor))
+            conscious.work_stack.push(rooms.get_next_hallway_location(hallway, floor))
         else:
-            conscious[c.WORK_STACK].push(None)
+            conscious.work_stack.push(None)
         conscious.step()
-        if self._yields:
-            yield
 
 
 class HallwayModule(RuleModule):
@@ -1120,10 +1569,34 @@ class Halt(Rule):
             if rooms.read(*conscious.at()) == "a":
                 rule_step_visuals.append(conscious.at())
                 conscious.step()
-                conscious[c.HALT] = True
+                conscious.halt = True
                 if self._yields:
                     yield
 
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
+        """
+        info: Runs a rule to completion.
+        :param portal: Portal
+        :param rooms: Rooms
+        :param conscious: Conscious
+        :param start: Tuple[int, int, int],
+        :param rule_step_visuals: List[Tuple[int, int, int]]
+        :return: None
+        """
+        conscious.step()
+        if rooms.read(*conscious.at()) == "h":
+            rule_step_visuals.append(conscious.at())
+            conscious.step()
+            if rooms.read(*conscious.at()) == "a":
+                rule_step_visuals.append(conscious.at())
+                conscious.step()
+                conscious.halt = True
+
 
 class Hop(Rule):
     def __init__(self,
@@ -1157,6 +1630,24 @@ class Hop(Rule):
         for _ in range(self._jump_count):
             conscious.step()
 
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
+        """
+        info: Runs a rule to completion.
+        :param portal: Portal
+        :param rooms: Rooms
+        :param conscious: Conscious
+        :param start: Tuple[int, int, int],
+        :param rule_step_visuals: List[Tuple[int, int, int]]
+        :return: None
+        """
+        for _ in range(self._jump_count + 1):
+            conscious.step()
+
 
 class HopOne(Hop):
     def __init__(self,
@@ -1222,17 +1713,19 @@ class HopNine(Hop):
 
 
 class Increment(Rule):
+    _straight: bool = True
+
     def __init__(self,
                  work_space: WorkSpace,
                  yields: bool):
         super(Increment, self).__init__("+", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -1240,27 +1733,27 @@ class Increment(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
-        item = _to_int(conscious[c.WORK_STACK].pop()) + 1
-        conscious[c.WORK_STACK].push(item)
+        item = _to_int(conscious.work_stack.pop()) + 1
+        conscious.work_stack.push(item)
         conscious.step()
-        if self._yields:
-            yield
 
 
 class IntegerCast(Rule):
+    _straight: bool = True
+
     def __init__(self,
                  work_space: WorkSpace,
                  yields: bool):
         super(IntegerCast, self).__init__("c", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -1268,16 +1761,16 @@ class IntegerCast(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
-        item = conscious[c.WORK_STACK].pop()
-        conscious[c.WORK_STACK].push(_cast_to_int(item))
+        item = conscious.work_stack.pop()
+        conscious.work_stack.push(_cast_to_int(item))
         conscious.step()
-        if self._yields:
-            yield
 
 
 class IntegerOperation(Rule):
+    _straight: bool = True
+
     def __init__(self,
                  operation: Callable,
                  start_character: str,
@@ -1286,12 +1779,12 @@ class IntegerOperation(Rule):
         super(IntegerOperation, self).__init__(start_character, work_space, yields)
         self._operation: Callable = operation
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -1299,19 +1792,17 @@ class IntegerOperation(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
-        back = _to_int(conscious[c.WORK_STACK].pop())
-        front = _to_int(conscious[c.WORK_STACK].pop())
+        back = _to_int(conscious.work_stack.pop())
+        front = _to_int(conscious.work_stack.pop())
         try:
-            conscious[c.WORK_STACK].push(int(self._operation(front, back)))
+            conscious.work_stack.push(int(self._operation(front, back)))
         except ZeroDivisionError:
-            conscious[c.WORK_STACK].push(None)
+            conscious.work_stack.push(None)
             if whisper.WHISPER_RUNNING:
                 whisper.warning("ZeroDivisionError")
         conscious.step()
-        if self._yields:
-            yield
 
 
 class IntegerAdd(IntegerOperation):
@@ -1357,17 +1848,19 @@ class IntegerPower(IntegerOperation):
 
 
 class IntegerByte(Rule):
+    _straight: bool = True
+
     def __init__(self,
                  work_space: WorkSpace,
                  yields: bool):
         super(IntegerByte, self).__init__("b", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -1375,30 +1868,30 @@ class IntegerByte(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
-        item = _to_int(conscious[c.WORK_STACK].pop())
+        item = _to_int(conscious.work_stack.pop())
         if 0 <= item < 256:
-            conscious[c.WORK_STACK].push(chr(item))
+            conscious.work_stack.push(chr(item))
         else:
-            conscious[c.WORK_STACK].push(None)
+            conscious.work_stack.push(None)
         conscious.step()
-        if self._yields:
-            yield
 
 
 class IntegerAbsolute(Rule):
+    _straight: bool = True
+
     def __init__(self,
                  work_space: WorkSpace,
                  yields: bool):
         super(IntegerAbsolute, self).__init__("l", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -1406,13 +1899,11 @@ class IntegerAbsolute(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
-        item = _to_int(conscious[c.WORK_STACK].pop())
-        conscious[c.WORK_STACK].push(abs(item))
+        item = _to_int(conscious.work_stack.pop())
+        conscious.work_stack.push(abs(item))
         conscious.step()
-        if self._yields:
-            yield
 
 
 class IntegerModule(RuleModule):
@@ -1434,17 +1925,19 @@ class IntegerModule(RuleModule):
 
 
 class LevelGetFloorName(Rule):
+    _straight: bool = True
+
     def __init__(self,
                  work_space: WorkSpace,
                  yields: bool):
         super(LevelGetFloorName, self).__init__("n", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -1452,27 +1945,27 @@ class LevelGetFloorName(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
-        floor = _to_int(conscious[c.WORK_STACK].pop())
-        conscious[c.WORK_STACK].push(rooms.get_floor_name(floor))
+        floor = _to_int(conscious.work_stack.pop())
+        conscious.work_stack.push(rooms.get_floor_name(floor))
         conscious.step()
-        if self._yields:
-            yield
 
 
 class LevelGetFloorLevel(Rule):
+    _straight: bool = True
+
     def __init__(self,
                  work_space: WorkSpace,
                  yields: bool):
         super(LevelGetFloorLevel, self).__init__("l", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -1480,27 +1973,27 @@ class LevelGetFloorLevel(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
-        floor_name = _cast_string(conscious[c.WORK_STACK].pop())
-        conscious[c.WORK_STACK].push(rooms.get_floor_level(floor_name))
+        floor_name = _cast_string(conscious.work_stack.pop())
+        conscious.work_stack.push(rooms.get_floor_level(floor_name))
         conscious.step()
-        if self._yields:
-            yield
 
 
 class LevelSetFloorName(Rule):
+    _straight: bool = True
+
     def __init__(self,
                  work_space: WorkSpace,
                  yields: bool):
         super(LevelSetFloorName, self).__init__("s", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -1508,20 +2001,18 @@ class LevelSetFloorName(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
-        floor_name = conscious[c.WORK_STACK].pop()
+        floor_name = conscious.work_stack.pop()
         if floor_name is not None:
             floor_name = _cast_string(floor_name)
-        floor_level = _to_int(conscious[c.WORK_STACK].pop())
+        floor_level = _to_int(conscious.work_stack.pop())
         if isinstance(floor_name, str) or floor_name is None:
             try:
                 rooms.set_floor_name(floor_level, floor_name)
             except RoomsError:
                 pass
         conscious.step()
-        if self._yields:
-            yield
 
 
 class LevelModule(RuleModule):
@@ -1537,17 +2028,20 @@ class LevelModule(RuleModule):
 
 
 class NOP(Rule):
+    _straight: bool = True
+    _step_only: bool = True
+
     def __init__(self,
                  work_space: WorkSpace,
                  yields: bool):
         super(NOP, self).__init__(".", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -1555,11 +2049,9 @@ class NOP(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
         conscious.step()
-        if self._yields:
-            yield
 
 
 class Keep(Rule):
@@ -1587,24 +2079,67 @@ class Keep(Rule):
         if self._yields:
             yield
         if rooms.read(*conscious.at()).isdigit():
-            conscious[f"R{rooms.read(*conscious.at())}"] = conscious[c.WORK_STACK].peak()
+            conscious.registers[int(rooms.read(*conscious.at()))] = conscious.work_stack.peak()
             conscious.step()
         if self._yields:
             yield
 
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
+        """
+        info: Runs a rule to completion.
+        :param portal: Portal
+        :param rooms: Rooms
+        :param conscious: Conscious
+        :param start: Tuple[int, int, int],
+        :param rule_step_visuals: List[Tuple[int, int, int]]
+        :return: None
+        """
+        conscious.step()
+        if rooms.read(*conscious.at()).isdigit():
+            conscious.registers[int(rooms.read(*conscious.at()))] = conscious.work_stack.peak()
+            conscious.step()
+
+    def get_straight_width(self,
+                           rooms: Rooms,
+                           x: int,
+                           y: int,
+                           floor: int,
+                           vector_x: int,
+                           vector_y: int) -> int:
+        """
+        info: Gets how many cells the rule covers if it runs straight along its row.
+        :param rooms: Rooms
+        :param x: int
+        :param y: int
+        :param floor: int
+        :param vector_x: int
+        :param vector_y: int
+        :return: int
+        """
+        if rooms.read(x + vector_x, y + vector_y, floor).isdigit():
+            return 2
+        return 1
+
 
 class Pop(Rule):
+    _straight: bool = True
+
     def __init__(self,
                  work_space: WorkSpace,
                  yields: bool):
         super(Pop, self).__init__("p", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -1612,26 +2147,26 @@ class Pop(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
-        conscious[c.WORK_STACK].pop()
+        conscious.work_stack.pop()
         conscious.step()
-        if self._yields:
-            yield
 
 
 class PopFrame(Rule):
+    _straight: bool = True
+
     def __init__(self,
                  work_space: WorkSpace,
                  yields: bool):
         super(PopFrame, self).__init__("a", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -1639,12 +2174,10 @@ class PopFrame(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
-        conscious[c.WORK_STACK].pop_frame()
+        conscious.work_stack.pop_frame()
         conscious.step()
-        if self._yields:
-            yield
 
 
 class Read(Rule):
@@ -1674,6 +2207,43 @@ class Read(Rule):
         for _ in _read(rooms, conscious, self._yields, rule_step_visuals):
             yield
 
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
+        """
+        info: Runs a rule to completion.
+        :param portal: Portal
+        :param rooms: Rooms
+        :param conscious: Conscious
+        :param start: Tuple[int, int, int],
+        :param rule_step_visuals: List[Tuple[int, int, int]]
+        :return: None
+        """
+        conscious.step()
+        self._work_space[LITERALS].read(rooms, conscious, rule_step_visuals)
+
+    def get_straight_width(self,
+                           rooms: Rooms,
+                           x: int,
+                           y: int,
+                           floor: int,
+                           vector_x: int,
+                           vector_y: int) -> int:
+        """
+        info: Gets how many cells the rule covers if it runs straight along its row.
+        :param rooms: Rooms
+        :param x: int
+        :param y: int
+        :param floor: int
+        :param vector_x: int
+        :param vector_y: int
+        :return: int
+        """
+        return _get_read_width(rooms, x + vector_x, y + vector_y, floor, vector_x, vector_y) + 1
+
 
 class Shifter(Rule):
     def __init__(self,
@@ -1689,6 +2259,30 @@ class Shifter(Rule):
         self._vector_y: int = vector_y
         self._vector_floor_level: int = vector_floor_level
 
+    def get_turn(self,
+                 rooms: Rooms,
+                 x: int,
+                 y: int,
+                 floor: int,
+                 vector_x: int,
+                 vector_y: int) -> Optional[Tuple[int, int]]:
+        """
+        info: Gets the vector the rule leaves with if the branch of the conscious is clear.
+        :param rooms: Rooms
+        :param x: int
+        :param y: int
+        :param floor: int
+        :param vector_x: int
+        :param vector_y: int
+        :return: Optional[Tuple[int, int]]
+            None if the rule changes floors or jumps.
+        """
+        if self._vector_floor_level:
+            return None
+        if rooms.read(x + self._vector_x, y + self._vector_y, floor) == self.get_start_character():
+            return None
+        return self._vector_x, self._vector_y
+
     def __call__(self,
                  portal: 'backrooms.portal.Portal',
                  rooms: Rooms,
@@ -1704,10 +2298,10 @@ class Shifter(Rule):
         :param rule_step_visuals: List[Tuple[int, int, int]]
         :return: Generator[None, None, None]
         """
-        if conscious[c.BRANCH](conscious):
-            conscious[c.PC_V_X] = self._vector_x
-            conscious[c.PC_V_Y] = self._vector_y
-            conscious[c.PC_V_FLOOR] = self._vector_floor_level
+        if conscious.branch(conscious):
+            conscious.pc_v_x = self._vector_x
+            conscious.pc_v_y = self._vector_y
+            conscious.pc_v_floor = self._vector_floor_level
             conscious.step()
             if self._yields:
                 yield
@@ -1731,7 +2325,49 @@ class Shifter(Rule):
             conscious.step()
             if self._yields:
                 yield
-        conscious[c.BRANCH] = c.BRANCH_CLEAR
+        conscious.branch = c.BRANCH_CLEAR
+
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
+        """
+        info: Runs a rule to completion.
+        :param portal: Portal
+        :param rooms: Rooms
+        :param conscious: Conscious
+        :param start: Tuple[int, int, int],
+        :param rule_step_visuals: List[Tuple[int, int, int]]
+        :return: None
+        """
+        if conscious.branch(conscious):
+            conscious.pc_v_x = self._vector_x
+            conscious.pc_v_y = self._vector_y
+            conscious.pc_v_floor = self._vector_floor_level
+            conscious.step()
+            if rooms.read(*conscious.at()) == self.get_start_character():
+                if not self._vector_floor_level:
+                    self._work_space[JUMPS].jump(rooms, conscious, self._work_space[SHIFTER], rule_step_visuals)
+                else:
+                    rule_step_visuals.append(conscious.at())
+                    conscious.step()
+                    shifters = self._work_space[SHIFTER]
+                    skip_count = 0
+                    while True:
+                        rule_step_visuals.append(conscious.at())
+                        character = rooms.read(*conscious.at())
+                        if character == "!":
+                            skip_count += 1
+                        elif character in shifters:
+                            if not skip_count:
+                                break
+                            skip_count += -1
+                        conscious.step()
+        else:
+            conscious.step()
+        conscious.branch = c.BRANCH_CLEAR
 
 
 class ShifterRight(Shifter):
@@ -1802,30 +2438,73 @@ class Store(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: Generator[None, None, None]
+        """
+        conscious.step()
+        if self._yields:
+            yield
+        if rooms.read(*conscious.at()).isdigit():
+            conscious.work_stack.push(conscious.registers[int(rooms.read(*conscious.at()))])
+            conscious.step()
+        if self._yields:
+            yield
+
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
+        """
+        info: Runs a rule to completion.
+        :param portal: Portal
+        :param rooms: Rooms
+        :param conscious: Conscious
+        :param start: Tuple[int, int, int],
+        :param rule_step_visuals: List[Tuple[int, int, int]]
+        :return: None
         """
         conscious.step()
-        if self._yields:
-            yield
         if rooms.read(*conscious.at()).isdigit():
-            conscious[c.WORK_STACK].push(conscious[f"R{rooms.read(*conscious.at())}"])
+            conscious.work_stack.push(conscious.registers[int(rooms.read(*conscious.at()))])
             conscious.step()
-        if self._yields:
-            yield
+
+    def get_straight_width(self,
+                           rooms: Rooms,
+                           x: int,
+                           y: int,
+                           floor: int,
+                           vector_x: int,
+                           vector_y: int) -> int:
+        """
+        info: Gets how many cells the rule covers if it runs straight along its row.
+        :param rooms: Rooms
+        :param x: int
+        :param y: int
+        :param floor: int
+        :param vector_x: int
+        :param vector_y: int
+        :return: int
+        """
+        if rooms.read(x + vector_x, y + vector_y, floor).isdigit():
+            return 2
+        return 1
 
 
 class StringLength(Rule):
+    _straight: bool = True
+
     def __init__(self,
                  work_space: WorkSpace,
                  yields: bool):
         super(StringLength, self).__init__("l", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -1833,27 +2512,27 @@ class StringLength(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
-        item = _cast_string(conscious[c.WORK_STACK].pop())
-        conscious[c.WORK_STACK].push(len(item))
+        item = _cast_string(conscious.work_stack.pop())
+        conscious.work_stack.push(len(item))
         conscious.step()
-        if self._yields:
-            yield
 
 
 class StringCast(Rule):
+    _straight: bool = True
+
     def __init__(self,
                  work_space: WorkSpace,
                  yields: bool):
         super(StringCast, self).__init__("c", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -1861,27 +2540,27 @@ class StringCast(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
-        item = conscious[c.WORK_STACK].pop()
-        conscious[c.WORK_STACK].push(_cast_string(item))
+        item = conscious.work_stack.pop()
+        conscious.work_stack.push(_cast_string(item))
         conscious.step()
-        if self._yields:
-            yield
 
 
 class StringAt(Rule):
+    _straight: bool = True
+
     def __init__(self,
                  work_space: WorkSpace,
                  yields: bool):
         super(StringAt, self).__init__("a", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -1889,31 +2568,31 @@ class StringAt(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
-        at = _to_int(conscious[c.WORK_STACK].pop())
-        item = _cast_string(conscious[c.WORK_STACK].pop())
+        at = _to_int(conscious.work_stack.pop())
+        item = _cast_string(conscious.work_stack.pop())
         try:
-            conscious[c.WORK_STACK].push(item[at])
+            conscious.work_stack.push(item[at])
         except IndexError:
-            conscious[c.WORK_STACK].push(None)
+            conscious.work_stack.push(None)
         conscious.step()
-        if self._yields:
-            yield
 
 
 class StringByte(Rule):
+    _straight: bool = True
+
     def __init__(self,
                  work_space: WorkSpace,
                  yields: bool):
         super(StringByte, self).__init__("b", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -1921,30 +2600,30 @@ class StringByte(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
-        item = _cast_string(conscious[c.WORK_STACK].pop())
+        item = _cast_string(conscious.work_stack.pop())
         if len(item) <= 1:
-            conscious[c.WORK_STACK].push(ord(item[0]))
+            conscious.work_stack.push(ord(item[0]))
         else:
-            conscious[c.WORK_STACK].push(None)
+            conscious.work_stack.push(None)
         conscious.step()
-        if self._yields:
-            yield
 
 
 class StringSplit(Rule):
+    _straight: bool = True
+
     def __init__(self,
                  work_space: WorkSpace,
                  yields: bool):
         super(StringSplit, self).__init__("s", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -1952,31 +2631,31 @@ class StringSplit(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
-        at = conscious[c.WORK_STACK].pop()
-        item = _cast_string(conscious[c.WORK_STACK].pop())
+        at = conscious.work_stack.pop()
+        item = _cast_string(conscious.work_stack.pop())
         back = item[at:]
         front = item[:at]
-        conscious[c.WORK_STACK].push(back)
-        conscious[c.WORK_STACK].push(front)
+        conscious.work_stack.push(back)
+        conscious.work_stack.push(front)
         conscious.step()
-        if self._yields:
-            yield
 
 
 class StringJoin(Rule):
+    _straight: bool = True
+
     def __init__(self,
                  work_space: WorkSpace,
                  yields: bool):
         super(StringJoin, self).__init__("j", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -1984,28 +2663,28 @@ class StringJoin(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
-        back = _cast_string(conscious[c.WORK_STACK].pop())
-        front = _cast_string(conscious[c.WORK_STACK].pop())
-        conscious[c.WORK_STACK].push(front + back)
+        back = _cast_string(conscious.work_stack.pop())
+        front = _cast_string(conscious.work_stack.pop())
+        conscious.work_stack.push(front + back)
         conscious.step()
-        if self._yields:
-            yield
 
 
 class StringEqual(Rule):
+    _straight: bool = True
+
     def __init__(self,
                  work_space: WorkSpace,
                  yields: bool):
         super(StringEqual, self).__init__("e", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -2013,28 +2692,28 @@ class StringEqual(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
-        string_2 = _cast_string(conscious[c.WORK_STACK].pop())
-        string_1 = _cast_string(conscious[c.WORK_STACK].pop())
-        conscious[c.WORK_STACK].push(int(string_1 == string_2))
+        string_2 = _cast_string(conscious.work_stack.pop())
+        string_1 = _cast_string(conscious.work_stack.pop())
+        conscious.work_stack.push(int(string_1 == string_2))
         conscious.step()
-        if self._yields:
-            yield
 
 
 class StringIn(Rule):
+    _straight: bool = True
+
     def __init__(self,
                  work_space: WorkSpace,
                  yields: bool):
         super(StringIn, self).__init__("i", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -2042,28 +2721,28 @@ class StringIn(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
-        string_2 = _cast_string(conscious[c.WORK_STACK].pop())
-        string_1 = _cast_string(conscious[c.WORK_STACK].pop())
-        conscious[c.WORK_STACK].push(int(string_1 in string_2))
+        string_2 = _cast_string(conscious.work_stack.pop())
+        string_1 = _cast_string(conscious.work_stack.pop())
+        conscious.work_stack.push(int(string_1 in string_2))
         conscious.step()
-        if self._yields:
-            yield
 
 
 class StringUpper(Rule):
+    _straight: bool = True
+
     def __init__(self,
                  work_space: WorkSpace,
                  yields: bool):
         super(StringUpper, self).__init__("u", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -2071,27 +2750,27 @@ class StringUpper(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
-        item = _cast_string(conscious[c.WORK_STACK].pop())
-        conscious[c.WORK_STACK].push(item.upper())
+        item = _cast_string(conscious.work_stack.pop())
+        conscious.work_stack.push(item.upper())
         conscious.step()
-        if self._yields:
-            yield
 
 
 class StringLower(Rule):
+    _straight: bool = True
+
     def __init__(self,
                  work_space: WorkSpace,
                  yields: bool):
         super(StringLower, self).__init__("o", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -2099,27 +2778,27 @@ class StringLower(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
-        item = _cast_string(conscious[c.WORK_STACK].pop())
-        conscious[c.WORK_STACK].push(item.lower())
+        item = _cast_string(conscious.work_stack.pop())
+        conscious.work_stack.push(item.lower())
         conscious.step()
-        if self._yields:
-            yield
 
 
 class StringReverse(Rule):
+    _straight: bool = True
+
     def __init__(self,
                  work_space: WorkSpace,
                  yields: bool):
         super(StringReverse, self).__init__("r", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -2127,13 +2806,11 @@ class StringReverse(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
-        item = _cast_string(conscious[c.WORK_STACK].pop())
-        conscious[c.WORK_STACK].push(item[::-1])
+        item = _cast_string(conscious.work_stack.pop())
+        conscious.work_stack.push(item[::-1])
         conscious.step()
-        if self._yields:
-            yield
 
 
 class StringModule(RuleModule):
@@ -2157,17 +2834,19 @@ class StringModule(RuleModule):
 
 
 class Switch(Rule):
+    _straight: bool = True
+
     def __init__(self,
                  work_space: WorkSpace,
                  yields: bool):
         super(Switch, self).__init__("z", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -2175,15 +2854,11 @@ class Switch(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
-        item_2 = conscious[c.WORK_STACK].pop()
-        item_1 = conscious[c.WORK_STACK].pop()
-        conscious[c.WORK_STACK].push(item_2)
-        conscious[c.WORK_STACK].push(item_1)
+        item_1, item_2 = conscious.work_stack.pop_many(2)
+        conscious.work_stack.push_many((item_2, item_1))
         conscious.step()
-        if self._yields:
-            yield
 
 
 class ThreadThread(Rule):
@@ -2192,12 +2867,12 @@ class ThreadThread(Rule):
                  yields: bool):
         super(ThreadThread, self).__init__("t", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -2205,29 +2880,27 @@ class ThreadThread(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
         conscious.step()
         new_conscious = portal.new_conscious()
-        new_conscious[c.PC_X] = conscious[c.PC_X]
-        new_conscious[c.PC_Y] = conscious[c.PC_Y]
-        new_conscious[c.PC_FLOOR] = conscious[c.PC_FLOOR]
-        new_conscious[c.PC_V_X] = conscious[c.PC_V_X]
-        new_conscious[c.PC_V_Y] = conscious[c.PC_V_Y]
-        new_conscious[c.PC_V_FLOOR] = conscious[c.PC_V_FLOOR]
-        new_conscious[c.WORK_STACK] = deepcopy(conscious[c.WORK_STACK])
-        new_conscious[c.R0] = conscious[c.R0]
-        new_conscious[c.R1] = conscious[c.R1]
-        new_conscious[c.R2] = conscious[c.R2]
-        new_conscious[c.R3] = conscious[c.R3]
-        new_conscious[c.R4] = conscious[c.R4]
-        new_conscious[c.R5] = conscious[c.R5]
-        new_conscious[c.R6] = conscious[c.R6]
-        new_conscious[c.R7] = conscious[c.R7]
-        new_conscious[c.R8] = conscious[c.R8]
-        new_conscious[c.R9] = conscious[c.R9]
-        if self._yields:
-            yield
+        new_conscious.pc_x = conscious.pc_x
+        new_conscious.pc_y = conscious.pc_y
+        new_conscious.pc_floor = conscious.pc_floor
+        new_conscious.pc_v_x = conscious.pc_v_x
+        new_conscious.pc_v_y = conscious.pc_v_y
+        new_conscious.pc_v_floor = conscious.pc_v_floor
+        new_conscious.work_stack = conscious.work_stack.copy()
+        new_conscious.registers[0] = conscious.registers[0]
+        new_conscious.registers[1] = conscious.registers[1]
+        new_conscious.registers[2] = conscious.registers[2]
+        new_conscious.registers[3] = conscious.registers[3]
+        new_conscious.registers[4] = conscious.registers[4]
+        new_conscious.registers[5] = conscious.registers[5]
+        new_conscious.registers[6] = conscious.registers[6]
+        new_conscious.registers[7] = conscious.registers[7]
+        new_conscious.registers[8] = conscious.registers[8]
+        new_conscious.registers[9] = conscious.registers[9]
 
 
 class ThreadJoin(Rule):
@@ -2236,12 +2909,12 @@ class ThreadJoin(Rule):
                  yields: bool):
         super(ThreadJoin, self).__init__("j", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -2249,31 +2922,32 @@ class ThreadJoin(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
-        if conscious[c.ID] != 0:
-            conscious[c.ALIVE] = False
+        if conscious.id != 0:
+            conscious.alive = False
             # free thread lock
-            if self._work_space[KEY_HOLDER] == conscious[c.ID]:
+            if self._work_space[KEY_HOLDER] == conscious.id:
                 self._work_space[KEY_HOLDER] = None
+                portal.wake_conscious()
         else:
             conscious.step()
-        if self._yields:
-            yield
 
 
 class ThreadID(Rule):
+    _straight: bool = True
+
     def __init__(self,
                  work_space: WorkSpace,
                  yields: bool):
         super(ThreadID, self).__init__("i", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -2281,12 +2955,10 @@ class ThreadID(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
-        conscious[c.WORK_STACK].push(conscious[c.ID])
+        conscious.work_stack.push(conscious.id)
         conscious.step()
-        if self._yields:
-            yield
 
 
 class ThreadLock(Rule):
@@ -2295,12 +2967,12 @@ class ThreadLock(Rule):
                  yields: bool):
         super(ThreadLock, self).__init__("l", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -2308,19 +2980,19 @@ class ThreadLock(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
         if self._work_space[KEY_HOLDER] is None:
-            self._work_space[KEY_HOLDER] = conscious[c.ID]
+            self._work_space[KEY_HOLDER] = conscious.id
             self._work_space[LOCK_COUNT] = 1
             conscious.step()
-        elif self._work_space[KEY_HOLDER] == conscious[c.ID]:
+        elif self._work_space[KEY_HOLDER] == conscious.id:
             self._work_space[LOCK_COUNT] += 1
             conscious.step()
         else:
-            conscious[c.PC_X], conscious[c.PC_Y], conscious[c.PC_FLOOR] = start
-        if self._yields:
-            yield
+            # try the lock again once it is released
+            conscious.pc_x, conscious.pc_y, conscious.pc_floor = start
+            portal.park_conscious(conscious)
 
 
 class ThreadUnLock(Rule):
@@ -2329,12 +3001,12 @@ class ThreadUnLock(Rule):
                  yields: bool):
         super(ThreadUnLock, self).__init__("u", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -2342,18 +3014,17 @@ class ThreadUnLock(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
         # check if conscious is the key holder
-        if self._work_space[KEY_HOLDER] == conscious[c.ID]:
+        if self._work_space[KEY_HOLDER] == conscious.id:
             self._work_space[LOCK_COUNT] += -1
             # check if lock count is 0
             if not self._work_space[LOCK_COUNT]:
                 # remove conscious as key holder
                 self._work_space[KEY_HOLDER] = None
+                portal.wake_conscious()
         conscious.step()
-        if self._yields:
-            yield
 
 
 class ThreadModule(RuleModule):
@@ -2391,28 +3062,60 @@ class UncommonReadFlip(Rule):
         :param rule_step_visuals: List[Tuple[int, int, int]]
         :return: Generator[None, None, None]
         """
-        x = conscious[c.PC_X]
-        y = conscious[c.PC_Y]
-        floor = conscious[c.PC_FLOOR]
-        v_x = conscious[c.PC_V_X] * -1
-        v_y = conscious[c.PC_V_Y] * -1
-        v_floor = conscious[c.PC_V_FLOOR] * -1
+        x = conscious.pc_x
+        y = conscious.pc_y
+        floor = conscious.pc_floor
+        v_x = conscious.pc_v_x * -1
+        v_y = conscious.pc_v_y * -1
+        v_floor = conscious.pc_v_floor * -1
         conscious.step()
         if self._yields:
             yield
         for _ in _read(rooms, conscious, self._yields, rule_step_visuals):
             yield
-        conscious[c.PC_X] = x
-        conscious[c.PC_Y] = y
-        conscious[c.PC_FLOOR] = floor
-        conscious[c.PC_V_X] = v_x
-        conscious[c.PC_V_Y] = v_y
-        conscious[c.PC_V_FLOOR] = v_floor
+        conscious.pc_x = x
+        conscious.pc_y = y
+        conscious.pc_floor = floor
+        conscious.pc_v_x = v_x
+        conscious.pc_v_y = v_y
+        conscious.pc_v_floor = v_floor
         conscious.step()
         conscious.step()
         if self._yields:
             yield
 
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
+        """
+        info: Runs a rule to completion.
+        :param portal: Portal
+        :param rooms: Rooms
+        :param conscious: Conscious
+        :param start: Tuple[int, int, int],
+        :param rule_step_visuals: List[Tuple[int, int, int]]
+        :return: None
+        """
+        x = conscious.pc_x
+        y = conscious.pc_y
+        floor = conscious.pc_floor
+        v_x = conscious.pc_v_x * -1
+        v_y = conscious.pc_v_y * -1
+        v_floor = conscious.pc_v_floor * -1
+        conscious.step()
+        self._work_space[LITERALS].read(rooms, conscious, rule_step_visuals)
+        conscious.pc_x = x
+        conscious.pc_y = y
+        conscious.pc_floor = floor
+        conscious.pc_v_x = v_x
+        conscious.pc_v_y = v_y
+        conscious.pc_v_floor = v_floor
+        conscious.step()
+        conscious.step()
+
 
 class UncommonWriteFlip(Rule):
     def __init__(self,
@@ -2435,12 +3138,12 @@ class UncommonWriteFlip(Rule):
         :param rule_step_visuals: List[Tuple[int, int, int]]
         :return: Generator[None, None, None]
         """
-        x = conscious[c.PC_X]
-        y = conscious[c.PC_Y]
-        floor = conscious[c.PC_FLOOR]
-        v_x = conscious[c.PC_V_X] * -1
-        v_y = conscious[c.PC_V_Y] * -1
-        v_floor = conscious[c.PC_V_FLOOR] * -1
+        x = conscious.pc_x
+        y = conscious.pc_y
+        floor = conscious.pc_floor
+        v_x = conscious.pc_v_x * -1
+        v_y = conscious.pc_v_y * -1
+        v_floor = conscious.pc_v_floor * -1
         conscious.step()
         if self._yields:
             yield
@@ -2450,17 +3153,52 @@ class UncommonWriteFlip(Rule):
             conscious.step()
             if self._yields:
                 yield
-        conscious[c.PC_X] = x
-        conscious[c.PC_Y] = y
-        conscious[c.PC_FLOOR] = floor
-        conscious[c.PC_V_X] = v_x
-        conscious[c.PC_V_Y] = v_y
-        conscious[c.PC_V_FLOOR] = v_floor
+        conscious.pc_x = x
+        conscious.pc_y = y
+        conscious.pc_floor = floor
+        conscious.pc_v_x = v_x
+        conscious.pc_v_y = v_y
+        conscious.pc_v_floor = v_floor
         conscious.step()
         conscious.step()
         if self._yields:
             yield
 
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
+        """
+        info: Runs a rule to completion.
+        :param portal: Portal
+        :param rooms: Rooms
+        :param conscious: Conscious
+        :param start: Tuple[int, int, int],
+        :param rule_step_visuals: List[Tuple[int, int, int]]
+        :return: None
+        """
+        x = conscious.pc_x
+        y = conscious.pc_y
+        floor = conscious.pc_floor
+        v_x = conscious.pc_v_x * -1
+        v_y = conscious.pc_v_y * -1
+        v_floor = conscious.pc_v_floor * -1
+        conscious.step()
+        for character in ">1vur" + _write(rooms, conscious, rule_step_visuals):
+            rooms.write(*conscious.at(), character=character)
+            rule_step_visuals.append(conscious.at())
+            conscious.step()
+        conscious.pc_x = x
+        conscious.pc_y = y
+        conscious.pc_floor = floor
+        conscious.pc_v_x = v_x
+        conscious.pc_v_y = v_y
+        conscious.pc_v_floor = v_floor
+        conscious.step()
+        conscious.step()
+
 
 class UncommonHotPatch(Rule):
     def __init__(self,
@@ -2483,13 +3221,13 @@ class UncommonHotPatch(Rule):
         :param rule_step_visuals: List[Tuple[int, int, int]]
         :return: Generator[None, None, None]
         """
-        v_floor = conscious[c.PC_V_FLOOR]
-        v_y = conscious[c.PC_V_Y]
-        v_x = conscious[c.PC_V_X]
-        floor = conscious[c.PC_FLOOR]
-        y = conscious[c.PC_Y]
-        x = conscious[c.PC_X]
-        item = _cast_string(conscious[c.WORK_STACK].pop())
+        v_floor = conscious.pc_v_floor
+        v_y = conscious.pc_v_y
+        v_x = conscious.pc_v_x
+        floor = conscious.pc_floor
+        y = conscious.pc_y
+        x = conscious.pc_x
+        item = _cast_string(conscious.work_stack.pop())
         for character in item:
             x += v_x
             y += v_y
@@ -2501,6 +3239,31 @@ class UncommonHotPatch(Rule):
         if self._yields:
             yield
 
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
+        """
+        info: Runs a rule to completion.
+        :param portal: Portal
+        :param rooms: Rooms
+        :param conscious: Conscious
+        :param start: Tuple[int, int, int],
+        :param rule_step_visuals: List[Tuple[int, int, int]]
+        :return: None
+        """
+        v_floor = conscious.pc_v_floor
+        v_y = conscious.pc_v_y
+        v_x = conscious.pc_v_x
+        floor = conscious.pc_floor
+        y = conscious.pc_y
+        x = conscious.pc_x
+        item = _cast_string(conscious.work_stack.pop())
+        rooms.write_line(x + v_x, y + v_y, floor + v_floor, item, v_x, v_y, v_floor)
+        conscious.step()
+
 
 class UncommonSimpleDump(Rule):
     def __init__(self,
@@ -2523,15 +3286,15 @@ class UncommonSimpleDump(Rule):
         :param rule_step_visuals: List[Tuple[int, int, int]]
         :return: Generator[None, None, None]
         """
-        v_floor = conscious[c.PC_V_FLOOR]
-        v_y = conscious[c.PC_V_Y]
-        v_x = conscious[c.PC_V_X]
-        floor = _process_floor_arg(conscious[c.WORK_STACK].pop(), rooms)
-        y = conscious[c.WORK_STACK].pop()
+        v_floor = conscious.pc_v_floor
+        v_y = conscious.pc_v_y
+        v_x = conscious.pc_v_x
+        floor = _process_floor_arg(conscious.work_stack.pop(), rooms)
+        y = conscious.work_stack.pop()
         if not isinstance(y, int):
             y = _to_int(_process_hallway_arg(y, floor, rooms))
-        x = _to_int(conscious[c.WORK_STACK].pop())
-        item = _cast_string(conscious[c.WORK_STACK].pop())
+        x = _to_int(conscious.work_stack.pop())
+        item = _cast_string(conscious.work_stack.pop())
         for character in item:
             rooms.write(x, y, floor, character)
             x += v_x
@@ -2543,6 +3306,33 @@ class UncommonSimpleDump(Rule):
         if self._yields:
             yield
 
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
+        """
+        info: Runs a rule to completion.
+        :param portal: Portal
+        :param rooms: Rooms
+        :param conscious: Conscious
+        :param start: Tuple[int, int, int],
+        :param rule_step_visuals: List[Tuple[int, int, int]]
+        :return: None
+        """
+        v_floor = conscious.pc_v_floor
+        v_y = conscious.pc_v_y
+        v_x = conscious.pc_v_x
+        floor = _process_floor_arg(conscious.work_stack.pop(), rooms)
+        y = conscious.work_stack.pop()
+        if not isinstance(y, int):
+            y = _to_int(_process_hallway_arg(y, floor, rooms))
+        x = _to_int(conscious.work_stack.pop())
+        item = _cast_string(conscious.work_stack.pop())
+        rooms.write_line(x, y, floor, item, v_x, v_y, v_floor)
+        conscious.step()
+
 
 class UncommonDynamicDump(Rule):
     def __init__(self,
@@ -2565,15 +3355,15 @@ class UncommonDynamicDump(Rule):
         :param rule_step_visuals: List[Tuple[int, int, int]]
         :return: Generator[None, None, None]
         """
-        v_floor = _to_int(conscious[c.WORK_STACK].pop())
-        v_y = _to_int(conscious[c.WORK_STACK].pop())
-        v_x = _to_int(conscious[c.WORK_STACK].pop())
-        floor = _process_floor_arg(conscious[c.WORK_STACK].pop(), rooms)
-        y = conscious[c.WORK_STACK].pop()
+        v_floor = _to_int(conscious.work_stack.pop())
+        v_y = _to_int(conscious.work_stack.pop())
+        v_x = _to_int(conscious.work_stack.pop())
+        floor = _process_floor_arg(conscious.work_stack.pop(), rooms)
+        y = conscious.work_stack.pop()
         if not isinstance(y, int):
             y = _process_hallway_arg(y, floor, rooms)
-        x = _to_int(conscious[c.WORK_STACK].pop())
-        item = _cast_string(conscious[c.WORK_STACK].pop())
+        x = _to_int(conscious.work_stack.pop())
+        item = _cast_string(conscious.work_stack.pop())
         for character in item:
             rooms.write(x, y, floor, character)
             x += v_x
@@ -2585,19 +3375,48 @@ class UncommonDynamicDump(Rule):
         if self._yields:
             yield
 
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
+        """
+        info: Runs a rule to completion.
+        :param portal: Portal
+        :param rooms: Rooms
+        :param conscious: Conscious
+        :param start: Tuple[int, int, int],
+        :param rule_step_visuals: List[Tuple[int, int, int]]
+        :return: None
+        """
+        v_floor = _to_int(conscious.work_stack.pop())
+        v_y = _to_int(conscious.work_stack.pop())
+        v_x = _to_int(conscious.work_stack.pop())
+        floor = _process_floor_arg(conscious.work_stack.pop(), rooms)
+        y = conscious.work_stack.pop()
+        if not isinstance(y, int):
+            y = _process_hallway_arg(y, floor, rooms)
+        x = _to_int(conscious.work_stack.pop())
+        item = _cast_string(conscious.work_stack.pop())
+        rooms.write_line(x, y, floor, item, v_x, v_y, v_floor)
+        conscious.step()
+
 
 class UncommonDoubleDuplicate(Rule):
+    _straight: bool = True
+
     def __init__(self,
                  work_space: WorkSpace,
                  yields: bool):
         super(UncommonDoubleDuplicate, self).__init__("o", work_space, yields)
 
-    def __call__(self,
-                 portal: 'backrooms.portal.Portal',
-                 rooms: Rooms,
-                 conscious: c.Conscious,
-                 start: Tuple[int, int, int],
-                 rule_step_visuals: List[Tuple[int, int, int]]) -> Generator[None, None, None]:
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
         """
         info: Runs a rule.
         :param portal: Portal
@@ -2605,16 +3424,11 @@ class UncommonDoubleDuplicate(Rule):
         :param conscious: Conscious
         :param start: Tuple[int, int, int],
         :param rule_step_visuals: List[Tuple[int, int, int]]
-        :return: Generator[None, None, None]
+        :return: None
         """
-        item_2 = conscious[c.WORK_STACK].pop()
-        item_1 = conscious[c.WORK_STACK].pop()
-        for _ in range(2):
-            conscious[c.WORK_STACK].push(item_1)
-            conscious[c.WORK_STACK].push(item_2)
+        items = conscious.work_stack.pop_many(2)
+        conscious.work_stack.push_many(items * 2)
         conscious.step()
-        if self._yields:
-            yield
 
 
 class UncommonModule(RuleModule):
@@ -2666,6 +3480,28 @@ class Write(Rule):
             if self._yields:
                 yield
 
+    def run(self,
+            portal: 'backrooms.portal.Portal',
+            rooms: Rooms,
+            conscious: c.Conscious,
+            start: Tuple[int, int, int],
+            rule_step_visuals: List[Tuple[int, int, int]]) -> None:
+        """
+        info: Runs a rule to completion.
+        :param portal: Portal
+        :param rooms: Rooms
+        :param conscious: Conscious
+        :param start: Tuple[int, int, int],
+        :param rule_step_visuals: List[Tuple[int, int, int]]
+        :return: None
+        """
+        conscious.step()
+        raw_data = "r" + _write(rooms, conscious, rule_step_visuals)
+        for character in raw_data:
+            rooms.write(*conscious.at(), character=character)
+            rule_step_visuals.append(conscious.at())
+            conscious.step()
+
 
 RULES = (BackMirror,
          BranchLessThanZero,
@@ -0,0 +1,222 @@
+"""
+Copyright 2021 Charles McMarrow
+
+This script holds sinks which take what a program writes out.
+"""
+
+# built-in
+from collections import deque
+import sys
+from typing import Callable, List, Optional, TextIO
+
+# backrooms
+from . import backrooms_error
+
+FLUSH_EVERY = "every"
+FLUSH_LINE = "line"
+FLUSH_BUFFER = "buffer"
+FLUSH_POLICIES = (FLUSH_EVERY, FLUSH_LINE, FLUSH_BUFFER)
+BUFFER_SIZE = 8192
+
+
+class SinkError(backrooms_error.BackroomsError):
+    @classmethod
+    def bad_flush_policy(cls, flush_policy: str):
+        """
+        info: Used to indicate a flush policy is not known.
+        :param flush_policy: str
+        :return: SinkError
+        """
+        return cls(f"{repr(flush_policy)} is not a flush policy of {FLUSH_POLICIES}!")
+
+    @classmethod
+    def bad_size(cls, size: int):
+        """
+        info: Used to indicate a size is not positive.
+        :param size: int
+        :return: SinkError
+        """
+        return cls(f"Size must be more then 0 not {size}!")
+
+
+class Sink:
+    def write(self, output: object) -> None:
+        """
+        info: Takes an output of the program.
+        :param output: object
+        :return: None
+        """
+        raise NotImplementedError()
+
+    def flush(self) -> None:
+        """
+        info: Pushes out anything the Sink is holding.
+            Portal flushes its Sinks before reading input and when it stops running.
+        :return: None
+        """
+
+
+class StreamSink(Sink):
+    def __init__(self,
+                 stream: Optional[TextIO] = None,
+                 flush_policy: str = FLUSH_EVERY,
+                 buffer_size: int = BUFFER_SIZE):
+        """
+        info: Writes outputs to a text stream.
+            FLUSH_EVERY: flushes after each output.
+            FLUSH_LINE: flushes after an output with a new line or once buffer_size characters are held.
+            FLUSH_BUFFER: flushes once buffer_size characters are held.
+        :param stream: Optional[TextIO]
+            None writes to sys.stdout.
+        :param flush_policy: str
+        :param buffer_size: int
+        :exception SinkError
+            raises SinkError if flush_policy is not known.
+            raises SinkError if buffer_size is less then 1.
+        """
+        if flush_policy not in FLUSH_POLICIES:
+            raise SinkError.bad_flush_policy(flush_policy)
+        if buffer_size < 1:
+            raise SinkError.bad_size(buffer_size)
+        self._stream: Optional[TextIO] = stream
+        self._flush_policy: str = flush_policy
+        self._buffer_size: int = buffer_size
+        self._buffer: List[str] = []
+        self._buffered: int = 0
+
+    def __deepcopy__(self, memo: dict) -> 'StreamSink':
+        """
+        info: Copies the Sink but shares the stream.
+        :param memo: dict
+        :return: StreamSink
+        """
+        stream_sink = StreamSink(self._stream, self._flush_policy, self._buffer_size)
+        stream_sink._buffer = self._buffer.copy()
+        stream_sink._buffered = self._buffered
+        return stream_sink
+
+    def _get_stream(self) -> TextIO:
+        """
+        info: Gets the stream being written to.
+        :return: TextIO
+        """
+        if self._stream is None:
+            return sys.stdout
+        return self._stream
+
+    def write(self, output: object) -> None:
+        """
+        info: Takes an output of the program.
+        :param output: object
+        :return: None
+        """
+        output = str(output)
+        if self._flush_policy == FLUSH_EVERY:
+            stream = self._get_stream()
+            stream.write(output)
+            stream.flush()
+            return
+        self._buffer.append(output)
+        self._buffered += len(output)
+        if self._buffered >= self._buffer_size or (self._flush_policy == FLUSH_LINE and "\n" in output):
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        info: Writes out held outputs and flushes the stream.
+        :return: None
+        """
+        if self._buffer:
+            stream = self._get_stream()
+            stream.write("".join(self._buffer))
+            stream.flush()
+            self._buffer.clear()
+            self._buffered = 0
+
+
+class ListSink(Sink):
+    def __init__(self,
+                 outputs: Optional[List[object]] = None):
+        """
+        info: Keeps every output in a list.
+        :param outputs: Optional[List[object]]
+            List to add outputs to.
+        """
+        if outputs is None:
+            outputs = []
+        self._outputs: List[object] = outputs
+
+    def write(self, output: object) -> None:
+        """
+        info: Takes an output of the program.
+        :param output: object
+        :return: None
+        """
+        self._outputs.append(output)
+
+    def get_outputs(self) -> List[object]:
+        """
+        info: Gets the outputs.
+            Note anything can be done to the list returned.
+        :return: List[object]
+        """
+        return self._outputs
+
+
+class RingSink(Sink):
+    def __init__(self,
+                 size: int):
+        """
+        info: Keeps the last size outputs.
+        :param size: int
+        :exception SinkError
+            raises SinkError if size is less then 1.
+        """
+        if size < 1:
+            raise SinkError.bad_size(size)
+        self._outputs: deque = deque(maxlen=size)
+
+    def write(self, output: object) -> None:
+        """
+        info: Takes an output of the program.
+        :param output: object
+        :return: None
+        """
+        self._outputs.append(output)
+
+    def get_outputs(self) -> List[object]:
+        """
+        info: Gets the last outputs, oldest first.
+        :return: List[object]
+        """
+        return list(self._outputs)
+
+
+class CallbackSink(Sink):
+    def __init__(self,
+                 callback: Callable[[object], None],
+                 on_flush: Optional[Callable[[], None]] = None):
+        """
+        info: Gives each output to a callback.
+        :param callback: Callable[[object], None]
+        :param on_flush: Optional[Callable[[], None]]
+            Called when the Sink is flushed.
+        """
+        self._callback: Callable[[object], None] = callback
+        self._on_flush: Optional[Callable[[], None]] = on_flush
+
+    def write(self, output: object) -> None:
+        """
+        info: Takes an output of the program.
+        :param output: object
+        :return: None
+        """
+        self._callback(output)
+
+    def flush(self) -> None:
+        """
+        info: Calls on_flush if any.
+        :return: None
+        """
+        if self._on_flush is not None:
+            self._on_flush()
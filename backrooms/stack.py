@@ -5,7 +5,8 @@ This script holds a simple stack data structure.
 """
 
 # built-in
-from typing import List
+from typing import Iterable, List, Optional
+import weakref
 
 
 class StackBottom:
@@ -20,8 +21,20 @@ class Stack:
     def __init__(self):
         """
         info: Simple Stack with StackFrames.
+            StackBottom is never stored, an empty Stack gives StackBottom.
+            Where each StackFrame sits is kept in a list so a frame can be dropped with a single slice delete.
+            Copies borrow the lists of the Stack they were copied from.
+            The owner of the lists keeps changing them in place, a borrower is given its own lists before either changes.
         """
-        self._stack: List[object] = [StackBottom]
+        self._items: List[object] = []
+        # index of every StackFrame in items from bottom to top
+        self._frames: List[int] = []
+        # lists are shared, either lent to borrowers or borrowed from lender
+        self._shared: bool = False
+        # owner of the lists if they are borrowed
+        self._lender: Optional[Stack] = None
+        # copies borrowing the lists
+        self._borrowers: List[weakref.ref] = []
 
     def __bool__(self) -> bool:
         """
@@ -37,58 +50,228 @@ class Stack:
         """
         return f"<{self.__class__.__name__}: {self.peak()}>"
 
+    def __getstate__(self) -> dict:
+        """
+        info: Gets the state of Stack without who it shares with.
+        :return: dict
+        """
+        return {"_items": self._items, "_frames": self._frames}
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        info: Sets the state of Stack.
+        :param state: dict
+        :return: None
+        """
+        self.__init__()
+        self._items = state["_items"]
+        self._frames = state["_frames"]
+
+    def copy(self) -> 'Stack':
+        """
+        info: Makes a copy of Stack in O(1).
+            The copy borrows the lists of Stack until either one changes.
+        :return: Stack
+        """
+        lender = self if self._lender is None else self._lender
+        stack = Stack()
+        stack._items = self._items
+        stack._frames = self._frames
+        stack._lender = lender
+        stack._shared = lender._shared = True
+        lender._borrowers.append(weakref.ref(stack))
+        return stack
+
+    def _unshare(self) -> None:
+        """
+        info: Makes sure Stack can change its lists in place.
+            A borrower copies the lists.
+            An owner keeps its lists and gives a copy to its borrowers instead.
+        :return: None
+        """
+        if self._lender is not None:
+            self._items = self._items.copy()
+            self._frames = self._frames.copy()
+            self._leave()
+            return
+        borrowers = self._get_borrowers()
+        if borrowers:
+            self._lend(borrowers, self._items.copy(), self._frames.copy())
+        self._borrowers = []
+        self._shared = False
+
+    def _get_borrowers(self) -> List['Stack']:
+        """
+        info: Gets the copies still borrowing the lists of Stack.
+        :return: List[Stack]
+        """
+        borrowers = [borrower() for borrower in self._borrowers]
+        return [borrower for borrower in borrowers if borrower is not None and borrower._lender is self]
+
+    def _leave(self) -> None:
+        """
+        info: Stops borrowing from lender.
+        :return: None
+        """
+        lender = self._lender
+        self._lender = None
+        self._shared = False
+        lender._borrowers = [weakref.ref(borrower) for borrower in lender._get_borrowers()]
+        lender._shared = bool(lender._borrowers)
+
+    @staticmethod
+    def _lend(borrowers: List['Stack'],
+              items: List[object],
+              frames: List[int]) -> None:
+        """
+        info: Hands lists to borrowers.
+            The first borrower owns them and the rest borrow from it.
+        :param borrowers: List[Stack]
+        :param items: List[object]
+        :param frames: List[int]
+        :return: None
+        """
+        owner = borrowers[0]
+        owner._lender = None
+        owner._borrowers = [weakref.ref(borrower) for borrower in borrowers[1:]]
+        owner._shared = bool(owner._borrowers)
+        for borrower in borrowers:
+            borrower._items = items
+            borrower._frames = frames
+        for borrower in borrowers[1:]:
+            borrower._lender = owner
+
+    def _drop(self) -> None:
+        """
+        info: Lets go of the lists before Stack is given new lists.
+            Borrowers are handed the lists as they are.
+        :return: None
+        """
+        if self._lender is not None:
+            self._leave()
+            return
+        borrowers = self._get_borrowers()
+        if borrowers:
+            self._lend(borrowers, self._items, self._frames)
+        self._borrowers = []
+        self._shared = False
+
     def push(self, item: object) -> None:
         """
         info: Push item to Stack unless item is StackBottom.
         :param item: object
         :return: object
         """
-        if item is not StackBottom:
-            self._stack.append(item)
+        if item is StackBottom:
+            return
+        if self._shared:
+            self._unshare()
+        if item is StackFrame:
+            self._frames.append(len(self._items))
+        self._items.append(item)
+
+    def push_many(self, items: Iterable[object]) -> None:
+        """
+        info: Push items to Stack in order skipping StackBottoms.
+        :param items: Iterable[object]
+        :return: None
+        """
+        if self._shared:
+            self._unshare()
+        for item in items:
+            if item is StackBottom:
+                continue
+            if item is StackFrame:
+                self._frames.append(len(self._items))
+            self._items.append(item)
 
     def pop(self) -> object:
         """
         info: Pop item from Stack unless item is StackBottom.
         :return: object
         """
-        if self._stack[-1] is StackBottom:
+        if not self._items:
             return StackBottom
-        return self._stack.pop()
+        if self._shared:
+            self._unshare()
+        item = self._items.pop()
+        if item is StackFrame:
+            self._frames.pop()
+        return item
+
+    def pop_many(self, count: int) -> List[object]:
+        """
+        info: Pop count items from Stack.
+        :param count: int
+        :return: List[object]
+            Items in the order they were pushed.
+            StackBottom fills the front of the list if Stack had less then count items.
+        """
+        items = self._items
+        if count <= 0:
+            return []
+        if count > len(items):
+            popped = [StackBottom] * (count - len(items)) + items
+            if self._shared:
+                self._drop()
+            self._items = []
+            self._frames = []
+            return popped
+        if self._shared:
+            self._unshare()
+            items = self._items
+        at = len(items) - count
+        popped = items[at:]
+        del items[at:]
+        frames = self._frames
+        while frames and frames[-1] >= at:
+            frames.pop()
+        return popped
 
     def peak(self) -> object:
         """
         info: Peak at item on top of Stack.
         :return: object
         """
-        return self._stack[-1]
+        if self._items:
+            return self._items[-1]
+        return StackBottom
 
     def is_empty(self) -> bool:
         """
         info: Checks if Stack is empty.
         :return: bool
         """
-        return self._stack[-1] is StackBottom
+        return not self._items
 
     def push_frame(self) -> None:
         """
         info: Push StackFrame to stack.
         :return: None
         """
-        self.push(StackFrame)
+        if self._shared:
+            self._unshare()
+        self._frames.append(len(self._items))
+        self._items.append(StackFrame)
 
     def pop_frame(self) -> None:
         """
         info: Pop till end of Stack or till a StackFrame is found.
         :return: None
         """
-        while not self.is_empty():
-            if self.pop() is StackFrame:
-                return
+        if self._shared:
+            self._unshare()
+        if self._frames:
+            del self._items[self._frames.pop():]
+        else:
+            self._items.clear()
 
     def clear(self) -> None:
         """
         info: Clear data off Stack.
         :return: None
         """
-        self._stack.clear()
-        self._stack.append(StackBottom)
+        if self._shared:
+            self._drop()
+        self._items = []
+        self._frames = []
@@ -8,19 +8,30 @@ It lets data to be translated VIA file or str.
 
 # built-in
 import io
+import mmap
 import os
+import re
 import string
 from collections import deque
-from typing import Iterator, Optional, Tuple, Dict, List, Union
+from concurrent.futures import Executor, Future
+from typing import Generator, Iterator, Optional, Tuple, Dict, List, Type, Union
 
 # backrooms
 from .backrooms_error import BackroomsError
-from .rooms import Rooms
+from .rooms import Floor, Rooms, SparseFloor
 
 INCLUDE_FILE_EXTENSION = ".brs"
 VALID_ROW_CHARACTERS = set(string.ascii_letters
                            + string.digits
                            + "`~-_=+!@#$%^&*()_+[{]}\\|;:'\",<.>/? ")
+VALID_ROW_BYTES = "".join(sorted(VALID_ROW_CHARACTERS)).encode("ascii")
+
+# files at least this many bytes are mapped into memory by FileHandler
+MMAP_SIZE = 1 << 20
+# encoding of every file read by FileHandler
+FILE_ENCODING = "utf-8"
+# "\r\n", "\r" and "\n" all end a line like they do for a file opened in text mode
+_LINE_END = re.compile(rb"\r\n?|\n")
 
 
 class TranslatorError(BackroomsError):
@@ -44,6 +55,16 @@ class TranslatorError(BackroomsError):
         """
         return cls(f"{repr(include)} has all ready been included!")
 
+    @classmethod
+    def no_snapshot(cls,
+                    name: str) -> 'TranslatorError':
+        """
+        info: Used to indicate a Handler can't be kept as a Snapshot.
+        :param name: str
+        :return: TranslatorError
+        """
+        return cls(f"{repr(name)} can't be kept as a snapshot!")
+
     @classmethod
     def name_collision(cls, name: str):
         return cls(f"Name collision with {name}!")
@@ -102,6 +123,32 @@ class Handler:
         """
         self._is_open = False
 
+    def get_source(self) -> Optional[str]:
+        """
+        info: Gets all the data of the Handler without reading from it.
+        :return: Optional[str]
+            None if the data can't be known before it is read.
+        """
+        return None
+
+    def prefetch(self,
+                 executor: Executor) -> None:
+        """
+        info: Starts reading the Handler on executor before its lines are needed.
+        :param executor: Executor
+        :return: None
+        """
+
+    def get_snapshot(self,
+                     floor_type: Type[Floor]) -> Optional['Snapshot']:
+        """
+        info: Gets a Snapshot of the Handler translated on its own.
+        :param floor_type: Type[Floor]
+        :return: Optional[Snapshot]
+            None if the Handler must be translated line by line.
+        """
+        return None
+
     def __del__(self) -> None:
         """
         info: Makes sure Handler is closed.
@@ -125,15 +172,20 @@ class Handler:
 
 
 class FileHandler(Handler):
+    # files at least this many bytes are mapped into memory instead of buffered
+    _mmap_size: int = MMAP_SIZE
+
     def __init__(self,
                  path: str):
         """
         info: Handler for Files.
+            The file is not touched till its first line is read or it is prefetched.
         :param path: str
         """
         self._path: str = path
         self._file_iter: Optional[Iterator[str]] = None
-        self._file_handler: Optional[io.TextIOWrapper] = None
+        self._file_handler: Optional[io.BufferedReader] = None
+        self._prefetched: Optional[Future] = None
         file_name = os.path.basename(path)
         if file_name.endswith(INCLUDE_FILE_EXTENSION):
             file_name = file_name[:-len(INCLUDE_FILE_EXTENSION)]
@@ -144,22 +196,116 @@ class FileHandler(Handler):
         info: Closes the handler.
         :return: None
         """
-        if self.is_open() and self._file_handler is not None:
-            self._file_handler.close()
+        if self.is_open():
+            if self._prefetched is not None:
+                self._prefetched.cancel()
+            if self._file_iter is not None:
+                self._file_iter.close()
+            if self._file_handler is not None:
+                self._file_handler.close()
         super(FileHandler, self).close()
 
+    def get_source(self) -> Optional[str]:
+        """
+        info: Gets all the data of the Handler without reading from it.
+        :return: Optional[str]
+            None if the file can't be read.
+        """
+        try:
+            with open(self._path, encoding=FILE_ENCODING) as file:
+                return file.read()
+        except (OSError, ValueError):
+            return None
+
+    def prefetch(self,
+                 executor: Executor) -> None:
+        """
+        info: Reads the file on executor so its lines are ready by the time they are needed.
+            Files that would be mapped into memory are left to be mapped.
+        :param executor: Executor
+        :return: None
+        """
+        if self._file_iter is None and self._prefetched is None:
+            self._prefetched = executor.submit(_read_lines, self._path, self._mmap_size)
+
     def __next__(self) -> str:
         """
         info: Gets next line in Handler.
         :return: str
         """
         if self._file_iter is None:
+            self._file_iter = self._open()
+        return next(self._file_iter)
+
+    def _open(self) -> Generator[str, None, None]:
+        """
+        info: Gets the lines of the file.
+        :exception TranslatorError
+            raises TranslatorError if the file is missing.
+        :return: Generator[str, None, None]
+        """
+        if self._prefetched is not None:
             try:
-                self._file_handler = open(self._path)
+                lines = self._prefetched.result()
             except FileNotFoundError:
                 raise TranslatorError.file_not_found_error(self._path)
-            self._file_iter = iter(self._file_handler)
-        return next(self._file_iter).rstrip("\n")
+            if lines is not None:
+                yield from lines
+                return
+        try:
+            self._file_handler = open(self._path, "rb")
+        except FileNotFoundError:
+            raise TranslatorError.file_not_found_error(self._path)
+        if os.fstat(self._file_handler.fileno()).st_size < max(self._mmap_size, 1):
+            # same as opening the file in text mode
+            with io.TextIOWrapper(self._file_handler, encoding=FILE_ENCODING) as file:
+                for line in file:
+                    yield line.rstrip("\n")
+            return
+        file_map = mmap.mmap(self._file_handler.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            at = 0
+            for line_end in _LINE_END.finditer(file_map):
+                yield file_map[at: line_end.start()].decode(FILE_ENCODING)
+                at = line_end.end()
+            if at < len(file_map):
+                yield file_map[at:].decode(FILE_ENCODING)
+        finally:
+            file_map.close()
+
+
+class MmapFileHandler(FileHandler):
+    _mmap_size: int = 0
+
+    def __init__(self,
+                 path: str):
+        """
+        info: Handler for large Files.
+            Maps the file into memory and finds each line in place instead of buffering it.
+            Lines end at "\\n", "\\r\\n" or "\\r" and are decoded as FILE_ENCODING like a FileHandler.
+            FileHandler does the same for files of at least MMAP_SIZE bytes.
+        :param path: str
+        """
+        super(MmapFileHandler, self).__init__(path)
+
+
+def _read_lines(path: str,
+                mmap_size: int) -> Optional[List[str]]:
+    """
+    info: Reads the lines of a file like a FileHandler would.
+    :param path: str
+    :param mmap_size: int
+    :return: Optional[List[str]]
+        None if the file should be mapped instead.
+    """
+    if os.path.getsize(path) >= max(mmap_size, 1):
+        return None
+    with open(path, encoding=FILE_ENCODING) as file:
+        lines = file.read().split("\n")
+    # a file ending in a new line has no line after it
+    if not lines[-1]:
+        lines.pop()
+    return lines
 
 
 class StringHandler(Handler):
@@ -171,9 +317,17 @@ class StringHandler(Handler):
         :param name: str
         :param data: str
         """
+        self._data: str = data
         self._parts: Iterator[str] = iter(data.split("\n"))
         super(StringHandler, self).__init__(name)
 
+    def get_source(self) -> Optional[str]:
+        """
+        info: Gets all the data of the Handler without reading from it.
+        :return: Optional[str]
+        """
+        return self._data
+
     def __next__(self) -> str:
         """
         info: Gets next line in Handler.
@@ -185,15 +339,22 @@ class StringHandler(Handler):
 class Handlers:
     def __init__(self,
                  main: Handler,
-                 name_spaces: Union[List[List[Handler]], Tuple[Tuple[Handler, ...], ...]] = ()):
+                 name_spaces: Union[List[List[Handler]], Tuple[Tuple[Handler, ...], ...]] = (),
+                 prefetch: Optional[Executor] = None):
         """
         info: Holder all the Handles need it for a program.
             Builds the name_spaces so includes can be prioritized.
             Makes sure a handler is not included more than once.
         :param main: Handler
         :param name_spaces: Union[List[List[Handler]], Tuple[Tuple[Handler], ...]])
+        :param prefetch: Optional[Executor]
+            Included Handlers are read on prefetch while earlier Handlers are translated.
+            None reads each Handler once it is reached.
         """
+        self._main: Handler = main
         self._handlers: deque[Handler] = deque((main,))
+        self._included: List[Handler] = []
+        self._prefetch: Optional[Executor] = prefetch
         self._name_spaces: Optional[Tuple[Dict[str, Handler]]] = None
 
         name_spaces_dicts = []
@@ -253,6 +414,51 @@ class Handlers:
         if self._line_number >= 0:
             return self._line_number
 
+    def get_snapshot(self,
+                     floor_type: Type[Floor]) -> Optional['Snapshot']:
+        """
+        info: Gets the Snapshot of the current Handler.
+        :param floor_type: Type[Floor]
+        :return: Optional[Snapshot]
+        """
+        if self._handlers:
+            return self._handlers[0].get_snapshot(floor_type)
+
+    def skip(self) -> None:
+        """
+        info: Closes the current Handler without reading the rest of its lines.
+        :return: None
+        """
+        if self._handlers:
+            self._handlers.popleft().close()
+            self._line_number = -1
+
+    def get_main(self) -> Handler:
+        """
+        info: Gets the main Handler.
+        :return: Handler
+        """
+        return self._main
+
+    def get_included(self) -> Tuple[Handler, ...]:
+        """
+        info: Gets the Handlers included so far in the order they were included.
+        :return: Tuple[Handler, ...]
+        """
+        return tuple(self._included)
+
+    def find_include(self,
+                     name: str) -> Optional[Handler]:
+        """
+        info: Finds the Handler name would be included from without including it.
+        :param name: str
+        :return: Optional[Handler]
+            None if no name space has name.
+        """
+        for name_space in self._name_spaces:
+            if name in name_space:
+                return name_space[name]
+
     def include(self,
                 name: str) -> bool:
         """
@@ -264,16 +470,29 @@ class Handlers:
         """
         # check that name has not be included yet
         if name not in self._used_names:
-            for name_space in self._name_spaces:
-                if name in name_space:
-                    self._used_names.add(name)
-                    self._handlers.append(name_space[name])
-                    return True
-            # could not find the include handler
-            raise TranslatorError.missing_include(name)
+            handler = self.find_include(name)
+            if handler is None:
+                # could not find the include handler
+                raise TranslatorError.missing_include(name)
+            self._used_names.add(name)
+            self._included.append(handler)
+            self._handlers.append(handler)
+            if self._prefetch is not None:
+                handler.prefetch(self._prefetch)
+            return True
         return False
 
 
+def _is_row(row: str) -> bool:
+    """
+    info: Checks that every character of row is in VALID_ROW_CHARACTERS.
+    :param row: str
+    :return: bool
+    """
+    # delete every valid character at once and see if anything is left
+    return row.isascii() and not row.encode("ascii").translate(None, VALID_ROW_BYTES)
+
+
 def _tokenize_line(line: str) -> List[str]:
     """
     info: Tokenize line.
@@ -343,24 +562,27 @@ def _read_single_number(line: str,
     raise TranslatorError.bad_line(full_line, line_number, handler_name)
 
 
-def translator(handlers: Handlers) -> Rooms:
+def translator(handlers: Handlers,
+               floor_type: Type[Floor] = SparseFloor,
+               rooms: Optional[Rooms] = None) -> Rooms:
     """
     info: Load program into Rooms "memory"
     :param handlers: Handlers
+    :param floor_type: Type[Floor]
+    :param rooms: Optional[Rooms]
+        Empty Rooms to load into. None makes a new Rooms of floor_type.
     :exception TranslatorError
             raises TranslatorError if handlers give an invalid line.
     :return: Rooms
     """
-    rooms = Rooms()
+    if rooms is None:
+        rooms = Rooms(floor_type)
     x, y, floor = 0, 0, 1
     slider = 0
     for line in handlers:
         full_line = line
         # throw away lead white space
-        while line:
-            if line[0] not in string.whitespace:
-                break
-            line = line[1:]
+        line = line.lstrip(string.whitespace)
         try:
             # enter new handler
             if handlers.get_line_number() == 0:
@@ -370,15 +592,21 @@ def translator(handlers: Handlers) -> Rooms:
                 # go down a floor
                 floor += -1 + slider
                 slider = 0
+                # paste the handler if it was all ready translated
+                snapshot = handlers.get_snapshot(floor_type)
+                if snapshot is not None and snapshot.fits(rooms, floor):
+                    floor = snapshot.paste(rooms, handlers, floor)
+                    handlers.skip()
+                    continue
                 # set the floor name to the handlers name
                 rooms.set_floor_name(floor, handlers.get_name())
 
             # row
             if line.startswith("/"):
                 # write row into rooms
-                if any((characters not in VALID_ROW_CHARACTERS for characters in line[1:])):
+                if not _is_row(line[1:]):
                     raise TranslatorError.bad_line(full_line, handlers.get_line_number(), handlers.get_name())
-                rooms.write_line(x, y, floor, line[1:], 1, 0, 0)
+                rooms.write_row(x, y, floor, line[1:])
                 # go down a row
                 y += -1
             # comment
@@ -527,18 +755,236 @@ def translator(handlers: Handlers) -> Rooms:
     return rooms
 
 
+# name given to the floor after a Handler while it is being kept as a Snapshot
+_SNAPSHOT_END = "_SNAPSHOT_END_"
+
+# Snapshots of SnapshotHandlers by name, data and floor type
+_SNAPSHOTS: Dict[Tuple[str, str, Type[Floor]], Optional['Snapshot']] = {}
+
+
+class _SnapshotRooms(Rooms):
+    def __init__(self,
+                 floor_type: Type[Floor]):
+        """
+        info: Rooms that records what a Handler does to floors it does not own.
+        :param floor_type: Type[Floor]
+        """
+        super(_SnapshotRooms, self).__init__(floor_type)
+        self.steps: List[tuple] = []
+        self._duplicate_name: Optional[str] = None
+
+    def set_floor_name(self,
+                       floor_level: int,
+                       floor_name: Optional[str] = None) -> None:
+        """
+        info: Sets a floor name and records it.
+        :param floor_level: int
+        :param floor_name: Optional[str]
+        :return: None
+        """
+        super(_SnapshotRooms, self).set_floor_name(floor_level, floor_name)
+        self.steps.append(("name", floor_level, floor_name))
+
+    def get_floor_level(self,
+                        floor_name: str) -> Optional[int]:
+        """
+        info: Remembers the name of a floor about to be duplicated.
+        :param floor_name: str
+        :exception TranslatorError
+            raises TranslatorError if the floor belongs to the Handler.
+        :return: Optional[int]
+            Always None since the floor is not known till the Snapshot is pasted.
+        """
+        if super(_SnapshotRooms, self).get_floor_level(floor_name) is not None:
+            raise TranslatorError.no_snapshot(floor_name)
+        self._duplicate_name = floor_name
+        return None
+
+    def duplicate_floor(self,
+                        floor_level_from: Optional[int],
+                        floor_level_to: int) -> None:
+        """
+        info: Records a duplicate of a floor found by name.
+        :param floor_level_from: Optional[int]
+        :param floor_level_to: int
+        :exception TranslatorError
+            raises TranslatorError if the floor was not found by name.
+        :return: None
+        """
+        if self._duplicate_name is None:
+            raise TranslatorError.no_snapshot(str(floor_level_from))
+        self.steps.append(("duplicate", self._duplicate_name, floor_level_to))
+        self._duplicate_name = None
+
+
+class _SnapshotHandlers(Handlers):
+    def __init__(self,
+                 main: Handler,
+                 includes: List[bool],
+                 steps: List[tuple]):
+        """
+        info: Handlers that records includes instead of following them.
+        :param main: Handler
+        :param includes: List[bool]
+            If each include of main is a must include.
+        :param steps: List[tuple]
+            Where includes are recorded.
+        """
+        super(_SnapshotHandlers, self).__init__(main)
+        self._handlers.append(StringHandler(_SNAPSHOT_END, ""))
+        self._includes: Iterator[bool] = iter(includes)
+        self._steps: List[tuple] = steps
+
+    def include(self,
+                name: str) -> bool:
+        """
+        info: Records an include.
+        :param name: str
+        :return: bool
+        """
+        self._steps.append(("include", name, next(self._includes)))
+        return True
+
+
+class Snapshot:
+    def __init__(self,
+                 rooms: Rooms,
+                 floor_levels: Tuple[int, ...],
+                 steps: Tuple[tuple, ...],
+                 next_floor_level: int):
+        """
+        info: Holds a Handler translated on its own with floors relative to where it started.
+        :param rooms: Rooms
+            Floors and hallways of the Handler.
+        :param floor_levels: Tuple[int, ...]
+            Floors the Handler wrote to.
+        :param steps: Tuple[tuple, ...]
+            Floor names, includes and duplicates in the order the Handler made them.
+        :param next_floor_level: int
+            Where the next Handler starts.
+        """
+        self._rooms: Rooms = rooms
+        self._floor_levels: Tuple[int, ...] = floor_levels
+        self._steps: Tuple[tuple, ...] = steps
+        self._next_floor_level: int = next_floor_level
+
+    @classmethod
+    def take(cls,
+             handler: Handler,
+             lines: List[str],
+             floor_type: Type[Floor]) -> Optional['Snapshot']:
+        """
+        info: Translates a Handler on its own.
+        :param handler: Handler
+            Fresh Handler giving lines.
+        :param lines: List[str]
+            Every line of handler.
+        :param floor_type: Type[Floor]
+        :return: Optional[Snapshot]
+            None if handler uses absolute floors or floors it does not own.
+        """
+        includes = []
+        for line in lines:
+            line = line.lstrip(string.whitespace)
+            if line.startswith("F") and not line.startswith("FS"):
+                return None
+            if line.startswith("=") and len(_tokenize_line(line[1:])) > 2:
+                return None
+            if line.startswith("%") or line.startswith("!"):
+                includes.append(line.startswith("!"))
+
+        rooms = _SnapshotRooms(floor_type)
+        try:
+            translator(_SnapshotHandlers(handler, includes, rooms.steps), floor_type, rooms)
+        except TranslatorError:
+            return None
+
+        # the last step names the floor the next Handler starts at
+        next_floor_level = rooms.steps[-1][1]
+        steps = tuple(rooms.steps[:-1])
+        floor_levels = set(rooms.get_floor_levels()) | set(rooms.get_hallways())
+        # duplicates onto floors the handler wrote to depend on when they happen
+        for step in steps:
+            if step[0] == "duplicate" and step[2] in floor_levels:
+                return None
+        return cls(rooms, tuple(sorted(floor_levels)), steps, next_floor_level)
+
+    def fits(self,
+             rooms: Rooms,
+             floor_level: int) -> bool:
+        """
+        info: Checks that the Snapshot can be pasted without covering anything.
+        :param rooms: Rooms
+        :param floor_level: int
+        :return: bool
+        """
+        for snapshot_floor_level in self._floor_levels:
+            if rooms.is_floor_used(floor_level + snapshot_floor_level):
+                return False
+        return rooms.get_floor_type() is self._rooms.get_floor_type()
+
+    def paste(self,
+              rooms: Rooms,
+              handlers: Handlers,
+              floor_level: int) -> int:
+        """
+        info: Pastes the Snapshot like the Handler was translated at floor_level.
+        :param rooms: Rooms
+        :param handlers: Handlers
+        :param floor_level: int
+        :exception TranslatorError
+            raises TranslatorError if an include is missing or a must include was all ready included.
+        :return: int
+            Floor the translator is left on.
+        """
+        for snapshot_floor_level in self._floor_levels:
+            rooms.copy_floor(self._rooms, snapshot_floor_level, floor_level + snapshot_floor_level)
+        for step in self._steps:
+            if step[0] == "name":
+                rooms.set_floor_name(floor_level + step[1], step[2])
+            elif step[0] == "include":
+                if not handlers.include(step[1]) and step[2]:
+                    raise TranslatorError.must_include(step[1])
+            else:
+                rooms.duplicate_floor(rooms.get_floor_level(step[1]), floor_level + step[2])
+        return floor_level + self._next_floor_level + 1
+
+
+class SnapshotHandler(StringHandler):
+    def __init__(self,
+                 name: str,
+                 data: str):
+        """
+        info: StringHandler that is translated once per floor type and pasted from then on.
+        :param name: str
+        :param data: str
+        """
+        super(SnapshotHandler, self).__init__(name, data)
+
+    def get_snapshot(self,
+                     floor_type: Type[Floor]) -> Optional[Snapshot]:
+        """
+        info: Gets a Snapshot of the Handler translated on its own.
+        :param floor_type: Type[Floor]
+        :return: Optional[Snapshot]
+        """
+        key = (self.get_name(), self._data, floor_type)
+        if key not in _SNAPSHOTS:
+            _SNAPSHOTS[key] = Snapshot.take(StringHandler(self.get_name(), self._data),
+                                            self._data.split("\n"),
+                                            floor_type)
+        return _SNAPSHOTS[key]
+
+
 def load_dir(file: str) -> Tuple[Handler, Tuple[Handler, ...]]:
     """
     info: Loads all files in a file dir into handlers.
+        Only the names of the files are read, a file is opened once it is included.
     :param file: str
     :return: Tuple[Handler, Tuple[Handler, ...]]
     """
     file = os.path.abspath(file)
     main_handler = FileHandler(file)
-    handlers = []
-    file_dir = os.path.join(*os.path.split(file)[:-1])
-    for file in os.listdir(file_dir):
-        file = os.path.join(file_dir, file)
-        if os.path.isfile(file):
-            handlers.append(FileHandler(file))
-    return main_handler, tuple(handlers)
+    with os.scandir(os.path.dirname(file)) as entries:
+        handlers = tuple(FileHandler(entry.path) for entry in entries if entry.is_file())
+    return main_handler, handlers
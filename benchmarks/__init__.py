@@ -0,0 +1,93 @@
+"""
+Copyright 2021 Charles McMarrow
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Holds benchmarks for Backrooms.
+Each benchmark module has a benchmark function that prints its results.
+"""
+
+# built-in
+import os
+import time
+import tracemalloc
+from typing import Callable, Tuple
+
+# backrooms
+from . import blank_walk_benchmarks
+from . import blocks_benchmarks
+from . import dispatch_benchmarks
+from . import rooms_benchmarks
+from . import scheduler_benchmarks
+from . import startup_benchmarks
+from . import watcher_benchmarks
+
+BENCHMARK_MODULES = (rooms_benchmarks,
+                     blank_walk_benchmarks,
+                     dispatch_benchmarks,
+                     watcher_benchmarks,
+                     startup_benchmarks,
+                     scheduler_benchmarks,
+                     blocks_benchmarks)
+EXAMPLES = os.path.join(os.path.dirname(os.path.dirname(__file__)), "examples")
+
+
+def get_example_path(*path: str) -> str:
+    """
+    info: Gets the absolute path to an example.
+    :param path: str
+    :return: str
+    """
+    return os.path.join(EXAMPLES, *path)
+
+
+def measure_time(function: Callable[[], object],
+                 repeat: int = 5) -> float:
+    """
+    info: Gets the best wall time of function in seconds.
+    :param function: Callable[[], object]
+    :param repeat: int
+    :return: float
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure_memory(function: Callable[[], object]) -> Tuple[object, int]:
+    """
+    info: Gets what function returns and the bytes it left allocated.
+    :param function: Callable[[], object]
+    :return: Tuple[object, int]
+    """
+    tracemalloc.start()
+    try:
+        result = function()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, size
+
+
+def benchmarks() -> None:
+    """
+    info: Run benchmarks and write to stdio.
+    :return: None
+    """
+    for module in BENCHMARK_MODULES:
+        print(f"### {module.__name__.split('.')[-1]}", flush=True)
+        module.benchmark()
+        print(flush=True)
@@ -0,0 +1,67 @@
+"""
+Copyright 2021 Charles McMarrow
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Checks that walking blank cells does not grow memory.
+"""
+
+# built-in
+from typing import Tuple, Type
+
+# backrooms
+from backrooms.portal import Portal, PortalError
+from backrooms.rooms import DenseFloor, Floor, SparseFloor
+from backrooms.translator import Handlers, StringHandler, translator
+import benchmarks
+
+# walks to the right forever over blank cells
+PROGRAM = """
+~GATE
+/>
+"""
+STEPS = (100000, 1000000, 2000000)
+
+
+def _walk(floor_type: Type[Floor],
+          steps: int) -> Tuple[int, int]:
+    """
+    info: Walks steps blank cells.
+    :param floor_type: Type[Floor]
+    :param steps: int
+    :return: Tuple[int, int]
+        Bytes the walk left allocated and cells stored on the floor.
+    """
+    rooms = translator(Handlers(StringHandler("main", PROGRAM)), floor_type)
+    portal = Portal(rooms, sys_output=False, lost_count=steps)
+
+    def walk() -> None:
+        try:
+            portal()
+        except PortalError:
+            pass
+
+    _, size = benchmarks.measure_memory(walk)
+    return size, rooms.get_cell_count(0)
+
+
+def benchmark() -> None:
+    """
+    info: Prints memory left behind after walking blank cells.
+    :return: None
+    """
+    for floor_type in (SparseFloor, DenseFloor):
+        for steps in STEPS:
+            size, cells = _walk(floor_type, steps)
+            print(f"{floor_type.__name__:<12} {steps:>8} blank cells    "
+                  f"memory: {size / 1024:>9.1f} KiB    stored cells: {cells}")
@@ -0,0 +1,114 @@
+"""
+Copyright 2021 Charles McMarrow
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Measures what compiling Blocks saves on the example programs that write to their own code floor or turn a lot,
+with one conscious and with many consciouses sharing the quantum.
+"""
+
+# built-in
+from copy import deepcopy
+from typing import Optional, Tuple, Union
+
+# backrooms
+from backrooms.backrooms import backrooms_api, StringHandler
+from backrooms.portal import Portal, PortalError
+from backrooms.translator import Handler
+import benchmarks
+
+# example path, inputs, lost count
+BLOCK_PROGRAMS = ((("8_bit", "8_bit.brs"), None, 0),
+                  (("turing", "turing.brs"), None, 200000))
+THREAD_DOUBLINGS = 4
+QUANTA = (1, 16, 64)
+LOST_COUNT = 100000
+
+
+def _get_workers_code(doublings: int) -> str:
+    """
+    info: Makes a program where every conscious counts up forever through a row of straight Rules.
+    :param doublings: int
+    :return: str
+    """
+    spawn = "t" * doublings + "ri0"
+    return "\n".join(("~GATE",
+                      "/" + spawn + ">+dpri1ri2ri3ppp....V",
+                      "/" + " " * len(spawn) + "^...................<"))
+
+
+def _run(portal: Portal) -> None:
+    """
+    info: Runs portal till it halts or gets lost.
+    :param portal: Portal
+    :return: None
+    """
+    try:
+        portal()
+    except PortalError:
+        pass
+
+
+def _load(code: Union[str, Handler],
+          inputs: Optional[Tuple[str, ...]],
+          lost_count: int,
+          compile_blocks: bool,
+          quantum: int = 1) -> Portal:
+    """
+    info: Loads a program.
+    :param code: Union[str, Handler]
+    :param inputs: Optional[Tuple[str, ...]]
+    :param lost_count: int
+    :param compile_blocks: bool
+    :param quantum: int
+    :return: Portal
+    """
+    if inputs is None:
+        inputs = ()
+    return backrooms_api(code,
+                         inputs=inputs,
+                         sys_output=False,
+                         lost_count=lost_count,
+                         compile_blocks=compile_blocks,
+                         quantum=quantum)
+
+
+def _compare(name: str,
+             portal: Portal,
+             block_portal: Portal) -> None:
+    """
+    info: Prints the time portal takes with and without Blocks.
+    :param name: str
+    :param portal: Portal
+    :param block_portal: Portal
+    :return: None
+    """
+    seconds = benchmarks.measure_time(lambda: _run(deepcopy(portal)))
+    block_seconds = benchmarks.measure_time(lambda: _run(deepcopy(block_portal)))
+    print(f"{name:<22} {seconds:>8.3f} s    blocks: {block_seconds:>8.3f} s    {seconds / block_seconds:>5.2f}x")
+
+
+def benchmark() -> None:
+    """
+    info: Prints the time 8_bit, turing and many counting consciouses take with and without Blocks.
+    :return: None
+    """
+    for path, inputs, lost_count in BLOCK_PROGRAMS:
+        _compare(path[-1],
+                 _load(benchmarks.get_example_path(*path), inputs, lost_count, False),
+                 _load(benchmarks.get_example_path(*path), inputs, lost_count, True))
+    code = _get_workers_code(THREAD_DOUBLINGS)
+    for quantum in QUANTA:
+        _compare(f"workers quantum {quantum}",
+                 _load(StringHandler("workers", code), None, LOST_COUNT, False, quantum),
+                 _load(StringHandler("workers", code), None, LOST_COUNT, True, quantum))
@@ -0,0 +1,98 @@
+"""
+Copyright 2021 Charles McMarrow
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Measures the per Rule overhead of Portal on the example programs.
+"""
+
+# built-in
+from copy import deepcopy
+from typing import Optional, Tuple
+
+# backrooms
+from backrooms.backrooms import backrooms_api
+from backrooms.portal import Portal, PortalError
+import benchmarks
+
+# example path, inputs, lost count
+EXAMPLE_PROGRAMS = ((("8_bit", "8_bit.brs"), None, 0),
+                    (("bottles", "bottles.brs"), None, 0),
+                    (("fibonacci", "fibonacci.brs"), None, 0),
+                    (("tic_tac_toe", "tic_tac_toe.brs"), ("5", "1", "9", "3", "2", "8", "7", "4", "6", "n"), 0),
+                    (("turing", "turing.brs"), None, 200000))
+
+
+def _run(portal: Portal) -> None:
+    """
+    info: Runs portal till it halts or gets lost.
+    :param portal: Portal
+    :return: None
+    """
+    try:
+        portal()
+    except PortalError:
+        pass
+
+
+def _count_rules(portal: Portal) -> int:
+    """
+    info: Counts the Rules portal runs.
+    :param portal: Portal
+    :return: int
+    """
+    count = 0
+    try:
+        for rule in portal:
+            count += 1
+            for _ in rule:
+                pass
+    except PortalError:
+        pass
+    return count
+
+
+def _load(path: Tuple[str, ...],
+          inputs: Optional[Tuple[str, ...]],
+          lost_count: int,
+          compile_blocks: bool = False) -> Portal:
+    """
+    info: Loads an example program.
+    :param path: Tuple[str, ...]
+    :param inputs: Optional[Tuple[str, ...]]
+    :param lost_count: int
+    :param compile_blocks: bool
+    :return: Portal
+    """
+    if inputs is None:
+        inputs = ()
+    return backrooms_api(benchmarks.get_example_path(*path),
+                         inputs=inputs,
+                         sys_output=False,
+                         lost_count=lost_count,
+                         compile_blocks=compile_blocks)
+
+
+def benchmark() -> None:
+    """
+    info: Prints the time each example program spends per Rule.
+    :return: None
+    """
+    for path, inputs, lost_count in EXAMPLE_PROGRAMS:
+        portal = _load(path, inputs, lost_count)
+        rules = _count_rules(deepcopy(portal))
+        seconds = benchmarks.measure_time(lambda: _run(deepcopy(portal)))
+        block_portal = _load(path, inputs, lost_count, compile_blocks=True)
+        block_seconds = benchmarks.measure_time(lambda: _run(deepcopy(block_portal)))
+        print(f"{path[-1]:<18} rules: {rules:>8}    {seconds / rules * 1e9:>8.1f} ns/rule"
+              f"    blocks: {block_seconds / rules * 1e9:>8.1f} ns/rule")
@@ -0,0 +1,65 @@
+"""
+Copyright 2021 Charles McMarrow
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Compares the Rooms storage backends.
+"""
+
+# built-in
+from typing import Type
+
+# backrooms
+from backrooms.rooms import DenseFloor, Floor, Rooms, SparseFloor
+import benchmarks
+
+WIDTH = 250
+HEIGHT = 200
+
+
+def _build(floor_type: Type[Floor]) -> Rooms:
+    """
+    info: Fills a floor the size of a large generated program.
+    :param floor_type: Type[Floor]
+    :return: Rooms
+    """
+    rooms = Rooms(floor_type)
+    for y in range(HEIGHT):
+        rooms.write_line(0, -y, 0, "".join(chr(33 + (x * y) % 90) for x in range(WIDTH)), 1, 0, 0)
+    return rooms
+
+
+def _read_all(rooms: Rooms) -> None:
+    """
+    info: Reads every cell of the floor.
+    :param rooms: Rooms
+    :return: None
+    """
+    read = rooms.read
+    for y in range(HEIGHT):
+        for x in range(WIDTH):
+            read(x, -y, 0)
+
+
+def benchmark() -> None:
+    """
+    info: Prints memory and read throughput for each backend.
+    :return: None
+    """
+    cells = WIDTH * HEIGHT
+    print(f"{cells} cells")
+    for floor_type in (SparseFloor, DenseFloor):
+        rooms, size = benchmarks.measure_memory(lambda: _build(floor_type))
+        seconds = benchmarks.measure_time(lambda: _read_all(rooms))
+        print(f"{floor_type.__name__:<12} memory: {size / 1024:>9.1f} KiB    "
+              f"read: {cells / seconds / 1e6:>6.2f} M cells/s")
@@ -0,0 +1,100 @@
+"""
+Copyright 2021 Charles McMarrow
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Measures how the scheduling quantum of Portal changes the per Rule overhead of programs with many consciouses
+and how much spinning parking consciouses on the ThreadLock saves.
+"""
+
+# built-in
+from copy import deepcopy
+
+# backrooms
+from backrooms.backrooms import backrooms_api, StringHandler
+from backrooms.portal import Portal, PortalError
+import benchmarks
+
+# each ThreadThread doubles the consciouses
+THREAD_DOUBLINGS = (2, 4, 6)
+QUANTA = (1, 4, 16, 64)
+LOST_COUNT = 100000
+
+
+def _get_workers_code(doublings: int) -> str:
+    """
+    info: Makes a program where every conscious counts up forever.
+    :param doublings: int
+    :return: str
+    """
+    spawn = "t" * doublings + "ri0"
+    return "\n".join(("~GATE",
+                      "/" + spawn + ">+dpV",
+                      "/" + " " * len(spawn) + "^...<"))
+
+
+def _get_lock_code(doublings: int) -> str:
+    """
+    info: Makes a program where every conscious counts up forever while holding the ThreadLock.
+    :param doublings: int
+    :return: str
+    """
+    spawn = "t" * doublings + "ri0"
+    return "\n".join(("~GATE",
+                      "/" + spawn + ">tl+dpdptuV",
+                      "/" + " " * len(spawn) + "^.........<"))
+
+
+def _run(portal: Portal) -> None:
+    """
+    info: Runs portal till it gets lost.
+    :param portal: Portal
+    :return: None
+    """
+    try:
+        portal()
+    except PortalError:
+        pass
+
+
+def benchmark() -> None:
+    """
+    info: Prints the time spent per Rule for different numbers of consciouses and quanta.
+    :return: None
+    """
+    for doublings in THREAD_DOUBLINGS:
+        code = _get_workers_code(doublings)
+        results = []
+        for quantum in QUANTA:
+            portal = backrooms_api(StringHandler("workers", code),
+                                   sys_output=False,
+                                   br_builtins=False,
+                                   lost_count=LOST_COUNT,
+                                   quantum=quantum)
+            seconds = benchmarks.measure_time(lambda: _run(deepcopy(portal)))
+            results.append(f"quantum {quantum:>2}: {seconds / LOST_COUNT * 1e9:>6.1f} ns/rule")
+        print(f"workers: {2 ** doublings:>3}    " + "    ".join(results))
+
+    for doublings in THREAD_DOUBLINGS:
+        code = _get_lock_code(doublings)
+        results = []
+        for quantum in QUANTA:
+            portal = backrooms_api(StringHandler("lock", code),
+                                   sys_output=False,
+                                   br_builtins=False,
+                                   lost_count=LOST_COUNT,
+                                   quantum=quantum)
+            _run(portal)
+            counts = sum(conscious.work_stack.peak() for conscious in portal.get_consciouses())
+            results.append(f"quantum {quantum:>2}: {counts:>5} counts {portal.get_spins_avoided():>7} spins avoided")
+        print(f"lock workers: {2 ** doublings:>3}    " + "    ".join(results))
@@ -0,0 +1,110 @@
+"""
+Copyright 2021 Charles McMarrow
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Measures how long the example programs take to start with and without an image.
+"""
+
+# built-in
+import os
+import tempfile
+from typing import Callable
+
+# backrooms
+from backrooms.backrooms import _translate
+from backrooms.backrooms_builtins import get_builtins
+from backrooms.image import dump_image, load_image
+from backrooms.rooms import Rooms, SparseFloor
+from backrooms.translator import FileHandler, Handler, Handlers, load_dir, MmapFileHandler, StringHandler, translator
+import benchmarks
+
+EXAMPLE_PROGRAMS = (("hello_world", "hello_world.brs"),
+                    ("bottles", "bottles.brs"),
+                    ("fibonacci_cache", "fibonacci_cache.brs"),
+                    ("scripts", "main.brs"),
+                    ("tic_tac_toe", "tic_tac_toe.brs"),
+                    ("turing", "turing.brs"))
+
+
+# indented rows in the large generated program
+LARGE_ROWS = 20000
+LARGE_ROW = " " * 64 + "/" + "ri1>rs\"abc\"ep" * 8
+
+
+def _translate_handler(handler_type: type, path: str) -> Callable[[], Rooms]:
+    """
+    info: Makes a function that translates a single file with a Handler type.
+    :param handler_type: type
+    :param path: str
+    :return: Callable[[], Rooms]
+    """
+    def translate() -> Rooms:
+        handler: Handler = handler_type(path)
+        try:
+            return translator(Handlers(handler), SparseFloor)
+        finally:
+            handler.close()
+    return translate
+
+
+def _translate_builtins(code: str, snapshots: bool) -> Callable[[], Rooms]:
+    """
+    info: Makes a function that translates code with the builtins pasted from snapshots or read line by line.
+    :param code: str
+    :param snapshots: bool
+    :return: Callable[[], Rooms]
+    """
+    def translate() -> Rooms:
+        main_handler, handlers = load_dir(code)
+        builtins = get_builtins()
+        if not snapshots:
+            builtins = tuple(StringHandler(builtin.get_name(), builtin.get_source()) for builtin in builtins)
+        return translator(Handlers(main_handler, (handlers, builtins)), SparseFloor)
+    return translate
+
+
+def benchmark() -> None:
+    """
+    info: Prints ms to translate each example, load its image and load it through a warm image cache.
+        Then prints ms to translate each example with builtins read line by line and pasted from snapshots.
+        Then prints ms to translate a large generated program with each file Handler.
+    :return: None
+    """
+    with tempfile.TemporaryDirectory() as image_cache:
+        for path in EXAMPLE_PROGRAMS:
+            code = benchmarks.get_example_path(*path)
+            image = dump_image(_translate(code, True, SparseFloor))
+            translate_seconds = benchmarks.measure_time(lambda: _translate(code, True, SparseFloor))
+            load_seconds = benchmarks.measure_time(lambda: load_image(image))
+            # first call fills the cache
+            _translate(code, True, SparseFloor, image_cache)
+            cached_seconds = benchmarks.measure_time(lambda: _translate(code, True, SparseFloor, image_cache))
+            print(f"{path[-1]:<20} translate {translate_seconds * 1e3:>8.2f} ms "
+                  f"load image {load_seconds * 1e3:>8.2f} ms "
+                  f"cached {cached_seconds * 1e3:>8.2f} ms "
+                  f"image {len(image):>6} bytes")
+            builtin_seconds = benchmarks.measure_time(_translate_builtins(code, False))
+            snapshot_seconds = benchmarks.measure_time(_translate_builtins(code, True))
+            print(f"{path[-1]:<20} builtins read {builtin_seconds * 1e3:>8.2f} ms "
+                  f"builtins pasted {snapshot_seconds * 1e3:>8.2f} ms")
+
+        path = os.path.join(image_cache, "large.brs")
+        with open(path, "w") as file:
+            for _ in range(LARGE_ROWS):
+                print(LARGE_ROW, file=file)
+        mega_bytes = os.path.getsize(path) / 1e6
+        for handler_type in (FileHandler, MmapFileHandler):
+            seconds = benchmarks.measure_time(_translate_handler(handler_type, path), repeat=3)
+            print(f"{'large.brs':<20} {handler_type.__name__:<16} {seconds * 1e3:>8.2f} ms "
+                  f"{mega_bytes / seconds:>8.2f} MB/s")
@@ -0,0 +1,100 @@
+"""
+Copyright 2021 Charles McMarrow
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+   http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Measures what Rooms Watchers cost the write heavy dump Rules.
+"""
+
+# built-in
+from typing import Callable
+
+# backrooms
+from backrooms.conscious import Conscious
+from backrooms.rooms import Rooms
+from backrooms.rules import UncommonDynamicDump, UncommonSimpleDump, WorkSpace
+import benchmarks
+
+ITEM = "".join(chr(33 + index % 90) for index in range(200))
+DUMPS = 500
+
+
+def _no_watchers(rooms: Rooms) -> None:
+    """
+    info: Leaves Rooms with nobody subscribed.
+    :param rooms: Rooms
+    :return: None
+    """
+
+
+def _other_floor_watchers(rooms: Rooms) -> None:
+    """
+    info: Subscribes to cells on a floor the dumps never write to.
+    :param rooms: Rooms
+    :return: None
+    """
+    for y in range(100):
+        rooms.add_watcher(1, 0, y, len(ITEM), y, lambda: None)
+
+
+def _other_row_watchers(rooms: Rooms) -> None:
+    """
+    info: Subscribes to rows on the same floor the dumps never write to.
+    :param rooms: Rooms
+    :return: None
+    """
+    for y in range(1, 101):
+        rooms.add_watcher(0, 0, y, len(ITEM), y, lambda: None)
+
+
+def _dump(rule_type: type, setup: Callable[[Rooms], None]) -> Callable[[], None]:
+    """
+    info: Makes a function that runs a dump Rule DUMPS times.
+    :param rule_type: type
+    :param setup: Callable[[Rooms], None]
+    :return: Callable[[], None]
+    """
+    rooms = Rooms()
+    setup(rooms)
+    rule = rule_type(WorkSpace(), False)
+    conscious = Conscious()
+
+    def dump() -> None:
+        for _ in range(DUMPS):
+            if rule_type is UncommonDynamicDump:
+                conscious.work_stack.push(ITEM)
+                conscious.work_stack.push(0)
+                conscious.work_stack.push(0)
+                conscious.work_stack.push(0)
+                conscious.work_stack.push(1)
+                conscious.work_stack.push(0)
+                conscious.work_stack.push(0)
+            else:
+                conscious.work_stack.push(ITEM)
+                conscious.work_stack.push(0)
+                conscious.work_stack.push(0)
+                conscious.work_stack.push(0)
+            rule.run(None, rooms, conscious, conscious.at(), [])
+    return dump
+
+
+def benchmark() -> None:
+    """
+    info: Prints ns per cell written by the dump Rules with and without Watchers.
+    :return: None
+    """
+    cells = DUMPS * len(ITEM)
+    for rule_type in (UncommonSimpleDump, UncommonDynamicDump):
+        for setup in (_no_watchers, _other_floor_watchers, _other_row_watchers):
+            seconds = benchmarks.measure_time(_dump(rule_type, setup))
+            print(f"{rule_type.__name__:<20} {setup.__name__[1:]:<22} {seconds / cells * 1e9:>8.1f} ns/cell")
@@ -53,5 +53,6 @@ setup(
                  "Programming Language :: Python :: 3.9",
                  "Programming Language :: Python :: 3.10"],
 
-    entry_points={"console_scripts": ["backrooms = backrooms.backrooms:backrooms"]}
+    entry_points={"console_scripts": ["backrooms = backrooms.backrooms:backrooms",
+                                      "backrooms_batch = backrooms.batch:batch"]}
 )
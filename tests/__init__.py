@@ -22,14 +22,19 @@ import sys
 import unittest
 
 # backrooms
+from . import async_portal_tests
 from . import backrooms_tests
+from . import batch_tests
+from . import blocks_tests
 from . import conscious_tests
 from . import full_test_runner
 from . import hard_vector_tests
 from . import heap_tests
+from . import image_tests
 from . import portal_tests
 from . import rooms_tests
 from . import rules_tests
+from . import sinks_tests
 from . import stack_tests
 from . import test_files
 from . import translator_tests
@@ -0,0 +1,134 @@
+"""
+Copyright 2021 Charles McMarrow
+"""
+
+# built-in
+import asyncio
+import unittest
+
+# backrooms
+from backrooms.async_portal import AsyncPortal, AsyncPortalError
+from backrooms.portal import Portal, PortalError
+from backrooms.translator import StringHandler, Handlers, translator
+
+
+def _make_portal(main: str, **kwargs) -> Portal:
+    return Portal(translator(Handlers(StringHandler("main", main))),
+                  feeder=True,
+                  sys_output=False,
+                  **kwargs)
+
+
+async def _collect(async_portal: AsyncPortal) -> list:
+    return [output async for output in async_portal.outputs()]
+
+
+class AsyncPortalTests(unittest.TestCase):
+    def test_init(self):
+        main = """
+        ~GATE
+        /~ha
+        """
+        self.assertIsInstance(AsyncPortal(_make_portal(main)), AsyncPortal)
+        self.assertRaises(AsyncPortalError,
+                          AsyncPortal,
+                          Portal(translator(Handlers(StringHandler("main", main))), inputs=(), sys_output=False))
+        self.assertRaises(AsyncPortalError, AsyncPortal, _make_portal(main), 0)
+
+    def test_run_send_input_and_outputs(self):
+        main = """
+        ~GATE
+        /rs"name?"ecrs"hi "zbjecep~ha
+        """
+
+        async def session():
+            async_portal = AsyncPortal(_make_portal(main), rule_budget=3)
+            outputs = asyncio.ensure_future(_collect(async_portal))
+            await asyncio.gather(async_portal.run(),
+                                 async_portal.send_input("cats"),
+                                 async_portal.send_input("dogs"))
+            return await outputs
+
+        self.assertEqual(asyncio.run(session()), ["name?", "hi cats", "dogs"])
+
+    def test_sessions_share_event_loop(self):
+        main = """
+        ~GATE
+        /ri0>+deV
+        /   ^...<
+        """
+
+        async def sessions():
+            async_portals = [AsyncPortal(_make_portal(main, lost_count=500), rule_budget=10) for _ in range(3)]
+            outputs = [asyncio.ensure_future(_collect(async_portal)) for async_portal in async_portals]
+            runs = await asyncio.gather(*(async_portal.run() for async_portal in async_portals),
+                                        return_exceptions=True)
+            return runs, await asyncio.gather(*outputs)
+
+        runs, outputs = asyncio.run(sessions())
+        for run in runs:
+            self.assertIsInstance(run, PortalError)
+        for output in outputs:
+            self.assertEqual(output, outputs[0])
+            self.assertEqual(output[:3], [1, 2, 3])
+
+    def test_catch_output(self):
+        main = """
+        ~GATE
+        /ri1ers"cats"e~ha
+        """
+
+        async def session(portal):
+            async_portal = AsyncPortal(portal)
+            outputs = asyncio.ensure_future(_collect(async_portal))
+            await async_portal.run()
+            return await outputs
+
+        portal = _make_portal(main, catch_output=True)
+        self.assertEqual(asyncio.run(session(portal)), [1, "cats"])
+        # the output stream of the portal is left alone
+        self.assertEqual(portal.get_output_stream(), [1, "cats"])
+
+    def test_send_input_done(self):
+        main = """
+        ~GATE
+        /ri1e~ha
+        """
+
+        async def session():
+            async_portal = AsyncPortal(_make_portal(main))
+            await async_portal.run()
+            await async_portal.send_input("cats")
+
+        self.assertRaises(AsyncPortalError, asyncio.run, session())
+
+    def test_send_input_after_error(self):
+        main = """
+        ~GATE
+        />V
+        /^<
+        """
+
+        async def session():
+            async_portal = AsyncPortal(_make_portal(main, lost_count=100))
+            with self.assertRaises(PortalError):
+                await async_portal.run()
+            await asyncio.wait_for(async_portal.send_input("cats"), 5)
+
+        self.assertRaises(AsyncPortalError, asyncio.run, session())
+
+    def test_send_input_waiting_on_error(self):
+        main = """
+        ~GATE
+        />V
+        /^<
+        """
+
+        async def session():
+            async_portal = AsyncPortal(_make_portal(main, lost_count=100))
+            sender = asyncio.ensure_future(async_portal.send_input("cats"))
+            with self.assertRaises(PortalError):
+                await async_portal.run()
+            await asyncio.wait_for(sender, 5)
+
+        self.assertRaises(AsyncPortalError, asyncio.run, session())
@@ -8,6 +8,7 @@ import unittest
 # backrooms
 from tests import test_files
 from backrooms import backrooms
+from backrooms.rooms import DenseFloor
 
 
 class BackroomsAPITests(unittest.TestCase):
@@ -22,6 +23,20 @@ class BackroomsAPITests(unittest.TestCase):
         self.assertEqual(len(stream), 1)
         self.assertEqual(stream[0], "hello")
 
+    def test_string_prefetch(self):
+        portal = backrooms.backrooms_api(test_files.get_path("heap_basic.brs"),
+                                         sys_output=False,
+                                         catch_output=True,
+                                         lost_count=100000,
+                                         prefetch_workers=2)
+        portal()
+        expected = backrooms.backrooms_api(test_files.get_path("heap_basic.brs"),
+                                           sys_output=False,
+                                           catch_output=True,
+                                           lost_count=100000)
+        expected()
+        self.assertEqual(portal.get_output_stream(), expected.get_output_stream())
+
     def test_string_handler(self):
         brs = """
         ~GATE
@@ -59,3 +74,32 @@ class BackroomsAPITests(unittest.TestCase):
         stream = portal.get_output_stream()
         self.assertEqual(len(stream), 1)
         self.assertEqual(stream[0], "hello")
+
+    def test_dense_floor(self):
+        portal = backrooms.backrooms_api(test_files.get_path("hello.brs"),
+                                         sys_output=False,
+                                         catch_output=True,
+                                         lost_count=1000,
+                                         lost_rule_count=1000,
+                                         floor_type=DenseFloor)
+        self.assertIs(portal.get_rooms().get_floor_type(), DenseFloor)
+        portal()
+        stream = portal.get_output_stream()
+        self.assertEqual(len(stream), 1)
+        self.assertEqual(stream[0], "hello")
+
+    def test_direct_run(self):
+        for file_name in ("mirrors.brs", "read.brs", "write.brs", "shifter.brs", "hop_three.brs", "register.brs",
+                          "thread.brs", "uncommon_read_flip.brs", "uncommon_write_flip.brs", "variables.brs"):
+            outputs = []
+            for lost_rule_count in (0, 1000):
+                portal = backrooms.backrooms_api(test_files.get_path(file_name),
+                                                 inputs=(),
+                                                 sys_output=False,
+                                                 catch_output=True,
+                                                 lost_count=10000,
+                                                 lost_rule_count=lost_rule_count)
+                portal()
+                self.assertTrue(portal.is_done())
+                outputs.append(portal.get_output_stream())
+            self.assertEqual(outputs[0], outputs[1])
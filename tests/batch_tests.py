@@ -0,0 +1,56 @@
+"""
+Copyright 2021 Charles McMarrow
+"""
+
+# built-in
+import time
+import unittest
+
+# backrooms
+from backrooms.batch import batch_api, BatchResult, KILL_GRACE
+from backrooms.translator import StringHandler
+from tests import test_files
+
+
+class BatchAPITests(unittest.TestCase):
+    def test_batch(self):
+        programs = [test_files.get_path("hello.brs"),
+                    test_files.get_path("cite.brs"),
+                    test_files.get_path("cite.brs"),
+                    test_files.get_path("cats.brs")]
+        inputs = [None, ("a", "b"), ("c",), None]
+        results = sorted(batch_api(programs, inputs, max_workers=2, lost_count=1000), key=BatchResult.get_index)
+        self.assertEqual([result.get_index() for result in results], [0, 1, 2, 3])
+        self.assertEqual(results[0].get_output_stream(), ["hello"])
+        self.assertIsNone(results[0].get_error())
+        self.assertEqual(results[1].get_output_stream(), ["a", "b", "", "", "", "", ""])
+        self.assertEqual(results[2].get_output_stream(), ["c", "", "", "", "", "", ""])
+        self.assertEqual(results[3].get_output_stream(), [])
+        self.assertIsNotNone(results[3].get_error())
+        self.assertEqual(results[3].get_code(), programs[3])
+
+    def test_limits(self):
+        main = """
+        ~GATE
+        /ri1e>V
+        /    ^<
+        """
+        lost = next(batch_api([StringHandler("main", main)], max_workers=1, lost_count=100))
+        self.assertEqual(lost.get_output_stream(), [1])
+        self.assertIn("Lost count", lost.get_error())
+        timed_out = next(batch_api([StringHandler("main", main)], max_workers=1, time_limit=0.1))
+        self.assertEqual(timed_out.get_output_stream(), [1])
+        self.assertIn("Time limit", timed_out.get_error())
+
+    def test_stuck_rule(self):
+        # a rule that never returns has its worker killed
+        start = time.monotonic()
+        stuck = next(batch_api([StringHandler("main", "~GATE\n/>>")], time_limit=1.0, br_builtins=False))
+        self.assertLess(time.monotonic() - start, 1.0 + KILL_GRACE + 5)
+        self.assertEqual(stuck.get_output_stream(), [])
+        self.assertIn("Time limit", stuck.get_error())
+        results = sorted(batch_api([StringHandler("main", "~GATE\n/>>"), test_files.get_path("hello.brs")],
+                                   max_workers=1,
+                                   time_limit=1.0), key=BatchResult.get_index)
+        self.assertIn("Time limit", results[0].get_error())
+        self.assertEqual(results[1].get_output_stream(), ["hello"])
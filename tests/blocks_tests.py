@@ -0,0 +1,146 @@
+"""
+Copyright 2021 Charles McMarrow
+"""
+
+# built-in
+import unittest
+
+# backrooms
+from backrooms.backrooms import backrooms_api
+from backrooms.blocks import BlockCompiler
+from backrooms.conscious import BRANCH_ZERO, Conscious
+from backrooms.portal import Portal, PortalError
+from backrooms.rooms import Rooms
+from backrooms.translator import StringHandler, Handlers, translator
+import benchmarks
+from tests import test_files
+
+
+def get_portal(main: str, **kwargs) -> Portal:
+    return Portal(translator(Handlers(StringHandler("main", main))),
+                  inputs=(),
+                  sys_output=False,
+                  catch_output=True,
+                  **kwargs)
+
+
+class BlockCompilerTests(unittest.TestCase):
+    def setUp(self):
+        self.rooms = Rooms()
+        self.rooms.write_line(0, 0, 0, 'ri12rs"hi"..e ec', vector_x=1)
+        self.compiler = BlockCompiler(get_portal("~GATE\n/~ha")._rules, False, False)
+
+    def test_get_block(self):
+        block = self.compiler.get_block(self.rooms, Conscious())
+        self.assertEqual(block.rule_count, 7)
+        self.assertIs(self.compiler.get_block(self.rooms, Conscious()), block)
+        self.assertIsNone(self.compiler.get_block(self.rooms, Conscious(PC_X=15)))
+        self.assertIsNone(self.compiler.get_block(self.rooms, Conscious(PC_V_FLOOR=1)))
+
+    def test_write_outside_block(self):
+        block = self.compiler.get_block(self.rooms, Conscious())
+        self.rooms.write(0, 1, 0, "d")
+        self.rooms.write(16, 0, 0, "d")
+        self.assertIs(self.compiler.get_block(self.rooms, Conscious()), block)
+
+    def test_write_inside_block(self):
+        block = self.compiler.get_block(self.rooms, Conscious())
+        self.rooms.write(10, 0, 0, "c")
+        new_block = self.compiler.get_block(self.rooms, Conscious())
+        self.assertIsNot(new_block, block)
+        self.assertEqual(new_block.rule_count, 2)
+
+    def test_write_end_of_block(self):
+        self.rooms.write_line(0, 1, 0, "ri12c", vector_x=1)
+        block = self.compiler.get_block(self.rooms, Conscious(PC_Y=1))
+        self.rooms.write(4, 1, 0, "3")
+        self.assertIsNot(self.compiler.get_block(self.rooms, Conscious(PC_Y=1)), block)
+
+    def test_turns(self):
+        self.rooms.write_line(0, 2, 0, "..v", vector_x=1)
+        self.rooms.write(2, 1, 0, "e")
+        self.rooms.write(2, 0, 0, "c")
+        block = self.compiler.get_block(self.rooms, Conscious(PC_Y=2))
+        self.assertEqual(block.rule_count, 4)
+        # a Shifter can't be followed without knowing the branch
+        self.assertEqual(self.compiler.get_block(self.rooms, Conscious(PC_Y=2, BRANCH=BRANCH_ZERO)).rule_count, 2)
+        self.rooms.write(2, 1, 0, "c")
+        self.assertEqual(self.compiler.get_block(self.rooms, Conscious(PC_Y=2)).rule_count, 3)
+
+    def test_recompiles(self):
+        for character in "cde":
+            self.compiler.get_block(self.rooms, Conscious())
+            self.rooms.write(12, 0, 0, character)
+        self.assertIsNone(self.compiler.get_block(self.rooms, Conscious()))
+        self.assertIsNotNone(self.compiler.get_block(self.rooms, Conscious(PC_X=4)))
+
+    def test_max_length(self):
+        compiler = BlockCompiler(get_portal("~GATE\n/~ha")._rules, False, False, 4)
+        self.assertEqual(compiler.get_block(self.rooms, Conscious()).rule_count, 4)
+        self.assertEqual(self.compiler.get_block(self.rooms, Conscious()).rule_count, 7)
+
+
+class BlockPortalTests(unittest.TestCase):
+    def test_output(self):
+        main = """
+               ~GATE
+               /ri3ri4ia..e rs"cats"e ri0>..ri1isZVe~ha
+               """
+        for compile_blocks in (False, True):
+            portal = get_portal(main, lost_count=1000, compile_blocks=compile_blocks)
+            portal()
+            self.assertEqual(portal.get_output_stream(), [7, "cats", -1])
+
+    def test_same_as_rules(self):
+        for file_name in ("uncommon_hot_patch.brs", "uncommon_simple_dump.brs", "uncommon_dynamic_dump.brs",
+                          "uncommon_write_flip.brs", "write.brs", "read.brs", "variables.brs", "thread.brs"):
+            outputs = []
+            for compile_blocks in (False, True):
+                portal = backrooms_api(test_files.get_path(file_name),
+                                       inputs=(),
+                                       sys_output=False,
+                                       catch_output=True,
+                                       lost_count=10000,
+                                       compile_blocks=compile_blocks)
+                portal()
+                outputs.append(portal.get_output_stream())
+            self.assertEqual(outputs[0], outputs[1])
+
+    def test_lost_count(self):
+        main = """
+               ~GATE
+               /.........~ha
+               """
+        for lost_count in range(1, 10):
+            for compile_blocks in (False, True):
+                portal = get_portal(main, lost_count=lost_count, compile_blocks=compile_blocks)
+                self.assertRaises(PortalError, portal)
+                self.assertEqual(portal.get_consciouses()[0].at(), (lost_count, 0, 0))
+
+    def test_threads(self):
+        main = """
+               ~GATE
+               /ri1tttiZV.........ri2e.........ri3e...tj~ha
+               /        >.........ri4e.........ri5e...~ha
+               """
+        for quantum in (1, 4, 16, 64):
+            results = []
+            for compile_blocks in (False, True):
+                portal = get_portal(main, lost_count=1000, compile_blocks=compile_blocks, quantum=quantum)
+                portal()
+                results.append(portal.get_output_stream())
+            self.assertEqual(results[0], results[1])
+
+    def test_examples(self):
+        for path, inputs in ((("turing", "turing.brs"), ("1",)), (("8_bit", "8_bit.brs"), ())):
+            results = []
+            for compile_blocks in (False, True):
+                portal = backrooms_api(benchmarks.get_example_path(*path),
+                                       inputs=inputs,
+                                       sys_output=False,
+                                       catch_output=True,
+                                       lost_count=20000,
+                                       compile_blocks=compile_blocks)
+                self.assertRaises(PortalError, portal)
+                results.append((portal.get_output_stream(), [conscious.at() for conscious in portal.get_consciouses()]))
+            self.assertEqual(results[0], results[1])
@@ -3,7 +3,9 @@ Copyright 2021 Charles McMarrow
 """
 
 # built-in
+import pickle
 import unittest
+from copy import deepcopy
 
 # backrooms
 from backrooms import conscious
@@ -74,3 +76,90 @@ class ConsciousTests(unittest.TestCase):
         this_conscious[conscious.PC_V_Y] = 0
         this_conscious[conscious.PC_V_FLOOR] = -1
         self.assertEqual(this_conscious.next_step(), (-1, 2, 0))
+
+    def test_attributes(self):
+        this_conscious = conscious.Conscious(PC_X=3, R7="cats")
+        self.assertEqual(this_conscious.pc_x, 3)
+        self.assertEqual(this_conscious.registers[7], "cats")
+        this_conscious.pc_v_y = -1
+        this_conscious.registers[2] = 5
+        self.assertEqual(this_conscious[conscious.PC_V_Y], -1)
+        self.assertEqual(this_conscious[conscious.R2], 5)
+        self.assertIs(this_conscious[conscious.WORK_STACK], this_conscious.work_stack)
+        self.assertFalse(hasattr(this_conscious, "__dict__"))
+
+    def test_mapping(self):
+        this_conscious = conscious.Conscious(ID=2)
+        self.assertEqual(len(this_conscious), 22)
+        self.assertEqual(len(list(this_conscious.items())), 22)
+        self.assertIn(conscious.R9, this_conscious)
+        self.assertNotIn("R10", this_conscious)
+        self.assertEqual(this_conscious.get(conscious.ID), 2)
+        self.assertIsNone(this_conscious.get("R10"))
+        self.assertIn("'ID': 2", repr(this_conscious))
+        self.assertRaises(KeyError, this_conscious.__getitem__, "R10")
+        self.assertRaises(KeyError, this_conscious.__setitem__, "R10", 1)
+        self.assertRaises(KeyError, conscious.Conscious, R10=1)
+
+    def test_mapping_mutators(self):
+        this_conscious = conscious.Conscious(R0=3, R1=4, PC_X=5)
+        self.assertEqual(this_conscious.setdefault(conscious.R1, 7), 4)
+        self.assertEqual(this_conscious[conscious.R1], 4)
+        self.assertRaises(KeyError, this_conscious.setdefault, "R10", 7)
+        # removing a key sets it back to its default
+        self.assertEqual(this_conscious.pop(conscious.R0), 3)
+        self.assertIsNone(this_conscious[conscious.R0])
+        self.assertEqual(this_conscious.pop("R10", 8), 8)
+        self.assertRaises(KeyError, this_conscious.pop, "R10")
+        this_conscious.halt = True
+        self.assertEqual(this_conscious.popitem(), (conscious.BRANCH, conscious.BRANCH_CLEAR))
+        del this_conscious[conscious.HALT]
+        self.assertFalse(this_conscious.halt)
+        self.assertRaises(KeyError, this_conscious.__delitem__, "R10")
+        work_stack = this_conscious.work_stack
+        work_stack.push(1)
+        this_conscious.clear()
+        self.assertIsNone(this_conscious[conscious.R1])
+        self.assertEqual(this_conscious.pc_x, 0)
+        self.assertTrue(this_conscious.work_stack.is_empty())
+        self.assertIsNot(this_conscious.work_stack, work_stack)
+        self.assertEqual(list(reversed(this_conscious))[0], conscious.BRANCH)
+
+    def test_mapping_merge(self):
+        this_conscious = conscious.Conscious(R0=3)
+        merged = this_conscious | {conscious.R0: 4, "R10": 5}
+        self.assertIs(type(merged), dict)
+        self.assertEqual(merged[conscious.R0], 4)
+        self.assertEqual(merged["R10"], 5)
+        self.assertEqual(this_conscious[conscious.R0], 3)
+        merged = {conscious.R0: 4, "R10": 5} | this_conscious
+        self.assertEqual(merged[conscious.R0], 3)
+        self.assertEqual(merged["R10"], 5)
+        this_conscious |= {conscious.R1: 6}
+        self.assertIsInstance(this_conscious, conscious.Conscious)
+        self.assertEqual(this_conscious.registers[1], 6)
+        self.assertEqual({**this_conscious}, dict(this_conscious.items()))
+
+    def test_copy(self):
+        this_conscious = conscious.Conscious(ID=2, R1=4)
+        this_conscious.work_stack.push(6)
+        for new_conscious in (deepcopy(this_conscious), pickle.loads(pickle.dumps(this_conscious))):
+            self.assertIsInstance(new_conscious, conscious.Conscious)
+            self.assertEqual(new_conscious.id, 2)
+            self.assertEqual(new_conscious.registers[1], 4)
+            self.assertEqual(new_conscious.work_stack.pop(), 6)
+            self.assertEqual(this_conscious.work_stack.peak(), 6)
+
+    def test_snapshot_and_restore(self):
+        this_conscious = conscious.Conscious(PC_X=4, PC_Y=-2, PC_V_FLOOR=1, R0=7, R9=StackBottom)
+        call_frame = this_conscious.snapshot()
+        self.assertIsInstance(call_frame, conscious.CallFrame)
+        self.assertEqual(call_frame.get_items(), (4, -2, 0, 1, 0, 1, 7) + (None,) * 9)
+        this_conscious.step()
+        this_conscious.pc_v_x = -1
+        this_conscious.registers[0] = "cats"
+        this_conscious.restore(call_frame)
+        self.assertEqual(this_conscious.at(), (4, -2, 0))
+        self.assertEqual(this_conscious.pc_v_x, 1)
+        self.assertEqual(this_conscious.registers, [7] + [None] * 9)
+        self.assertEqual(pickle.loads(pickle.dumps(call_frame)).get_items(), call_frame.get_items())
@@ -0,0 +1,130 @@
+"""
+Copyright 2021 Charles McMarrow
+"""
+
+# built-in
+import os
+import tempfile
+import unittest
+
+# backrooms
+from backrooms.backrooms import backrooms_api
+from backrooms.image import (dump_image, get_image_key, get_image_sources, get_source_hash, ImageError,
+                             load_image)
+from backrooms.rooms import DenseFloor, Rooms
+from backrooms.translator import FileHandler, Handlers, StringHandler, translator
+from tests import test_files
+
+
+class ImageTests(unittest.TestCase):
+    def test_round_trip(self):
+        rooms = Rooms()
+        rooms.write_line(-3, 2, 0, "abc d", 1)
+        rooms.write_line(7, -1, 0, "xyz", 0, 1)
+        rooms.write_line(0, 0, 4, "\x00\xff", 1)
+        rooms.set_floor_name(4, "FOUR")
+        rooms.set_hallway_name(2, 0, "TWO")
+        rooms.set_hallway_name(-1, 0)
+        rooms.set_hallway_name(5, 4, "FIVE")
+        for floor_type in (None, DenseFloor):
+            loaded = load_image(dump_image(rooms)) if floor_type is None else load_image(dump_image(rooms), floor_type)
+            for floor_level in rooms.get_floor_levels():
+                self.assertEqual(sorted(loaded.get_floor(floor_level).get_cells()),
+                                 sorted(rooms.get_floor(floor_level).get_cells()))
+            self.assertEqual(loaded.get_floor_names(), {4: "FOUR"})
+            self.assertEqual(loaded.get_hallways(), {0: ((-1, None), (2, "TWO")), 4: ((5, "FIVE"),)})
+            self.assertEqual(loaded.read(1, 2, 0), "d")
+            self.assertEqual(loaded.read(0, 2, 0), " ")
+
+    def test_sources(self):
+        sources = (("lib", b"\x01" * 32), ("\u00e9", b"\x02" * 32))
+        image = dump_image(Rooms(), sources)
+        self.assertEqual(get_image_sources(image), sources)
+        self.assertEqual(get_image_sources(dump_image(Rooms())), ())
+        self.assertEqual(load_image(image).get_floor_levels(), ())
+
+    def test_bad_image(self):
+        image = dump_image(Rooms())
+        with self.assertRaises(ImageError):
+            load_image(b"NOPE" + image[4:])
+        with self.assertRaises(ImageError):
+            load_image(image[:-2])
+        with self.assertRaises(ImageError):
+            load_image(b"")
+
+    def test_image_key(self):
+        key = get_image_key(Handlers(StringHandler("main", "/ri1p~"), ()))
+        self.assertEqual(key, get_image_key(Handlers(StringHandler("main", "/ri1p~"), ())))
+        self.assertNotEqual(key, get_image_key(Handlers(StringHandler("main", "/ri2p~"), ())))
+        self.assertNotEqual(key, get_image_key(Handlers(StringHandler("other", "/ri1p~"), ())))
+        # only the main Handler is part of the key
+        self.assertEqual(key, get_image_key(Handlers(StringHandler("main", "/ri1p~"),
+                                                     ((StringHandler("lib", "/ri2p~"),),))))
+
+    def test_image_cache(self):
+        with tempfile.TemporaryDirectory() as image_cache:
+            portal = backrooms_api(test_files.get_path("hello.brs"),
+                                   sys_output=False,
+                                   catch_output=True,
+                                   image_cache=image_cache)
+            portal()
+            self.assertEqual(portal.get_output_stream(), ["hello"])
+            self.assertEqual(len(os.listdir(image_cache)), 1)
+            portal = backrooms_api(test_files.get_path("hello.brs"),
+                                   sys_output=False,
+                                   catch_output=True,
+                                   image_cache=image_cache)
+            portal()
+            self.assertEqual(portal.get_output_stream(), ["hello"])
+            self.assertEqual(len(os.listdir(image_cache)), 1)
+
+            # a broken image is treated like a miss and replaced
+            image_path = os.path.join(image_cache, os.listdir(image_cache)[0])
+            with open(image_path, "wb") as image_file:
+                image_file.write(b"broken")
+            portal = backrooms_api(test_files.get_path("hello.brs"),
+                                   sys_output=False,
+                                   catch_output=True,
+                                   image_cache=image_cache)
+            portal()
+            self.assertEqual(portal.get_output_stream(), ["hello"])
+            with open(image_path, "rb") as image_file:
+                self.assertNotEqual(image_file.read(), b"broken")
+
+    def test_image_cache_includes(self):
+        def run():
+            portal = backrooms_api(main_path, sys_output=False, catch_output=True, image_cache=image_cache)
+            portal()
+            return portal.get_output_stream()
+
+        with tempfile.TemporaryDirectory() as program_dir, tempfile.TemporaryDirectory() as image_cache:
+            main_path = os.path.join(program_dir, "main.brs")
+            lib_path = os.path.join(program_dir, "lib.brs")
+            other_path = os.path.join(program_dir, "other.brs")
+            with open(main_path, "w") as main_file:
+                main_file.write("%lib\n")
+            with open(lib_path, "w") as lib_file:
+                lib_file.write('~GATE\n/rs"cats"e~ha\n')
+            # files that are not included are never read, even if they can't be
+            with open(other_path, "wb") as other_file:
+                other_file.write(b"\xff\xfe")
+            self.assertEqual(run(), ["cats"])
+            image_path = os.path.join(image_cache, os.listdir(image_cache)[0])
+            with open(image_path, "rb") as image_file:
+                sources = get_image_sources(image_file.read())
+            self.assertEqual(sources, (("lib", get_source_hash(FileHandler(lib_path))),))
+
+            # the image is used while the included files are unchanged
+            with open(image_path, "wb") as image_file:
+                image_file.write(dump_image(translator(Handlers(StringHandler("main", '~GATE\n/rs"dogs"e~ha'))),
+                                            sources))
+            with open(other_path, "w") as other_file:
+                other_file.write("~OTHER\n")
+            self.assertEqual(run(), ["dogs"])
+
+            # an included file changing makes the image stale
+            with open(lib_path, "w") as lib_file:
+                lib_file.write('~GATE\n/rs"fish"e~ha\n')
+            self.assertEqual(run(), ["fish"])
+            self.assertEqual(run(), ["fish"])
+            self.assertEqual(len(os.listdir(image_cache)), 1)
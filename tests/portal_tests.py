@@ -6,9 +6,10 @@ Copyright 2021 Charles McMarrow
 import unittest
 
 # backrooms
-from backrooms.conscious import WORK_STACK, ID
+from backrooms.conscious import Conscious, WORK_STACK, ID
 from backrooms.portal import Feeder, Portal, PortalError
 from backrooms.rooms import Rooms
+from backrooms.rules import Halt, NOP
 from backrooms.stack import StackBottom
 from backrooms.translator import StringHandler, Handlers, translator
 
@@ -70,6 +71,70 @@ class PortalTests(unittest.TestCase):
         for _ in range(3):
             self.assertTrue(portal.is_done())
 
+    def test_run_rules(self):
+        main = """
+        ~GATE
+        /ri1ri2ee~ha
+        """
+        for lost_rule_count in (0, 1000):
+            portal = Portal(translator(Handlers(StringHandler("main", main))),
+                            inputs=(),
+                            sys_output=False,
+                            catch_output=True,
+                            lost_rule_count=lost_rule_count,
+                            error_on_space=True)
+            self.assertFalse(portal.run_rules(2))
+            self.assertEqual(portal.get_output_stream(), [])
+            self.assertEqual(portal.get_consciouses()[0].work_stack.peak(), 2)
+            self.assertFalse(portal.run_rules(0))
+            self.assertTrue(portal.run_rules(100))
+            self.assertEqual(portal.get_output_stream(), [2, 2])
+            self.assertTrue(portal.run_rules(1))
+
+    def test_quantum(self):
+        main = """
+        ~GATE
+        /tttietietj~ha
+        """
+        for quantum, output in ((0, [1, 0, 1, 0]), (1, [1, 0, 1, 0]), (4, [0, 1, 1, 0]), (100, [0, 0])):
+            for lost_rule_count in (0, 1000):
+                portal = Portal(translator(Handlers(StringHandler("main", main))),
+                                inputs=(),
+                                sys_output=False,
+                                catch_output=True,
+                                lost_count=1000,
+                                lost_rule_count=lost_rule_count,
+                                error_on_space=True,
+                                quantum=quantum)
+                portal()
+                self.assertEqual(portal.get_output_stream(), output)
+
+    def test_park_conscious_and_wake_conscious(self):
+        main = """
+        ~GATE
+        /tttltietutj~ha
+        """
+        for lost_rule_count in (0, 1000):
+            portal = Portal(translator(Handlers(StringHandler("main", main))),
+                            inputs=(),
+                            sys_output=False,
+                            catch_output=True,
+                            lost_count=1000,
+                            lost_rule_count=lost_rule_count,
+                            error_on_space=True)
+            portal_iter = iter(portal)
+            for _ in range(4):
+                for _ in next(portal_iter):
+                    pass
+            # conscious 0 is parked on the lock held by conscious 1
+            self.assertEqual([conscious[ID] for conscious in portal.get_consciouses()], [1, 0])
+            self.assertEqual(portal.get_park_count(), 1)
+            self.assertEqual(portal.get_spins_avoided(), 0)
+            portal()
+            self.assertEqual(portal.get_output_stream(), [1, 0])
+            self.assertEqual(portal.get_park_count(), 1)
+            self.assertEqual(portal.get_spins_avoided(), 2)
+
     def test_get_rooms(self):
         main = """
                 ~GATE
@@ -208,37 +273,41 @@ class PortalTests(unittest.TestCase):
         feeder = portal.get_feeder()
         portal_iter = iter(portal)
 
-        cite = next(portal_iter)
-        self.assertFalse(feeder.wants_input())
-        next(cite)
+        for _ in next(portal_iter):
+            pass
         self.assertTrue(feeder.wants_input())
+        self.assertTrue(portal.is_awaiting_input())
+        self.assertRaises(StopIteration, next, portal_iter)
         feeder.set_input("cats")
         self.assertFalse(feeder.wants_input())
-        self.assertRaises(StopIteration, next, cite)
-        for _ in range(2):
+        self.assertFalse(portal.is_awaiting_input())
+        for _ in range(3):
             rule = next(portal_iter)
             for _ in rule:
                 pass
-        cite = next(portal_iter)
         self.assertFalse(feeder.wants_input())
+        for _ in next(portal_iter):
+            pass
         for _ in range(25):
-            next(cite)
+            self.assertRaises(StopIteration, next, portal_iter)
             self.assertTrue(feeder.wants_input())
+            self.assertTrue(portal.is_awaiting_input())
         feeder.set_input("&*(@^#")
         self.assertFalse(feeder.wants_input())
-        self.assertRaises(StopIteration, next, cite)
-        for _ in range(4):
+        for _ in range(5):
             rule = next(portal_iter)
             for _ in rule:
                 pass
         self.assertRaises(StopIteration, next, portal_iter)
+        self.assertTrue(portal.is_done())
+        self.assertFalse(portal.is_awaiting_input())
         stream = portal.get_output_stream()
         self.assertEqual(len(stream), 3)
         self.assertEqual(stream[0], "cats")
         self.assertEqual(stream[1], "&*(@^#")
         self.assertEqual(stream[2], "StackBottom")
 
-    def test_lost_feeder(self):
+    def test_feeder_awaiting_input(self):
         main = """
                         ~GATE
                         /c~ha
@@ -250,10 +319,40 @@ class PortalTests(unittest.TestCase):
                         lost_count=1000,
                         lost_rule_count=1000,
                         error_on_space=True)
-        self.assertRaises(PortalError, portal)
+        portal()
+        self.assertFalse(portal.is_done())
+        self.assertTrue(portal.is_awaiting_input())
         self.assertIsInstance(portal.get_feeder(), Feeder)
         feeder = portal.get_feeder()
         self.assertTrue(feeder.wants_input())
+        self.assertFalse(portal.run_rules(100))
+        feeder.set_input("cats")
+        self.assertTrue(portal.run_rules(100))
+
+    def test_park_on_input(self):
+        main = """
+        ~GATE
+        /tttiZVpri1eri2etj
+        /     >pce~ha
+        """
+        for lost_rule_count in (0, 1000):
+            portal = Portal(translator(Handlers(StringHandler("main", main))),
+                            feeder=True,
+                            sys_output=False,
+                            catch_output=True,
+                            lost_count=1000,
+                            lost_rule_count=lost_rule_count,
+                            error_on_space=True)
+            # conscious 1 runs to the end while conscious 0 waits for input
+            portal()
+            self.assertEqual(portal.get_output_stream(), [1, 2])
+            self.assertTrue(portal.is_awaiting_input())
+            self.assertEqual([conscious[ID] for conscious in portal.get_consciouses()], [0])
+            portal.get_feeder().set_input("cats")
+            self.assertFalse(portal.is_awaiting_input())
+            portal()
+            self.assertEqual(portal.get_output_stream(), [1, 2, "cats"])
+            self.assertTrue(portal.is_done())
 
     def test_lost_count(self):
         main = """
@@ -376,3 +475,39 @@ class PortalTests(unittest.TestCase):
                           lost_count=1000,
                           lost_rule_count=1000,
                           error_on_space=True)
+
+    def test_start_character_collection(self):
+        main = """
+               ~GATE
+               /~ha
+               """
+        self.assertRaises(PortalError,
+                          Portal,
+                          translator(Handlers(StringHandler("main", main))),
+                          inputs=(),
+                          sys_output=False,
+                          rules=(Halt, NOP, NOP))
+
+    def test_rules(self):
+        main = """
+               ~GATE
+               /...~ha
+               /...x~ha
+               """
+        portal = Portal(translator(Handlers(StringHandler("main", main))),
+                        inputs=(),
+                        sys_output=False,
+                        lost_count=1000,
+                        error_on_no_rule=True,
+                        rules=(Halt, NOP))
+        portal()
+        self.assertTrue(portal.is_done())
+
+        portal = Portal(translator(Handlers(StringHandler("main", main))),
+                        consciouses=(Conscious(PC_Y=-1, ID=0),),
+                        inputs=(),
+                        sys_output=False,
+                        lost_count=1000,
+                        error_on_no_rule=True,
+                        rules=(Halt, NOP))
+        self.assertRaises(PortalError, portal)
@@ -6,7 +6,7 @@ Copyright 2021 Charles McMarrow
 import unittest
 
 # backrooms
-from backrooms.rooms import Rooms, RoomsError, is_character, is_name
+from backrooms.rooms import DenseFloor, Rooms, RoomsError, SparseFloor, is_character, is_name
 
 
 class IsCharacterTests(unittest.TestCase):
@@ -43,6 +43,55 @@ class RoomsTests(unittest.TestCase):
     def test_init(self):
         self.assertIsInstance(Rooms(), Rooms)
 
+    def test_get_generation(self):
+        rooms = Rooms()
+        self.assertEqual(rooms.get_generation(0), 0)
+        rooms.read(0, 0, 0)
+        self.assertEqual(rooms.get_generation(0), 0)
+        rooms.write(0, 0, 0, "a")
+        generation = rooms.get_generation(0)
+        self.assertNotEqual(generation, 0)
+        self.assertEqual(rooms.get_generation(1), 0)
+        rooms.duplicate_floor(0, 1)
+        self.assertNotEqual(rooms.get_generation(1), 0)
+        rooms.remove_floor(0)
+        self.assertNotEqual(rooms.get_generation(0), generation)
+
+    def test_is_tracking(self):
+        rooms = Rooms()
+        rooms.write(0, 0, 0, "a")
+        rooms.duplicate_floor(0, 1)
+        rooms.duplicate_floor(0, 1)
+        rooms.remove_floor(1)
+        self.assertFalse(rooms.is_tracking())
+        rooms.get_generation(0)
+        self.assertTrue(rooms.is_tracking())
+
+    def test_add_watcher(self):
+        rooms = Rooms()
+        fired = []
+        rooms.add_watcher(0, 1, 1, 3, 2, lambda: fired.append("box"))
+        rooms.write(0, 1, 0, "a")
+        rooms.write(4, 2, 0, "a")
+        rooms.write(2, 0, 0, "a")
+        rooms.write(2, 1, 1, "a")
+        self.assertEqual(fired, [])
+        rooms.write(3, 2, 0, "a")
+        self.assertEqual(fired, ["box"])
+        rooms.write(1, 1, 0, "a")
+        self.assertEqual(fired, ["box"])
+
+    def test_add_watcher_floor_changes(self):
+        rooms = Rooms()
+        fired = []
+        rooms.write(0, 0, 0, "a")
+        rooms.add_watcher(0, 0, 0, 0, 0, lambda: fired.append("removed"))
+        rooms.add_watcher(1, 0, 0, 0, 0, lambda: fired.append("duplicated"))
+        rooms.remove_floor(0)
+        self.assertEqual(fired, ["removed"])
+        rooms.duplicate_floor(2, 1)
+        self.assertEqual(fired, ["removed", "duplicated"])
+
     def test_read_and_write(self):
         rooms = Rooms()
         self.assertEqual(rooms.read(0, 0, 0), " ")
@@ -54,6 +103,21 @@ class RoomsTests(unittest.TestCase):
         self.assertEqual(rooms.read(0, 0, 0), chr(0))
         self.assertEqual(rooms.read(1, 0, 0), chr(255))
 
+    def test_read_does_not_store_cells(self):
+        for floor_type in (SparseFloor, DenseFloor):
+            rooms = Rooms(floor_type)
+            rooms.write(0, 0, 0, "a")
+            self.assertEqual(rooms.get_cell_count(0), 1)
+            for x in range(-100, 100):
+                for y in range(-100, 100):
+                    rooms.read(x, y, 0)
+                    rooms.read(x, y, 1)
+                    rooms.read(x * 1000, y * 1000, 0)
+            self.assertEqual(rooms.get_cell_count(0), 1)
+            self.assertEqual(rooms.get_cell_count(1), 0)
+            rooms.write(0, 0, 0, " ")
+            self.assertEqual(rooms.get_cell_count(0), 0)
+
     def test_read_and_write_2(self):
         rooms = Rooms()
 
@@ -92,6 +156,28 @@ class RoomsTests(unittest.TestCase):
         self.assertEqual(rooms.read(1, -8, -2), "4")
         self.assertEqual(rooms.read(3, -9, -1), "5")
 
+    def test_write_row(self):
+        for floor_type in (SparseFloor, DenseFloor):
+            rooms = Rooms(floor_type)
+            fired = []
+            rooms.add_watcher(0, 8, 1, 9, 1, lambda: fired.append("right"))
+            rooms.add_watcher(0, -9, 1, -8, 1, lambda: fired.append("left"))
+            rooms.write_row(-3, 1, 0, "abcdef")
+            rooms.write_row(-1, 1, 0, " x ")
+            rooms.write_row(0, 1, 0, "")
+            self.assertEqual("".join(rooms.read(x, 1, 0) for x in range(-4, 4)), " ab x f ")
+            self.assertEqual(fired, [])
+            rooms.write_row(7, 1, 0, "  ")
+            self.assertEqual(fired, ["right"])
+            self.assertEqual(rooms.get_cell_count(1), 0)
+
+    def test_write_row_bad_character(self):
+        for floor_type in (SparseFloor, DenseFloor):
+            rooms = Rooms(floor_type)
+            self.assertRaises(RoomsError, rooms.write_row, 0, 0, 0, "ab" + chr(256) + "c")
+            self.assertEqual(rooms.read(1, 0, 0), "b")
+            self.assertEqual(rooms.read(3, 0, 0), " ")
+
     def test_bad_write_not_ascii(self):
         rooms = Rooms()
         rooms.write_line(44, 45, 46, "@")
@@ -313,3 +399,149 @@ class RoomsTests(unittest.TestCase):
     def test_find_a_hallway_does_not_exist(self):
         rooms = Rooms()
         self.assertIsNone(rooms.find_a_hallway("cats"))
+
+    def test_find_a_hallway_after_changes(self):
+        rooms = Rooms()
+        self.assertIsNone(rooms.find_a_hallway("hallway"))
+        rooms.set_hallway_name(40, 11, "hallway")
+        self.assertEqual(rooms.find_a_hallway("hallway"), (40, 11))
+        rooms.set_hallway_name(100, -11, "hallway")
+        self.assertEqual(rooms.find_a_hallway("hallway"), (100, -11))
+        rooms.set_hallway_name(100, -11)
+        self.assertEqual(rooms.find_a_hallway("hallway"), (40, 11))
+        rooms.duplicate_floor(11, 1)
+        self.assertEqual(rooms.find_a_hallway("hallway"), (40, 1))
+        rooms.remove_hallway(40, 1)
+        self.assertEqual(rooms.find_a_hallway("hallway"), (40, 11))
+        rooms.remove_floor(11)
+        self.assertIsNone(rooms.find_a_hallway("hallway"))
+
+    def test_hallways_after_duplicate_and_remove_floor(self):
+        rooms = Rooms()
+        rooms.set_hallway_name(5, 0, "hallway")
+        rooms.set_hallway_name(5, 0, "hallway2")
+        rooms.duplicate_floor(0, 1)
+        self.assertEqual(rooms.get_hallway_name(5, 1), "hallway2")
+        self.assertIsNone(rooms.get_hallway_location(1, "hallway"))
+        rooms.remove_hallway(5, 1)
+        self.assertIsNone(rooms.find_hallway_location(0, 1))
+        self.assertEqual(rooms.find_hallway_location(0, 0), 5)
+        rooms.remove_floor(0)
+        rooms.set_hallway_name(5, 0)
+        rooms.set_hallway_name(1, 0)
+        self.assertEqual(rooms.get_next_hallway_location(1, 0), 5)
+        self.assertIsNone(rooms.get_next_hallway_location(5, 0))
+
+
+class FloorTests(unittest.TestCase):
+    def _test_floor(self, floor):
+        self.assertEqual(floor.read(0, 0), " ")
+        floor.write(0, 0, "a")
+        floor.write(-5, 3, "b")
+        floor.write(100, -100, "c")
+        self.assertEqual(floor.read(0, 0), "a")
+        self.assertEqual(floor.read(-5, 3), "b")
+        self.assertEqual(floor.read(100, -100), "c")
+        self.assertEqual(floor.read(1, 0), " ")
+
+        floor_copy = floor.copy()
+        floor.write(0, 0, " ")
+        self.assertEqual(floor.read(0, 0), " ")
+        self.assertEqual(floor_copy.read(0, 0), "a")
+        self.assertEqual(floor_copy.read(100, -100), "c")
+
+    def test_sparse_floor(self):
+        self._test_floor(SparseFloor())
+
+    def test_dense_floor(self):
+        self._test_floor(DenseFloor())
+
+    def test_write_row(self):
+        for floor in (SparseFloor(), DenseFloor(), DenseFloor(max_area=20)):
+            floor.write(3, 0, "z")
+            floor.write(50, 0, "z")
+            floor.write_row(0, 0, "  ab  ")
+            floor.write_row(48, 0, " q q ")
+            floor.write_row(-30, 0, "   ")
+            self.assertEqual([floor.read(x, 0) for x in range(0, 6)], [" ", " ", "a", "b", " ", " "])
+            self.assertEqual([floor.read(x, 0) for x in range(48, 53)], [" ", "q", " ", "q", " "])
+            self.assertEqual(sorted(floor.get_cells()), [(2, 0, "a"), (3, 0, "b"), (49, 0, "q"), (51, 0, "q")])
+
+    def test_dense_floor_all_ascii(self):
+        floor = DenseFloor()
+        for character in range(256):
+            floor.write(character, -character, chr(character))
+        for character in range(256):
+            self.assertEqual(floor.read(character, -character), chr(character))
+
+    def test_dense_floor_grow(self):
+        floor = DenseFloor()
+        for x in range(-40, 40):
+            for y in range(-20, 20):
+                floor.write(x, y, chr(abs(x * y) % 256))
+        for x in range(-40, 40):
+            for y in range(-20, 20):
+                self.assertEqual(floor.read(x, y), chr(abs(x * y) % 256))
+
+    def test_dense_floor_overflow(self):
+        floor = DenseFloor(max_area=100)
+        floor.write(0, 0, "a")
+        floor.write(10000, 10000, "b")
+        floor.write(-10000, 10000, "c")
+        self.assertEqual(floor.read(0, 0), "a")
+        self.assertEqual(floor.read(10000, 10000), "b")
+        self.assertEqual(floor.read(-10000, 10000), "c")
+        floor.write(10000, 10000, " ")
+        self.assertEqual(floor.read(10000, 10000), " ")
+
+    def test_dense_floor_overflow_pulled_into_box(self):
+        floor = DenseFloor(max_area=400)
+        floor.write(0, 0, "a")
+        floor.write(15, 0, "b")
+        floor.write(0, 15, "c")
+        for x in range(16):
+            floor.write(x, 5, "d")
+        self.assertEqual(floor.read(0, 0), "a")
+        self.assertEqual(floor.read(15, 0), "b")
+        self.assertEqual(floor.read(0, 15), "c")
+        for x in range(16):
+            self.assertEqual(floor.read(x, 5), "d")
+
+
+class DenseRoomsTests(unittest.TestCase):
+    def test_floor_type(self):
+        self.assertIs(Rooms().get_floor_type(), SparseFloor)
+        self.assertIs(Rooms(DenseFloor).get_floor_type(), DenseFloor)
+
+    def test_read_and_write_line(self):
+        rooms = Rooms(DenseFloor)
+        rooms.write_line(-5, -5, -5, "12345", 2, -1, 1)
+
+        self.assertEqual(rooms.read(-5, -5, -5), "1")
+        self.assertEqual(rooms.read(-3, -6, -4), "2")
+        self.assertEqual(rooms.read(-1, -7, -3), "3")
+        self.assertEqual(rooms.read(1, -8, -2), "4")
+        self.assertEqual(rooms.read(3, -9, -1), "5")
+
+    def test_bad_write(self):
+        rooms = Rooms(DenseFloor)
+        rooms.write(1, 1, 1, "$")
+        self.assertRaises(RoomsError, rooms.write, 1, 1, 1, chr(256))
+        self.assertEqual(rooms.read(1, 1, 1), "$")
+
+    def test_duplicate_floor(self):
+        rooms = Rooms(DenseFloor)
+
+        rooms.write(0, -2340, 1, "$")
+        for x in range(256):
+            for y in range(30):
+                rooms.write(x, y, 0, chr(x))
+
+        rooms.duplicate_floor(0, 1)
+        rooms.write(0, 0, 0, "!")
+
+        self.assertEqual(rooms.read(0, -2340, 1), " ")
+        self.assertEqual(rooms.read(0, 0, 1), chr(0))
+        for x in range(1, 256):
+            for y in range(30):
+                self.assertEqual(rooms.read(x, y, 0), rooms.read(x, y, 1))
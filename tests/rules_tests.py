@@ -6,6 +6,11 @@ Copyright 2021 Charles McMarrow
 import unittest
 
 # backrooms
+from backrooms.conscious import Conscious
+from backrooms.rooms import Rooms
+from backrooms.rules import (_read, HallwayCall, HallwayLevelCall, LiteralCache, MAX_CALL_SITES, ShifterDown, ShifterLeft,
+                             ShifterRight, ShifterUp, WorkSpace)
+from backrooms.stack import StackBottom
 from tests.full_test_runner import full_test
 
 
@@ -62,9 +67,18 @@ class RulesTests(unittest.TestCase):
         self.assertIn("Stacks\nWorking\tFunction\n", stream)
         self.assertIn("46", stream)
         self.assertIn("'R1': None", stream)
+        # one register per line
+        self.assertIn("\n 'R1': None,\n", stream)
         self.assertIn("StackFrame", stream)
         self.assertIn("StackBottom", stream)
 
+    def test_core_dump_call_frame(self):
+        stream = "".join(full_test("core_dump_2.brs", core_dump=True).get_output_stream())
+        table = stream.split("Stacks\nWorking\tFunction\n")[1].split("#####")[0]
+        function_stack = [line.split("\t")[1] for line in table.splitlines()]
+        self.assertEqual(function_stack[:16], ["None"] * 6 + ["5"] + ["None"] * 3 + ["0", "0", "1", "0", "0", "14"])
+        self.assertNotIn("CallFrame", stream)
+
     def test_decrement(self):
         stream = full_test("decrement.brs").get_output_stream()
         self.assertEqual(len(stream), 7)
@@ -607,3 +621,148 @@ class RulesTests(unittest.TestCase):
         stream = full_test("nop.brs").get_output_stream()
         self.assertEqual(len(stream), 1)
         self.assertEqual(stream[0], "StackBottom")
+
+
+class LiteralCacheTests(unittest.TestCase):
+    LITERALS = ("n", "f", "i", "i+", "i-", "i0", "i+100", "i-100", "i100x", "s~~", "s~cats~", "s.run.x", "x")
+
+    @staticmethod
+    def _read_literal(rooms, vector_x, vector_y, literal_cache=None):
+        conscious = Conscious()
+        conscious.pc_x, conscious.pc_y = 2, 2
+        conscious.pc_v_x, conscious.pc_v_y = vector_x, vector_y
+        rule_step_visuals = []
+        if literal_cache is None:
+            for _ in _read(rooms, conscious, False, rule_step_visuals):
+                pass
+        else:
+            literal_cache.read(rooms, conscious, rule_step_visuals)
+        return conscious.work_stack.pop(), conscious.at(), rule_step_visuals
+
+    def test_read_matches_read(self):
+        for literal in self.LITERALS:
+            for vector_x, vector_y in ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1)):
+                rooms = Rooms()
+                for step, character in enumerate(literal):
+                    rooms.write(2 + vector_x * step, 2 + vector_y * step, 0, character)
+                literal_cache = LiteralCache()
+                expected = self._read_literal(rooms, vector_x, vector_y)
+                for _ in range(2):
+                    self.assertEqual(self._read_literal(rooms, vector_x, vector_y, literal_cache), expected)
+
+    def test_write_drops_literal(self):
+        rooms = Rooms()
+        rooms.write_line(2, 2, 0, "i12 ", 1)
+        literal_cache = LiteralCache()
+        self.assertEqual(self._read_literal(rooms, 1, 0, literal_cache)[0], 12)
+        rooms.write(5, 2, 0, "3")
+        self.assertEqual(self._read_literal(rooms, 1, 0, literal_cache)[0], 123)
+        rooms.write(3, 2, 0, "-")
+        self.assertEqual(self._read_literal(rooms, 1, 0, literal_cache)[0], -23)
+        rooms.write(6, 2, 0, "-")
+        self.assertEqual(self._read_literal(rooms, 1, 0, literal_cache)[0], -23)
+        rooms.write(2, 2, 0, "s")
+        self.assertEqual(self._read_literal(rooms, 1, 0, literal_cache)[0], "23")
+        rooms.duplicate_floor(1, 0)
+        self.assertIs(self._read_literal(rooms, 1, 0, literal_cache)[0], StackBottom)
+
+
+class JumpCacheTests(unittest.TestCase):
+    LANES = (">>..>", ">>.!.v..>", ">>!!<.v^.", ">>.<")
+
+    @staticmethod
+    def _make_shifters():
+        work_space = WorkSpace()
+        return {rule.get_start_character(): rule
+                for rule in (rule_type(work_space, False)
+                             for rule_type in (ShifterDown, ShifterLeft, ShifterRight, ShifterUp))}
+
+    @staticmethod
+    def _shift(rooms, shifter, direct):
+        conscious = Conscious()
+        rule_step_visuals = []
+        if direct:
+            shifter.run(None, rooms, conscious, conscious.at(), rule_step_visuals)
+        else:
+            for _ in shifter(None, rooms, conscious, conscious.at(), rule_step_visuals):
+                pass
+        return conscious.at(), rule_step_visuals
+
+    def test_jump_matches_steps(self):
+        for lane in self.LANES:
+            rooms = Rooms()
+            rooms.write_line(0, 0, 0, lane, 1)
+            shifters = self._make_shifters()
+            expected = self._shift(rooms, shifters[">"], False)
+            for _ in range(2):
+                self.assertEqual(self._shift(rooms, shifters[">"], True), expected)
+
+    def test_write_drops_jump(self):
+        rooms = Rooms()
+        rooms.write_line(0, 0, 0, ">>..>", 1)
+        shifters = self._make_shifters()
+        self.assertEqual(self._shift(rooms, shifters[">"], True)[0], (4, 0, 0))
+        rooms.write(2, 0, 0, "^")
+        self.assertEqual(self._shift(rooms, shifters[">"], True)[0], (2, 0, 0))
+        rooms.write(1, 0, 0, ".")
+        self.assertEqual(self._shift(rooms, shifters[">"], True)[0], (1, 0, 0))
+
+
+class CallSiteCacheTests(unittest.TestCase):
+    @staticmethod
+    def _call(rooms, rule, *arguments, floor=0):
+        conscious = Conscious()
+        conscious.pc_floor = floor
+        for argument in arguments:
+            conscious.work_stack.push(argument)
+        rule.run(None, rooms, conscious, (0, 0, 0), [])
+        return conscious.at()
+
+    def test_hallway_call(self):
+        rooms = Rooms()
+        rooms.set_hallway_name(5, 0, "FIB")
+        rule = HallwayCall(WorkSpace(), False)
+        self.assertEqual(self._call(rooms, rule, "FIB"), (0, 5, 0))
+        self.assertEqual(self._call(rooms, rule, "FIB"), (0, 5, 0))
+        self.assertEqual(rule.get_call_site_cache().get_misses(), 1)
+        self.assertEqual(rule.get_call_site_cache().get_hits(), 1)
+        rooms.set_hallway_name(7, 0, "FIB")
+        self.assertEqual(self._call(rooms, rule, "FIB"), (0, 7, 0))
+        self.assertEqual(rule.get_call_site_cache().get_misses(), 2)
+
+    def test_hallway_call_floors(self):
+        rooms = Rooms()
+        rooms.set_hallway_name(5, 1, "F")
+        rooms.set_hallway_name(9, -1, "F")
+        rule = HallwayCall(WorkSpace(), False)
+        self.assertEqual(self._call(rooms, rule, "F", floor=1), (0, 5, 1))
+        self.assertEqual(self._call(rooms, rule, "F", floor=-1), (0, 9, -1))
+        self.assertEqual(self._call(rooms, rule, "F", floor=1), (0, 5, 1))
+        self.assertEqual(rule.get_call_site_cache().get_misses(), 2)
+        self.assertEqual(rule.get_call_site_cache().get_hits(), 1)
+
+    def test_max_call_sites(self):
+        rooms = Rooms()
+        rooms.set_hallway_name(5, 0, "FIB")
+        rule = HallwayCall(WorkSpace(), False)
+        for hallway in range(MAX_CALL_SITES + 1):
+            self._call(rooms, rule, hallway)
+        # the first call site was dropped when the cache started over
+        self._call(rooms, rule, 0)
+        self._call(rooms, rule, MAX_CALL_SITES)
+        self.assertEqual(rule.get_call_site_cache().get_misses(), MAX_CALL_SITES + 2)
+        self.assertEqual(rule.get_call_site_cache().get_hits(), 1)
+
+    def test_hallway_level_call(self):
+        rooms = Rooms()
+        rooms.set_floor_name(2, "utils")
+        rooms.set_hallway_name(5, 2, "STORE")
+        rule = HallwayLevelCall(WorkSpace(), False)
+        self.assertEqual(self._call(rooms, rule, "utils", "STORE"), (0, 5, 2))
+        self.assertEqual(self._call(rooms, rule, "utils", "STORE"), (0, 5, 2))
+        self.assertEqual(self._call(rooms, rule, "nope", "STORE"), (1, 0, 0))
+        self.assertEqual(rule.get_call_site_cache().get_misses(), 2)
+        self.assertEqual(rule.get_call_site_cache().get_hits(), 1)
+        rooms.set_floor_name(3, "utils")
+        rooms.set_hallway_name(5, 3, "STORE")
+        self.assertEqual(self._call(rooms, rule, "utils", "STORE"), (0, 5, 3))
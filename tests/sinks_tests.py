@@ -0,0 +1,124 @@
+"""
+Copyright 2021 Charles McMarrow
+"""
+
+# built-in
+from copy import deepcopy
+import io
+import unittest
+
+# backrooms
+from backrooms.portal import Portal
+from backrooms.sinks import (CallbackSink, FLUSH_BUFFER, FLUSH_EVERY, FLUSH_LINE, ListSink, RingSink, SinkError,
+                             StreamSink)
+from backrooms.translator import StringHandler, Handlers, translator
+
+
+class _Stream(io.StringIO):
+    def __init__(self):
+        super(_Stream, self).__init__()
+        self.flushes = 0
+
+    def flush(self):
+        self.flushes += 1
+        super(_Stream, self).flush()
+
+
+class StreamSinkTests(unittest.TestCase):
+    def test_init(self):
+        self.assertIsInstance(StreamSink(), StreamSink)
+        self.assertRaises(SinkError, StreamSink, flush_policy="never")
+        self.assertRaises(SinkError, StreamSink, buffer_size=0)
+
+    def test_flush_every(self):
+        stream = _Stream()
+        stream_sink = StreamSink(stream, FLUSH_EVERY)
+        stream_sink.write("cats")
+        stream_sink.write(1)
+        self.assertEqual(stream.getvalue(), "cats1")
+        self.assertEqual(stream.flushes, 2)
+
+    def test_flush_line(self):
+        stream = _Stream()
+        stream_sink = StreamSink(stream, FLUSH_LINE, 10)
+        stream_sink.write("cats")
+        stream_sink.write(None)
+        self.assertEqual(stream.getvalue(), "")
+        stream_sink.write("\n")
+        self.assertEqual(stream.getvalue(), "catsNone\n")
+        self.assertEqual(stream.flushes, 1)
+        stream_sink.write("0123456789")
+        self.assertEqual(stream.getvalue(), "catsNone\n0123456789")
+        self.assertEqual(stream.flushes, 2)
+        stream_sink.flush()
+        self.assertEqual(stream.flushes, 2)
+
+    def test_flush_buffer(self):
+        stream = _Stream()
+        stream_sink = StreamSink(stream, FLUSH_BUFFER, 10)
+        stream_sink.write("cats\n")
+        self.assertEqual(stream.getvalue(), "")
+        stream_sink.write("dogs\n")
+        self.assertEqual(stream.getvalue(), "cats\ndogs\n")
+        stream_sink.write("!")
+        stream_sink.flush()
+        self.assertEqual(stream.getvalue(), "cats\ndogs\n!")
+        self.assertEqual(stream.flushes, 2)
+
+    def test_deepcopy(self):
+        stream = _Stream()
+        stream_sink = StreamSink(stream, FLUSH_BUFFER)
+        stream_sink.write("cats")
+        stream_sink_copy = deepcopy(stream_sink)
+        stream_sink_copy.write("dogs")
+        stream_sink_copy.flush()
+        self.assertEqual(stream.getvalue(), "catsdogs")
+        stream_sink.flush()
+        self.assertEqual(stream.getvalue(), "catsdogscats")
+
+
+class SinkTests(unittest.TestCase):
+    def test_list_sink(self):
+        outputs = [0]
+        list_sink = ListSink(outputs)
+        list_sink.write("cats")
+        list_sink.write(1)
+        self.assertIs(list_sink.get_outputs(), outputs)
+        self.assertEqual(outputs, [0, "cats", 1])
+        self.assertEqual(ListSink().get_outputs(), [])
+
+    def test_ring_sink(self):
+        self.assertRaises(SinkError, RingSink, 0)
+        ring_sink = RingSink(3)
+        for output in range(5):
+            ring_sink.write(output)
+        self.assertEqual(ring_sink.get_outputs(), [2, 3, 4])
+
+    def test_callback_sink(self):
+        outputs = []
+        flushes = []
+        callback_sink = CallbackSink(outputs.append, lambda: flushes.append(len(outputs)))
+        callback_sink.write("cats")
+        callback_sink.flush()
+        self.assertEqual(outputs, ["cats"])
+        self.assertEqual(flushes, [1])
+        CallbackSink(outputs.append).flush()
+
+    def test_portal_sinks(self):
+        main = """
+        ~GATE
+        /ri1ers"cats"e~ha
+        """
+        stream = _Stream()
+        ring_sink = RingSink(1)
+        portal = Portal(translator(Handlers(StringHandler("main", main))),
+                        inputs=(),
+                        sys_output=False,
+                        catch_output=True,
+                        sinks=(StreamSink(stream, FLUSH_BUFFER), ring_sink))
+        portal()
+        self.assertEqual(portal.get_output_stream(), [1, "cats"])
+        self.assertEqual(ring_sink.get_outputs(), ["cats"])
+        # flushed once the program stopped
+        self.assertEqual(stream.getvalue(), "1cats")
+        self.assertEqual(stream.flushes, 1)
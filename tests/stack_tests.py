@@ -3,6 +3,8 @@ Copyright 2021 Charles McMarrow
 """
 
 # built-in
+from copy import deepcopy
+import pickle
 import unittest
 
 # backrooms
@@ -84,3 +86,91 @@ class StackTests(unittest.TestCase):
             stack.push(StackFrame)
         stack.clear()
         self.assertIs(stack.pop(), StackBottom)
+
+    def test_pop_frame_nested(self):
+        stack = Stack()
+        stack.push(1)
+        stack.push_frame()
+        stack.push(2)
+        stack.push(StackFrame)
+        stack.push(3)
+        stack.pop_frame()
+        self.assertEqual(stack.peak(), 2)
+        self.assertIs(stack.pop(), 2)
+        self.assertIs(stack.pop(), StackFrame)
+        stack.push(4)
+        stack.pop_frame()
+        self.assertIs(stack.pop(), StackBottom)
+
+    def test_push_many_and_pop_many(self):
+        stack = Stack()
+        self.assertEqual(stack.pop_many(0), [])
+        self.assertEqual(stack.pop_many(2), [StackBottom, StackBottom])
+        stack.push_many((1, StackBottom, StackFrame, "cats", None))
+        self.assertEqual(stack.pop_many(2), ["cats", None])
+        self.assertEqual(stack.pop_many(1), [StackFrame])
+        stack.push_many((StackFrame, 2))
+        stack.pop_frame()
+        self.assertEqual(stack.pop_many(3), [StackBottom, StackBottom, 1])
+        self.assertTrue(stack.is_empty())
+        stack.push_frame()
+        stack.pop_frame()
+        self.assertTrue(stack.is_empty())
+
+    def test_copy(self):
+        stack = Stack()
+        stack.push_many((1, StackFrame, 2))
+        stack_copy = stack.copy()
+        stack_copy_2 = stack.copy()
+        stack.push(3)
+        self.assertEqual(stack_copy.peak(), 2)
+        stack_copy.pop_frame()
+        self.assertEqual(stack.pop_many(4), [1, StackFrame, 2, 3])
+        self.assertEqual(stack_copy.pop_many(2), [StackBottom, 1])
+        self.assertEqual(stack_copy_2.pop_many(3), [1, StackFrame, 2])
+        stack_copy_2.push(4)
+        stack_copy_2.pop_frame()
+        self.assertTrue(stack_copy_2.is_empty())
+
+    def test_copy_owner_keeps_lists(self):
+        stack = Stack()
+        stack.push_many((1, StackFrame, 2))
+        items = stack._items
+        stack_copy = stack.copy()
+        stack_copy_2 = stack_copy.copy()
+        # the owner changes its lists in place and the copies get their own
+        stack.push(3)
+        stack.pop_frame()
+        self.assertIs(stack._items, items)
+        self.assertEqual(stack.pop_many(2), [StackBottom, 1])
+        self.assertEqual(stack_copy.pop_many(3), [1, StackFrame, 2])
+        self.assertEqual(stack_copy_2.pop_many(3), [1, StackFrame, 2])
+
+        stack.push_many((1, 2))
+        items = stack._items
+        stack_copy = stack.copy()
+        stack_copy.push(3)
+        stack.push(4)
+        self.assertIs(stack._items, items)
+        self.assertEqual(stack.pop_many(3), [1, 2, 4])
+        self.assertEqual(stack_copy.pop_many(3), [1, 2, 3])
+
+    def test_copy_clear(self):
+        stack = Stack()
+        stack.push_many((1, 2))
+        items = stack._items
+        stack_copy = stack.copy()
+        stack.clear()
+        stack.push(3)
+        self.assertEqual(stack_copy.pop_many(2), [1, 2])
+        self.assertEqual(stack.pop(), 3)
+
+    def test_copy_pickle(self):
+        stack = Stack()
+        stack.push_many((1, StackFrame, 2))
+        stack_copy = stack.copy()
+        for new_stack in (deepcopy(stack), pickle.loads(pickle.dumps(stack)), deepcopy(stack_copy)):
+            new_stack.push(3)
+            self.assertEqual(new_stack.pop_many(4), [1, StackFrame, 2, 3])
+            self.assertEqual(stack.peak(), 2)
+            self.assertEqual(stack_copy.peak(), 2)
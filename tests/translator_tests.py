@@ -3,11 +3,16 @@ Copyright 2021 Charles McMarrow
 """
 
 # built-in
+import os
+import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 # backrooms
 from tests import test_files
-from backrooms.translator import FileHandler, Handler, Handlers, StringHandler, TranslatorError, load_dir, translator
+from backrooms.rooms import DenseFloor, SparseFloor
+from backrooms.translator import FileHandler, Handler, Handlers, MmapFileHandler, SnapshotHandler, StringHandler, \
+    TranslatorError, load_dir, translator
 
 # test
 from . import test_files
@@ -51,6 +56,43 @@ class FileHandlerTests(unittest.TestCase):
 
         self.assertRaises(StopIteration, next, handler)
 
+    def test_file_handler_prefetch(self):
+        with ThreadPoolExecutor(1) as executor:
+            for name in ("test_file_handler.brs", "test_file_handler2", "heap_array.brs"):
+                handler = FileHandler(test_files.get_path(name))
+                handler.prefetch(executor)
+                self.assertEqual(list(handler), list(FileHandler(test_files.get_path(name))))
+                handler = MmapFileHandler(test_files.get_path(name))
+                handler.prefetch(executor)
+                self.assertEqual(list(handler), list(FileHandler(test_files.get_path(name))))
+
+    def test_mmap_file_handler(self):
+        for name in ("test_file_handler.brs", "test_file_handler2", "heap_array.brs", "hello.brs"):
+            handler = MmapFileHandler(test_files.get_path(name))
+            self.assertEqual(handler.get_name(), FileHandler(test_files.get_path(name)).get_name())
+            self.assertEqual(list(handler), list(FileHandler(test_files.get_path(name))))
+            handler.close()
+            self.assertFalse(handler.is_open())
+
+    def test_mmap_file_handler_line_ends(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "lines.brs")
+            for data, lines in ((b"", []),
+                                (b"\n", [""]),
+                                (b"/ab\r\n\n  /c", ["/ab", "", "  /c"]),
+                                (b"/ab\n/c\n", ["/ab", "/c"]),
+                                (b"/ab\r/cd\r\n", ["/ab", "/cd"]),
+                                (b"\r\r\n\n\r", ["", "", "", ""]),
+                                (b"/a\xc3\xa9\r", ["/a\u00e9"])):
+                with open(path, "wb") as file:
+                    file.write(data)
+                handler = MmapFileHandler(path)
+                self.assertEqual(list(handler), lines)
+                handler.close()
+                # files too small to map give the same lines
+                self.assertEqual(list(FileHandler(path)), lines)
+            self.assertRaises(TranslatorError, next, MmapFileHandler(os.path.join(temp_dir, "nope.brs")))
+
 
 _STRING_HANDLER_TEST_STRING = """TEST
 123
@@ -145,6 +187,19 @@ class TestHandlers(unittest.TestCase):
         self.assertRaises(StopIteration, next, iter(handlers))
         self.assertFalse(bool(handlers))
 
+    def test_handlers_included(self):
+        main = StringHandler("Main", "")
+        first = StringHandler("123", "$")
+        second = StringHandler("123", "%")
+        handlers = Handlers(main, ((StringHandler("12", ""), first), (second,)))
+        self.assertIs(handlers.get_main(), main)
+        self.assertIs(handlers.find_include("123"), first)
+        self.assertIsNone(handlers.find_include("1234"))
+        self.assertEqual(handlers.get_included(), ())
+        handlers.include("123")
+        handlers.include("123")
+        self.assertEqual(handlers.get_included(), (first,))
+
     def test_handlers_empty_handler(self):
         handlers = Handlers(StringHandler("Main", ""),
                             ((StringHandler("12", ""), StringHandler("123", "$$\n55")),
@@ -606,6 +661,65 @@ class TranslatorTest(unittest.TestCase):
                                           "      2384095 *(*&)"))
         self.assertRaises(TranslatorError, translator, handlers)
 
+    def test_bad_row(self):
+        for row in ("/ab\tc", "/ab\u00e9", "/\x00", "/\x7f"):
+            self.assertRaises(TranslatorError, translator, Handlers(StringHandler("Main", row)))
+        rooms = translator(Handlers(StringHandler("Main", " \t /a \"~")))
+        self.assertEqual(rooms.read(0, 0, 0), "a")
+        self.assertEqual(rooms.read(2, 0, 0), "\"")
+
+
+def _get_state(rooms):
+    return ({floor_level: sorted(rooms.get_floor(floor_level).get_cells()) for floor_level in rooms.get_floor_levels()},
+            rooms.get_floor_names(),
+            rooms.get_hallways())
+
+
+class SnapshotHandlerTests(unittest.TestCase):
+    LIB = """
+    %other
+    ~LIB
+    /1
+    /c
+    +lib_2
+    ~@
+    /2
+    =other lib_copy
+    """
+    OTHER = """
+    ~OTHER
+    /3
+    """
+
+    def _translate(self, handler_type, main, floor_type=SparseFloor):
+        return _get_state(translator(Handlers(StringHandler("main", main),
+                                              ((handler_type("lib", self.LIB),
+                                                handler_type("other", self.OTHER),
+                                                handler_type("lib_load", "!lib"),
+                                                handler_type("abs", "F5\n/9")),)),
+                                     floor_type))
+
+    def test_snapshot(self):
+        for floor_type in (SparseFloor, DenseFloor):
+            self.assertIsNotNone(SnapshotHandler("lib", self.LIB).get_snapshot(floor_type))
+            for main in ("%lib\n/0", "%other\n%lib\n/0", "%lib_load\n%other\n=@ x\n/0", "%lib\n%abs\n"):
+                self.assertEqual(self._translate(SnapshotHandler, main, floor_type),
+                                 self._translate(StringHandler, main, floor_type))
+        self.assertIsNone(SnapshotHandler("abs", "F5\n/9").get_snapshot(SparseFloor))
+        self.assertIsNone(SnapshotHandler("own", "+own_2\n=own_2").get_snapshot(SparseFloor))
+
+    def test_snapshot_errors(self):
+        for main in ("%lib\n!lib", "%lib\n%lib_load", "%nope_lib"):
+            with self.assertRaises(TranslatorError):
+                self._translate(SnapshotHandler, main)
+        with self.assertRaises(TranslatorError):
+            translator(Handlers(SnapshotHandler("main", "%missing")))
+
+    def test_snapshot_covered_floor(self):
+        # main writes onto the floor lib starts at so lib is read line by line
+        main = "%lib\nFS-1\n/abc\nFS1"
+        self.assertEqual(self._translate(SnapshotHandler, main), self._translate(StringHandler, main))
+
 
 class LoadDirTest(unittest.TestCase):
     def test_load_dir(self):
@@ -616,3 +730,32 @@ class LoadDirTest(unittest.TestCase):
         self.assertNotEqual(len(handlers), 0)
         for handler in handlers:
             self.assertIsInstance(handler, Handler)
+
+    def _write_dir(self, temp_dir):
+        files = {"main.brs": "%lib\n/m", "lib.brs": "%lib_2\n/l", "lib_2.brs": "/2\n", "unused.brs": "/u"}
+        for name, data in files.items():
+            with open(os.path.join(temp_dir, name), "w") as file:
+                file.write(data)
+        return os.path.join(temp_dir, "main.brs")
+
+    def test_load_dir_lazy(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            main, handlers = load_dir(self._write_dir(temp_dir))
+            # files are only touched once they are included
+            os.remove(os.path.join(temp_dir, "unused.brs"))
+            rooms = translator(Handlers(main, (handlers,)))
+            self.assertEqual([rooms.read(0, 0, floor) for floor in (0, -1, -2)], ["m", "l", "2"])
+            main, handlers = load_dir(os.path.join(temp_dir, "main.brs"))
+            os.remove(os.path.join(temp_dir, "lib_2.brs"))
+            self.assertRaises(TranslatorError, translator, Handlers(main, (handlers,)))
+
+    def test_load_dir_prefetch(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            main, handlers = load_dir(self._write_dir(temp_dir))
+            expected = _get_state(translator(Handlers(main, (handlers,))))
+            with ThreadPoolExecutor(2) as executor:
+                main, handlers = load_dir(os.path.join(temp_dir, "main.brs"))
+                self.assertEqual(_get_state(translator(Handlers(main, (handlers,), executor))), expected)
+                main, handlers = load_dir(os.path.join(temp_dir, "main.brs"))
+                os.remove(os.path.join(temp_dir, "lib_2.brs"))
+                self.assertRaises(TranslatorError, translator, Handlers(main, (handlers,), executor))